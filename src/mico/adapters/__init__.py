@@ -1,6 +1,31 @@
-"""Adapters for system integration."""
+"""
+Adapters for system integration.
 
-from mico.adapters.system import SystemAdapter
+Adapters are loaded on first access, so importing a lightweight adapter
+(e.g. the daemon client) does not import psutil.
+"""
 
-__all__ = ["SystemAdapter"]
+import importlib
+from typing import Any
 
+_EXPORTS = {
+    "SystemAdapter": "mico.adapters.system",
+    "ISystemAdapter": "mico.adapters.system",
+    "ProcfsSystemAdapter": "mico.adapters.procfs",
+    "default_adapter": "mico.adapters.system",
+    "AsyncSystemAdapter": "mico.adapters.async_system",
+    "SyntheticSystemAdapter": "mico.adapters.synthetic",
+    "ReplayAdapter": "mico.adapters.recording",
+}
+
+__all__ = [
+    "SystemAdapter", "ProcfsSystemAdapter", "AsyncSystemAdapter", "SyntheticSystemAdapter",
+    "ReplayAdapter", "default_adapter",
+]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module), name)
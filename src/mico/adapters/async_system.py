@@ -0,0 +1,98 @@
+"""Async system adapter - ISystemAdapter for asyncio applications."""
+
+import asyncio
+import functools
+from concurrent.futures import Executor
+from typing import Any, AsyncIterator, Callable, List, Optional, Tuple, TypeVar
+import psutil
+from mico.adapters.system import SystemAdapter, build_system_metrics, default_adapter
+from mico.domain.entities import Process, ProcessSnapshot, SystemInfo, SystemMetrics
+from mico.domain.process_table import ProcessTable
+
+
+T = TypeVar("T")
+
+
+class AsyncSystemAdapter:
+    """
+    Adapter - Coroutine counterpart of ISystemAdapter.
+
+    Every blocking psutil call (the CPU sample, memory and disk stats, the
+    process walk) runs in an executor, so the event loop keeps serving
+    other tasks while mico collects. System metrics read CPU, memory,
+    disk and I/O rates concurrently, and ``collect`` gathers metrics and processes
+    together.
+    """
+
+    def __init__(
+        self, adapter: Optional[SystemAdapter] = None, executor: Optional[Executor] = None
+    ):
+        """
+        Args:
+            adapter: Synchronous adapter doing the collection (default:
+                default_adapter())
+            executor: Executor for blocking calls (default: the event
+                loop's default thread pool)
+        """
+        self.adapter = adapter if adapter is not None else default_adapter()
+        self.executor = executor
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(func, *args))
+
+    async def get_system_info(self) -> SystemInfo:
+        """Collects system information."""
+        return await self._run(self.adapter.get_system_info)
+
+    async def get_all_processes(self) -> List[Process]:
+        """Collects all system processes."""
+        return await self._run(self.adapter.get_all_processes)
+
+    async def get_process_snapshot(self) -> ProcessSnapshot:
+        """Collects all system processes in a single pass."""
+        return await self._run(self.adapter.get_process_snapshot)
+
+    async def iter_processes(self) -> AsyncIterator[Process]:
+        """
+        Yields system processes.
+
+        The process walk runs in one executor call rather than one per
+        process, and processes are yielded once it completes.
+        """
+        snapshot = await self.get_process_snapshot()
+        for process in snapshot.processes:
+            yield process
+
+    async def get_process_table(self) -> ProcessTable:
+        """Collects all system processes into a columnar ProcessTable."""
+        return await self._run(self.adapter.get_process_table)
+
+    async def get_system_metrics(self) -> SystemMetrics:
+        """
+        Collects extended system metrics for health checking.
+
+        The CPU sample, memory stats, disk probe and I/O rates are read
+        concurrently, so the call takes as long as the slowest of them.
+        The probe bounds its own wait on hung mounts.
+        """
+        io_sampler = self.adapter.io_sampler
+        cpu_percent, mem, disks, io = await asyncio.gather(
+            self._run(self.adapter.cpu_sampler.percent),
+            self._run(psutil.virtual_memory),
+            self._run(self.adapter.disk_probe.probe),
+            self._run(io_sampler.rates)
+        )
+        return build_system_metrics(cpu_percent, mem, disks, io)
+
+    async def collect(self) -> Tuple[SystemMetrics, ProcessSnapshot]:
+        """
+        Collects system metrics and processes concurrently.
+
+        Returns:
+            Tuple of (system metrics, process snapshot)
+        """
+        metrics, snapshot = await asyncio.gather(
+            self.get_system_metrics(), self.get_process_snapshot()
+        )
+        return metrics, snapshot
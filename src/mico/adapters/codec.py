@@ -0,0 +1,78 @@
+"""Codec - Converts domain entities to and from JSON-compatible dicts."""
+
+from dataclasses import asdict
+from typing import Any, Dict
+from mico.domain.anomaly import Anomaly
+from mico.domain.entities import MemoryInfo, Process, ProcessSnapshot, SystemInfo, SystemMetrics
+from mico.domain.metrics import DiskUsage, IOMetrics, IORate
+
+
+def process_to_dict(process: Process) -> Dict[str, Any]:
+    """Converts a Process to a dict."""
+    return asdict(process)
+
+
+def process_from_dict(data: Dict[str, Any]) -> Process:
+    """Builds a Process from a dict produced by process_to_dict."""
+    fields = dict(data)
+    fields["memory"] = MemoryInfo(**fields["memory"])
+    return Process(**fields)
+
+
+def snapshot_to_dict(snapshot: ProcessSnapshot) -> Dict[str, Any]:
+    """Converts a ProcessSnapshot to a dict."""
+    return {
+        "timestamp": snapshot.timestamp,
+        "memory_total_bytes": snapshot.memory_total_bytes,
+        "processes": [process_to_dict(p) for p in snapshot.processes],
+    }
+
+
+def snapshot_from_dict(data: Dict[str, Any]) -> ProcessSnapshot:
+    """Builds a ProcessSnapshot from a dict produced by snapshot_to_dict."""
+    return ProcessSnapshot(
+        timestamp=data["timestamp"],
+        processes=tuple(process_from_dict(p) for p in data["processes"]),
+        memory_total_bytes=data.get("memory_total_bytes", 0),
+    )
+
+
+def system_info_to_dict(system_info: SystemInfo) -> Dict[str, Any]:
+    """Converts a SystemInfo to a dict."""
+    return asdict(system_info)
+
+
+def system_info_from_dict(data: Dict[str, Any]) -> SystemInfo:
+    """Builds a SystemInfo from a dict produced by system_info_to_dict."""
+    return SystemInfo(memory=MemoryInfo(**data["memory"]))
+
+
+def metrics_to_dict(metrics: SystemMetrics) -> Dict[str, Any]:
+    """Converts a SystemMetrics to a dict."""
+    return asdict(metrics)
+
+
+def metrics_from_dict(data: Dict[str, Any]) -> SystemMetrics:
+    """Builds a SystemMetrics from a dict produced by metrics_to_dict."""
+    fields = dict(data)
+    fields["disks"] = tuple(DiskUsage(**disk) for disk in fields.get("disks", ()))
+    io = fields.get("io")
+    if io is not None:
+        fields["io"] = IOMetrics(
+            interval=io["interval"],
+            disk=IORate(**io["disk"]),
+            network=IORate(**io["network"]),
+            disks=tuple(IORate(**rate) for rate in io["disks"]),
+            interfaces=tuple(IORate(**rate) for rate in io["interfaces"])
+        )
+    return SystemMetrics(**fields)
+
+
+def anomaly_to_dict(anomaly: Anomaly) -> Dict[str, Any]:
+    """Converts an Anomaly to a dict."""
+    return asdict(anomaly)
+
+
+def anomaly_from_dict(data: Dict[str, Any]) -> Anomaly:
+    """Builds an Anomaly from a dict produced by anomaly_to_dict."""
+    return Anomaly(**data)
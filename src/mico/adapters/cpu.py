@@ -0,0 +1,212 @@
+"""CPU sampler - Non-blocking CPU utilisation readings."""
+
+import collections
+import threading
+import time
+import psutil
+from typing import Any, Deque, Dict, Optional, Set, Tuple
+
+
+# (monotonic timestamp, busy seconds, total seconds)
+CpuSample = Tuple[float, float, float]
+
+
+def read_cpu_times() -> Tuple[float, float]:
+    """
+    Reads the cumulative busy and total CPU seconds of the system.
+
+    Busy time excludes idle and iowait, and guest time is dropped on
+    Linux because it is already accounted for in user/nice. This matches
+    how psutil computes ``cpu_percent``.
+
+    Returns:
+        Tuple of (busy seconds, total seconds)
+    """
+    times = psutil.cpu_times()
+    total = sum(times)
+    total -= getattr(times, 'guest', 0.0) + getattr(times, 'guest_nice', 0.0)
+    idle = times.idle + getattr(times, 'iowait', 0.0)
+    return total - idle, total
+
+
+def utilisation(first: CpuSample, last: CpuSample) -> float:
+    """Returns the CPU percentage between two samples."""
+    total_delta = last[2] - first[2]
+    if total_delta <= 0:
+        return 0.0
+    busy_delta = last[1] - first[1]
+    return round(min(100.0, max(0.0, busy_delta / total_delta * 100)), 1)
+
+
+class CpuSampler:
+    """
+    Non-blocking CPU sampler.
+
+    The counters are primed when the sampler is created, and readings are
+    computed from deltas of cumulative CPU times instead of sleeping for a
+    fixed interval. When started, a background thread keeps a rolling
+    window of samples, so ``percent()`` answers from memory.
+
+    Without the background thread, a reading covers the time since the
+    previous reading. If less than ``min_interval`` seconds have passed,
+    the sampler sleeps only for the remainder.
+
+    ``accurate=True`` restores the blocking behaviour and samples for a
+    full ``window`` on every reading.
+    """
+
+    def __init__(
+        self,
+        window: float = 1.0,
+        resolution: float = 0.1,
+        min_interval: float = 0.1,
+        accurate: bool = False
+    ):
+        """
+        Args:
+            window: Length of the rolling window in seconds
+            resolution: Background sampling period in seconds
+            min_interval: Shortest delta used for a reading without samples
+            accurate: Block for a full window on every reading
+        """
+        if window <= 0:
+            raise ValueError("window must be positive")
+        if resolution <= 0:
+            raise ValueError("resolution must be positive")
+
+        self.window = window
+        self.resolution = resolution
+        self.min_interval = min_interval
+        self.accurate = accurate
+
+        self._samples: Deque[CpuSample] = collections.deque(
+            maxlen=max(2, int(window / resolution) + 1)
+        )
+        self._last: CpuSample = self._sample()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def _sample() -> CpuSample:
+        busy, total = read_cpu_times()
+        return time.monotonic(), busy, total
+
+    @property
+    def running(self) -> bool:
+        """True while the background thread is sampling."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> "CpuSampler":
+        """Starts the background sampling thread (idempotent)."""
+        if self.running:
+            return self
+        self._stop.clear()
+        with self._lock:
+            self._samples.append(self._last)
+        self._thread = threading.Thread(target=self._run, name="mico-cpu-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stops the background sampling thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.resolution):
+            sample = self._sample()
+            with self._lock:
+                self._samples.append(sample)
+
+    def percent(self) -> float:
+        """
+        Returns the current CPU utilisation percentage.
+
+        Returns:
+            CPU usage over the rolling window, or since the previous reading
+        """
+        if self.accurate:
+            return psutil.cpu_percent(interval=self.window)
+
+        with self._lock:
+            if self.running and len(self._samples) >= 2:
+                return utilisation(self._samples[0], self._samples[-1])
+
+        elapsed = time.monotonic() - self._last[0]
+        if elapsed < self.min_interval:
+            time.sleep(self.min_interval - elapsed)
+
+        sample = self._sample()
+        value = utilisation(self._last, sample)
+        self._last = sample
+        return value
+
+    def __enter__(self) -> "CpuSampler":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+class ProcessCpuTracker:
+    """
+    Per-process CPU percentages from deltas of cumulative CPU times.
+
+    Each process is remembered by PID with its create time, the time of
+    the reading and its user + system CPU seconds. The next reading of
+    the same process yields its CPU percentage over the time between
+    the two, so a whole process table costs one interval rather than one
+    per process. 100 means one full core, as in ``top``.
+
+    Readings are grouped into passes; processes not read during a pass
+    are forgotten when it ends.
+    """
+
+    def __init__(self, clock=time.monotonic):
+        """
+        Args:
+            clock: Monotonic clock, replaceable in tests
+        """
+        self.clock = clock
+        # pid -> (create time, reading time, cpu seconds)
+        self._last: Dict[int, Tuple[float, float, float]] = {}
+        self._seen: Set[int] = set()
+
+    def begin(self) -> None:
+        """Starts a pass over the process table."""
+        self._seen = set()
+
+    def update(self, pid: int, create_time: float, cpu_times: Any) -> Optional[float]:
+        """
+        Records a reading and returns the CPU percentage since the last one.
+
+        Args:
+            pid: Process ID
+            create_time: Process creation time, which tells reused PIDs apart
+            cpu_times: psutil cpu_times of the process
+
+        Returns:
+            CPU percentage, or None for the first reading of a process
+        """
+        now = self.clock()
+        seconds = cpu_times.user + cpu_times.system
+        previous = self._last.get(pid)
+        self._last[pid] = (create_time, now, seconds)
+        self._seen.add(pid)
+        if previous is None or previous[0] != create_time:
+            return None
+        elapsed = now - previous[1]
+        if elapsed <= 0:
+            return None
+        return round(max(0.0, (seconds - previous[2]) / elapsed * 100), 1)
+
+    def end(self) -> None:
+        """Ends a pass, forgetting processes that were not read during it."""
+        for pid in self._last.keys() - self._seen:
+            del self._last[pid]
+
+    def __len__(self) -> int:
+        return len(self._last)
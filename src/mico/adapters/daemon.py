@@ -0,0 +1,362 @@
+"""Daemon adapter - Serves warm snapshots over a local Unix domain socket."""
+
+import json
+import collections
+import os
+import socket
+import socketserver
+import stat
+import tempfile
+import threading
+from typing import Any, Deque, Dict, Iterator, List, Optional, Sequence
+from mico.adapters import codec
+from mico.domain.anomaly import Anomaly, AnomalyDetector
+from mico.domain.history import MetricsHistory
+from mico.domain.entities import Process, ProcessSnapshot, SystemInfo, SystemMetrics
+
+
+SOCKET_ENV = "MICO_SOCKET"
+
+
+def default_socket_path() -> str:
+    """
+    Returns the socket path used by the daemon and its clients.
+
+    Resolution order: the MICO_SOCKET environment variable, then
+    $XDG_RUNTIME_DIR/mico.sock, then mico.sock in a per-user directory of
+    the temp directory, which the daemon creates private (0700).
+    """
+    path = os.environ.get(SOCKET_ENV)
+    if path:
+        return path
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "mico.sock")
+    return os.path.join(private_socket_directory(), "mico.sock")
+
+
+def private_socket_directory() -> str:
+    """Per-user directory holding the socket when no runtime directory is set."""
+    return os.path.join(tempfile.gettempdir(), f"mico-{os.getuid()}")
+
+
+def _ensure_private_directory(path: str) -> None:
+    """
+    Creates a 0700 directory, or checks that an existing one is private.
+
+    Raises:
+        RuntimeError: If the directory is a symlink, belongs to another
+            user or is open to other users, as one created by another
+            user to intercept the socket would be
+    """
+    try:
+        os.mkdir(path, 0o700)
+    except FileExistsError:
+        pass
+    info = os.lstat(path)
+    if (
+        not stat.S_ISDIR(info.st_mode)
+        or info.st_uid != os.getuid()
+        or stat.S_IMODE(info.st_mode) & 0o077
+    ):
+        raise RuntimeError(f"{path} is not a private directory owned by this user")
+
+
+def trusted_socket(path: str) -> bool:
+    """True when path is a socket owned by this user, so its answers can be trusted."""
+    try:
+        info = os.lstat(path)
+    except OSError:
+        return False
+    return stat.S_ISSOCK(info.st_mode) and info.st_uid == os.getuid()
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Answers one newline-delimited JSON request per line."""
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                command = request.get("command")
+            except (ValueError, AttributeError):
+                request, command = None, None
+            self.wfile.write(self.server.daemon.response(command, request))
+            self.wfile.flush()
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: str, daemon: "DaemonServer"):
+        self.daemon = daemon
+        super().__init__(path, _RequestHandler)
+
+
+class DaemonServer:
+    """
+    Resident collector that keeps a warm snapshot in memory.
+
+    A refresh thread collects processes, system information and metrics
+    from the wrapped adapter every ``interval`` seconds. Each refresh is
+    serialised once, and requests are answered from those pre-encoded
+    responses. Every refresh also appends its metrics to a ring-buffer
+    history, which the "history" command summarises on request, and
+    checks them against an AnomalyDetector. The "anomalies" command
+    returns what the latest refresh flagged; the history summary lists
+    the anomalies inside its window.
+    """
+
+    COMMANDS = ("ping", "info", "snapshot", "metrics", "anomalies", "history")
+
+    def __init__(
+        self,
+        adapter: Any,
+        socket_path: Optional[str] = None,
+        interval: float = 2.0,
+        history_size: int = 3600,
+        detector: Optional[AnomalyDetector] = None
+    ):
+        """
+        Args:
+            adapter: ISystemAdapter used for collection
+            socket_path: Unix socket path (default: default_socket_path())
+            interval: Seconds between refreshes
+            history_size: Number of metrics samples kept in the history
+            detector: AnomalyDetector following the metrics (default: one
+                with the default baselines)
+        """
+        self.adapter = adapter
+        self.socket_path = socket_path or default_socket_path()
+        self.interval = interval
+        self.history = MetricsHistory(history_size)
+        self.detector = detector if detector is not None else AnomalyDetector()
+        # Anomalies are rare, so as many are kept as history samples
+        self.anomalies: Deque[Anomaly] = collections.deque(maxlen=history_size)
+        self._history_lock = threading.Lock()
+        self._latest = 0.0
+        self._responses: Dict[str, bytes] = {}
+        self._stop = threading.Event()
+        self._server: Optional[_UnixServer] = None
+        self._refresher: Optional[threading.Thread] = None
+
+    def refresh(self) -> None:
+        """Collects a new snapshot and swaps in its encoded responses."""
+        snapshot = self.adapter.get_process_snapshot()
+        system_info = self.adapter.get_system_info()
+        metrics = self.adapter.get_system_metrics()
+        with self._history_lock:
+            self.history.append(metrics, snapshot.timestamp)
+            anomalies = self.detector.update(metrics, snapshot.timestamp)
+            self.anomalies.extend(anomalies)
+            self._latest = snapshot.timestamp
+
+        responses = {
+            "ping": {"timestamp": snapshot.timestamp},
+            "info": codec.system_info_to_dict(system_info),
+            "snapshot": codec.snapshot_to_dict(snapshot),
+            "metrics": codec.metrics_to_dict(metrics),
+            "anomalies": [codec.anomaly_to_dict(anomaly) for anomaly in anomalies],
+        }
+        self._responses = {
+            command: _encode({"result": payload}) for command, payload in responses.items()
+        }
+
+    def response(self, command: Optional[str], request: Optional[Dict[str, Any]] = None) -> bytes:
+        """
+        Returns the encoded response line for a command.
+
+        Args:
+            command: Requested command
+            request: Full request, carrying parameters such as the history window
+        """
+        if command not in self.COMMANDS:
+            return _encode({"error": f"unknown command: {command}"})
+        if command == "history":
+            return self._history_response(request or {})
+        return self._responses.get(command) or _encode({"error": "no snapshot collected yet"})
+
+    def _history_response(self, request: Dict[str, Any]) -> bytes:
+        window = request.get("window")
+        percentiles = request.get("percentiles", (50, 95, 99))
+        try:
+            with self._history_lock:
+                summary = self.history.summary(window, percentiles)
+                anomalies = list(self.anomalies)
+        except (TypeError, ValueError) as exc:
+            return _encode({"error": f"invalid history request: {exc}"})
+        if window is not None and anomalies:
+            # Same window as the summary: it ends at the newest sample
+            start = self._latest - window
+            anomalies = [anomaly for anomaly in anomalies if anomaly.timestamp >= start]
+        summary["anomalies"] = [codec.anomaly_to_dict(anomaly) for anomaly in anomalies]
+        return _encode({"result": summary})
+
+    def start(self) -> "DaemonServer":
+        """Collects the first snapshot, binds the socket and starts serving."""
+        self.refresh()
+        directory = os.path.dirname(os.path.abspath(self.socket_path))
+        if directory == private_socket_directory():
+            _ensure_private_directory(directory)
+        self._remove_stale_socket()
+
+        # The socket is created 0600 rather than chmodded after bind, which
+        # would leave it open to other users in between
+        umask = os.umask(0o177)
+        try:
+            self._server = _UnixServer(self.socket_path, self)
+        finally:
+            os.umask(umask)
+        threading.Thread(
+            target=self._server.serve_forever, name="mico-daemon-server", daemon=True
+        ).start()
+
+        self._stop.clear()
+        self._refresher = threading.Thread(
+            target=self._refresh_loop, name="mico-daemon-refresh", daemon=True
+        )
+        self._refresher.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Blocks until interrupted, starting the daemon if needed."""
+        if self._server is None:
+            self.start()
+        try:
+            while not self._stop.wait(1.0):
+                pass
+        finally:
+            self.stop()
+
+    def stop(self) -> None:
+        """Stops serving and removes the socket file."""
+        self._stop.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._refresher is not None:
+            self._refresher.join()
+            self._refresher = None
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+    def _refresh_loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.refresh()
+            except Exception:
+                # Keep serving the previous snapshot if one refresh fails
+                continue
+
+    def _remove_stale_socket(self) -> None:
+        if not os.path.exists(self.socket_path):
+            return
+        if DaemonClient(self.socket_path).ping(timeout=0.2):
+            raise RuntimeError(f"A mico daemon is already listening on {self.socket_path}")
+        os.unlink(self.socket_path)
+
+
+class DaemonClient:
+    """Adapter - Implementation that answers from a running mico daemon."""
+
+    def __init__(self, socket_path: Optional[str] = None, timeout: float = 2.0):
+        """
+        Args:
+            socket_path: Unix socket path (default: default_socket_path())
+            timeout: Socket timeout in seconds
+        """
+        self.socket_path = socket_path or default_socket_path()
+        self.timeout = timeout
+
+    def _request(self, command: str, timeout: Optional[float] = None, **params: Any) -> Any:
+        if not trusted_socket(self.socket_path):
+            raise PermissionError(f"{self.socket_path} is not a socket owned by this user")
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(self.timeout if timeout is None else timeout)
+            sock.connect(self.socket_path)
+            sock.sendall(_encode({"command": command, **params}))
+            with sock.makefile("rb") as stream:
+                line = stream.readline()
+
+        if not line:
+            raise ConnectionError("mico daemon closed the connection")
+        reply = json.loads(line)
+        if "error" in reply:
+            raise RuntimeError(reply["error"])
+        return reply["result"]
+
+    def ping(self, timeout: Optional[float] = None) -> bool:
+        """Returns True if a daemon answers on the socket."""
+        try:
+            self._request("ping", timeout)
+        except (OSError, ValueError, RuntimeError):
+            return False
+        return True
+
+    def get_system_info(self) -> SystemInfo:
+        """Returns system information from the daemon."""
+        return codec.system_info_from_dict(self._request("info"))
+
+    def get_process_snapshot(self) -> ProcessSnapshot:
+        """Returns the daemon's latest process snapshot."""
+        return codec.snapshot_from_dict(self._request("snapshot"))
+
+    def get_all_processes(self) -> List[Process]:
+        """Returns all processes from the daemon's latest snapshot."""
+        return list(self.get_process_snapshot().processes)
+
+    def iter_processes(self) -> Iterator[Process]:
+        """Yields processes from the daemon's latest snapshot."""
+        return iter(self.get_process_snapshot().processes)
+
+    def get_system_metrics(self) -> SystemMetrics:
+        """Returns the daemon's latest system metrics."""
+        return codec.metrics_from_dict(self._request("metrics"))
+
+    def get_anomalies(self) -> List[Anomaly]:
+        """Returns the anomalies flagged by the daemon's latest refresh."""
+        return [codec.anomaly_from_dict(anomaly) for anomaly in self._request("anomalies")]
+
+    def get_history(
+        self,
+        window: Optional[float] = None,
+        percentiles: Sequence[float] = (50, 95, 99)
+    ) -> Dict[str, Any]:
+        """
+        Returns the daemon's metrics history summary.
+
+        Args:
+            window: Window length in seconds, or None for the whole history
+            percentiles: Percentiles to report
+
+        Returns:
+            MetricsHistory.summary() of the daemon's history, with the
+            anomalies flagged inside the window under "anomalies"
+        """
+        return self._request("history", window=window, percentiles=list(percentiles))
+
+
+def connect_daemon(
+    socket_path: Optional[str] = None, timeout: float = 0.5
+) -> Optional[DaemonClient]:
+    """
+    Returns a client for a running daemon, or None if none is listening.
+
+    A socket owned by another user is ignored, so a socket planted at the
+    path cannot feed the client made-up data.
+
+    Args:
+        socket_path: Unix socket path (default: default_socket_path())
+        timeout: Seconds to wait for the daemon to answer
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    client = DaemonClient(socket_path)
+    if not trusted_socket(client.socket_path) or not client.ping(timeout):
+        return None
+    return client
+
+
+def _encode(payload: Dict[str, Any]) -> bytes:
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8") + b"\n"
@@ -0,0 +1,155 @@
+"""Disk adapter - Usage of every relevant volume, with bounded stat calls."""
+
+import fnmatch
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+import psutil
+from mico.domain.metrics import DiskUsage
+
+
+GB = 1024 ** 3
+
+# Read-only images that always report 100% used
+IMAGE_FSTYPES = frozenset({"squashfs", "iso9660", "cdfs", "udf"})
+
+
+class DiskProbe:
+    """
+    Reads the usage of mounted volumes without letting one of them hang.
+
+    Each mount is stat'ed on its own daemon thread and all of them are
+    waited on against a single deadline, so a probe costs at most
+    ``timeout`` seconds however many volumes there are. A mount that
+    misses the deadline is reported as not responding. Its stat is left
+    running and reused by the next probe rather than started again, so
+    a hung NFS or SMB mount holds one thread, not one per refresh.
+    Results are cached for ``max_age`` seconds.
+
+    By default every physical, writable volume is checked ("/" always
+    is), skipping read-only images such as squashfs snaps and bind
+    mounts of a device already checked.
+    """
+
+    def __init__(
+        self,
+        include: Sequence[str] = (),
+        exclude: Sequence[str] = (),
+        timeout: float = 1.0,
+        max_age: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+        partitions: Callable[[], List] = psutil.disk_partitions,
+        usage: Callable[[str], object] = psutil.disk_usage
+    ):
+        """
+        Args:
+            include: Mount point glob patterns to check instead of the
+                default selection
+            exclude: Mount point glob patterns to skip
+            timeout: Seconds to wait for the stat calls
+            max_age: Seconds a probe result is reused
+            clock: Monotonic clock, replaceable in tests
+            partitions: Lists partitions (psutil.disk_partitions), replaceable in tests
+            usage: Reads the usage of a mount point (psutil.disk_usage), replaceable in tests
+        """
+        self.include = tuple(include)
+        self.exclude = tuple(exclude)
+        self.timeout = timeout
+        self.max_age = max_age
+        self.clock = clock
+        self.partitions = partitions
+        self.usage = usage
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Future] = {}
+        self._cached: Optional[Tuple[DiskUsage, ...]] = None
+        self._cached_at = 0.0
+
+    def mountpoints(self) -> List[Tuple[str, str]]:
+        """
+        Returns the volumes to check.
+
+        Returns:
+            (mount point, filesystem type) pairs
+        """
+        selected = []
+        devices = set()
+        for partition in self.partitions():
+            mountpoint = partition.mountpoint
+            if self.include:
+                if not _matches(mountpoint, self.include):
+                    continue
+            elif not self._relevant(partition) or partition.device in devices:
+                continue
+            if _matches(mountpoint, self.exclude):
+                continue
+            devices.add(partition.device)
+            selected.append((mountpoint, partition.fstype))
+
+        if not selected and not self.include and not _matches("/", self.exclude):
+            # Containers often mount "/" from a virtual filesystem
+            selected.append(("/", ""))
+        return selected
+
+    @staticmethod
+    def _relevant(partition) -> bool:
+        if partition.fstype in IMAGE_FSTYPES:
+            return False
+        read_only = "ro" in partition.opts.split(",")
+        return not read_only or partition.mountpoint == "/"
+
+    def probe(self) -> Tuple[DiskUsage, ...]:
+        """
+        Returns the usage of every volume checked.
+
+        Returns:
+            DiskUsage per volume, in mount order
+        """
+        now = self.clock()
+        if self._cached is not None and now - self._cached_at < self.max_age:
+            return self._cached
+
+        stats = [
+            (mountpoint, fstype, self._stat(mountpoint))
+            for mountpoint, fstype in self.mountpoints()
+        ]
+        deadline = time.monotonic() + self.timeout
+        disks = []
+        for mountpoint, fstype, future in stats:
+            try:
+                usage = future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except (FutureTimeoutError, OSError):
+                disks.append(DiskUsage(mountpoint, fstype, responding=False))
+                continue
+            disks.append(DiskUsage(
+                mountpoint,
+                fstype,
+                total_gb=usage.total / GB,
+                used_gb=usage.used / GB,
+                percent=usage.percent
+            ))
+
+        self._cached = tuple(disks)
+        self._cached_at = self.clock()
+        return self._cached
+
+    def _stat(self, mountpoint: str) -> Future:
+        with self._lock:
+            future = self._pending.get(mountpoint)
+            if future is not None and not future.done():
+                return future
+            future = self._pending[mountpoint] = Future()
+
+        def run() -> None:
+            try:
+                future.set_result(self.usage(mountpoint))
+            except BaseException as exc:
+                future.set_exception(exc)
+
+        # Daemon threads, so a hung mount never blocks interpreter exit
+        threading.Thread(target=run, name="mico-disk-stat", daemon=True).start()
+        return future
+
+
+def _matches(mountpoint: str, patterns: Sequence[str]) -> bool:
+    return any(fnmatch.fnmatchcase(mountpoint, pattern) for pattern in patterns)
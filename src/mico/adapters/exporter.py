@@ -0,0 +1,259 @@
+"""Exporter adapter - Serves metrics to Prometheus in the OpenMetrics format."""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from mico.domain.entities import Process, SystemMetrics
+from mico.domain.use_cases.calculate_health import CalculateSystemHealthUseCase
+from mico.domain.use_cases.list_processes import ListProcessesUseCase
+
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+HEALTH_STATES = ("healthy", "warning", "critical")
+GB = 1024 ** 3
+
+
+def _escape(value: str) -> str:
+    """Escapes a label value as OpenMetrics requires."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def _family(
+    lines: List[str],
+    name: str,
+    kind: str,
+    help_text: str,
+    samples: Sequence[Tuple[Dict[str, str], float]],
+    unit: Optional[str] = None
+) -> None:
+    lines.append(f"# TYPE {name} {kind}")
+    if unit:
+        lines.append(f"# UNIT {name} {unit}")
+    lines.append(f"# HELP {name} {help_text}")
+    for labels, value in samples:
+        lines.append(f"{name}{_labels(labels)} {value!r}")
+
+
+def render_openmetrics(
+    metrics: SystemMetrics,
+    health: Dict[str, Any],
+    processes: Sequence[Process],
+    duration: float
+) -> str:
+    """
+    Renders one collection as OpenMetrics exposition text.
+
+    Args:
+        metrics: System metrics
+        health: Result of CalculateSystemHealthUseCase.execute
+        processes: Processes to publish RSS for
+        duration: Seconds the collection took
+
+    Returns:
+        Exposition text, terminated by ``# EOF``
+    """
+    lines: List[str] = []
+    _family(lines, "mico_cpu_usage_percent", "gauge", "CPU usage percentage.",
+            [({}, float(metrics.cpu_percent))])
+    _family(lines, "mico_memory_usage_percent", "gauge", "Memory usage percentage.",
+            [({}, float(metrics.memory_percent))])
+    _family(lines, "mico_memory_total_bytes", "gauge", "Total memory.",
+            [({}, float(metrics.memory_total_gb * GB))], unit="bytes")
+    _family(lines, "mico_memory_used_bytes", "gauge", "Used memory.",
+            [({}, float(metrics.memory_used_gb * GB))], unit="bytes")
+    _family(lines, "mico_disk_usage_percent", "gauge", "Disk usage percentage.",
+            [({}, float(metrics.disk_percent))])
+    _family(lines, "mico_disk_total_bytes", "gauge", "Total disk space.",
+            [({}, float(metrics.disk_total_gb * GB))], unit="bytes")
+    _family(lines, "mico_disk_used_bytes", "gauge", "Used disk space.",
+            [({}, float(metrics.disk_used_gb * GB))], unit="bytes")
+    if metrics.disks:
+        _family(lines, "mico_volume_usage_percent", "gauge",
+                "Usage percentage of each volume checked.", [
+                    ({"mountpoint": disk.mountpoint, "fstype": disk.fstype}, float(disk.percent))
+                    for disk in metrics.disks if disk.responding
+                ])
+        _family(lines, "mico_volume_responding", "gauge", "Whether each volume answered in time.", [
+            ({"mountpoint": disk.mountpoint}, float(disk.responding)) for disk in metrics.disks
+        ])
+
+    if metrics.io is not None:
+        _family(lines, "mico_disk_io_bytes_per_second", "gauge",
+                "Bytes read and written per second by each disk.", [
+                    ({"device": disk.name, "direction": direction}, float(value))
+                    for disk in metrics.io.disks
+                    for direction, value in (
+                        ("read", disk.read_bytes_per_sec), ("write", disk.write_bytes_per_sec)
+                    )
+                ])
+        _family(lines, "mico_disk_io_busy_percent", "gauge", "Share of time each disk was busy.", [
+            ({"device": disk.name}, float(disk.busy_percent))
+            for disk in metrics.io.disks if disk.busy_percent is not None
+        ])
+        _family(lines, "mico_network_bytes_per_second", "gauge",
+                "Bytes received and sent per second by each interface.", [
+                    ({"interface": nic.name, "direction": direction}, float(value))
+                    for nic in metrics.io.interfaces
+                    for direction, value in (
+                        ("receive", nic.read_bytes_per_sec), ("transmit", nic.write_bytes_per_sec)
+                    )
+                ])
+        _family(lines, "mico_network_utilisation_percent", "gauge",
+                "Link utilisation of each interface.", [
+                    ({"interface": nic.name}, float(nic.busy_percent))
+                    for nic in metrics.io.interfaces if nic.busy_percent is not None
+                ])
+
+    scores = [({"component": "overall"}, float(health["overall_score"]))]
+    scores.extend(({"component": name}, float(score)) for name, score in health["scores"].items())
+    _family(lines, "mico_health_score", "gauge", "Health score from 0 to 100.", scores)
+    _family(lines, "mico_health_status", "stateset", "Overall health status.", [
+        ({"mico_health_status": state}, float(health["status"] == state)) for state in HEALTH_STATES
+    ])
+
+    _family(lines, "mico_process_resident_memory_bytes", "gauge",
+            "Resident memory of the top processes by RSS.", [
+                ({"pid": str(p.pid), "name": p.name, "user": p.username or ""},
+                 float(p.memory.rss_bytes or 0))
+                for p in processes
+            ], unit="bytes")
+    _family(lines, "mico_collection_duration_seconds", "gauge",
+            "Time the last collection took.", [({}, duration)], unit="seconds")
+
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+class MetricsExporter:
+    """
+    Caches the exposition of one collection for concurrent scrapes.
+
+    A collection reads system metrics, scores them and selects the top
+    processes by RSS, then renders and encodes the exposition once. Every
+    scrape within ``max_age`` seconds gets those same bytes. Scrapes that
+    arrive while a collection is running wait for it instead of starting
+    their own.
+    """
+
+    def __init__(
+        self,
+        adapter: Any,
+        max_age: float = 5.0,
+        top_n: int = 10,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            adapter: ISystemAdapter used for collection
+            max_age: Seconds a collection is served before a new one is made
+            top_n: Number of processes published
+            clock: Monotonic clock, replaceable in tests
+        """
+        self.adapter = adapter
+        self.max_age = max_age
+        self.top_n = top_n
+        self.clock = clock
+        self.collections = 0
+        self._lock = threading.Lock()
+        self._body: Optional[bytes] = None
+        self._collected_at = 0.0
+
+    def exposition(self) -> bytes:
+        """
+        Returns the encoded exposition, collecting again if it is too old.
+
+        Returns:
+            UTF-8 exposition text
+        """
+        with self._lock:
+            if self._body is None or self.clock() - self._collected_at >= self.max_age:
+                self._body = self._collect()
+                self._collected_at = self.clock()
+            return self._body
+
+    def _collect(self) -> bytes:
+        started = time.perf_counter()
+        metrics = self.adapter.get_system_metrics()
+        health = CalculateSystemHealthUseCase.execute(metrics)
+        processes = ListProcessesUseCase.execute(
+            self.adapter.iter_processes(), sort_by="mem", reverse=True, top_n=self.top_n
+        )
+        self.collections += 1
+        text = render_openmetrics(metrics, health, processes, time.perf_counter() - started)
+        return text.encode("utf-8")
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """Serves /metrics from the exporter cache."""
+
+    def do_GET(self) -> None:
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404, "Metrics are served at /metrics")
+            return
+        try:
+            body = self.server.exporter.exposition()
+        except Exception as exc:
+            self.send_error(500, f"Collection failed: {exc}")
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # Scrapes arrive every few seconds; keep the terminal quiet
+        pass
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], exporter: MetricsExporter):
+        self.exporter = exporter
+        super().__init__(address, _RequestHandler)
+
+
+class ExporterServer:
+    """HTTP server publishing a MetricsExporter at /metrics."""
+
+    def __init__(self, exporter: MetricsExporter, host: str = "127.0.0.1", port: int = 9721):
+        """
+        Args:
+            exporter: Exporter answering scrapes
+            host: Address to bind
+            port: Port to bind (0 picks a free port)
+        """
+        self.exporter = exporter
+        self.host = host
+        self.port = port
+        self._server: Optional[_HTTPServer] = None
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """The bound (host, port), once started."""
+        if self._server is None:
+            return (self.host, self.port)
+        return self._server.server_address[:2]
+
+    def start(self) -> "ExporterServer":
+        """Binds the port and serves requests in a background thread."""
+        self._server = _HTTPServer((self.host, self.port), self.exporter)
+        threading.Thread(
+            target=self._server.serve_forever, name="mico-exporter", daemon=True
+        ).start()
+        return self
+
+    def stop(self) -> None:
+        """Stops serving and releases the port."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
@@ -0,0 +1,251 @@
+"""Fleet adapter - Per-host snapshot dumps and their parallel aggregation.
+
+A dump is one JSON document per host, optionally gzip-compressed
+(``.json.gz``):
+
+    {"mico_dump": 1, "host": ..., "timestamp": ...,
+     "metrics": <metrics_to_dict>, "snapshot": <snapshot_to_dict>}
+"""
+
+import gzip
+import json
+import os
+import socket
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Any, Dict, IO, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+from mico.adapters.codec import (
+    metrics_from_dict, metrics_to_dict, snapshot_from_dict, snapshot_to_dict
+)
+from mico.domain.entities import ProcessSnapshot, SystemMetrics
+from mico.domain.fleet import FleetProcess, FleetReport, HostHealth, rank_processes
+
+
+DUMP_VERSION = 1
+DUMP_SUFFIXES = (".json", ".json.gz")
+
+# SystemMetrics fields health scoring needs as numbers
+NUMERIC_METRICS = (
+    "cpu_percent", "memory_percent", "disk_percent",
+    "memory_total_gb", "memory_used_gb", "disk_total_gb", "disk_used_gb",
+)
+
+# What a worker sends back for one dump: (path, host health, top processes)
+HostSummary = Tuple[str, HostHealth, List[FleetProcess]]
+
+
+class DumpError(ValueError):
+    """Raised when a file is not a valid mico dump."""
+
+
+def dump_document(
+    snapshot: ProcessSnapshot,
+    metrics: SystemMetrics,
+    host: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Builds the dump of one host.
+
+    Args:
+        snapshot: Processes of the host
+        metrics: System metrics of the host
+        host: Host name (default: this host's name)
+
+    Returns:
+        JSON-compatible dump document
+    """
+    return {
+        "mico_dump": DUMP_VERSION,
+        "host": host or socket.gethostname(),
+        "timestamp": snapshot.timestamp,
+        "metrics": metrics_to_dict(metrics),
+        "snapshot": snapshot_to_dict(snapshot),
+    }
+
+
+def _open(path: str, mode: str) -> IO:
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def write_dump(path: str, document: Dict[str, Any]) -> None:
+    """Writes a dump document, gzip-compressed when the path ends in .gz."""
+    with _open(path, "w") as f:
+        json.dump(document, f, separators=(",", ":"))
+
+
+def read_dump(path: str) -> Tuple[str, ProcessSnapshot, SystemMetrics]:
+    """
+    Reads a dump.
+
+    Args:
+        path: Dump file (.json or .json.gz)
+
+    Returns:
+        Tuple of (host, snapshot, metrics)
+
+    Raises:
+        DumpError: If the file is not a readable dump
+    """
+    try:
+        with _open(path, "r") as f:
+            document = json.load(f)
+    except (OSError, EOFError, UnicodeDecodeError, ValueError) as exc:
+        raise DumpError(f"{path}: {exc}") from None
+    if not isinstance(document, dict) or not isinstance(document.get("mico_dump"), int):
+        raise DumpError(f"{path}: not a mico dump")
+    if document["mico_dump"] > DUMP_VERSION:
+        raise DumpError(f"{path}: unsupported dump version {document['mico_dump']}")
+    try:
+        host = str(document["host"])
+        snapshot = snapshot_from_dict(document["snapshot"])
+        metrics = metrics_from_dict(document["metrics"])
+    except (KeyError, TypeError, ValueError, AttributeError) as exc:
+        raise DumpError(f"{path}: malformed dump ({exc!r})") from None
+    _check(path, snapshot, metrics)
+    return host, snapshot, metrics
+
+
+def _number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _check(path: str, snapshot: ProcessSnapshot, metrics: SystemMetrics) -> None:
+    """Checks the decoded fields the fleet summary relies on."""
+    for field in NUMERIC_METRICS:
+        if not _number(getattr(metrics, field)):
+            raise DumpError(f"{path}: malformed dump (metrics.{field} is not a number)")
+    if not _number(snapshot.timestamp):
+        raise DumpError(f"{path}: malformed dump (snapshot timestamp is not a number)")
+    for process in snapshot.processes:
+        if not isinstance(process.pid, int) or not isinstance(process.name, str):
+            raise DumpError(f"{path}: malformed dump (process {process.pid!r} lacks a PID or name)")
+
+
+def summarize_dump(path: str, sort: str = "mem", top_n: int = 10) -> HostSummary:
+    """
+    Reads one dump and reduces it to the host's health and top processes.
+
+    Runs in the worker processes of ``summarize_fleet``, so only the
+    summary, not the host's full process list, travels back.
+
+    Raises:
+        DumpError: If the file is not a readable dump, or its content
+            cannot be scored
+    """
+    from mico.domain.use_cases.calculate_health import CalculateSystemHealthUseCase
+
+    host, snapshot, metrics = read_dump(path)
+    try:
+        health = CalculateSystemHealthUseCase.execute(metrics)
+        processes = rank_processes(host, snapshot.processes, sort, top_n)
+    except (TypeError, ValueError, AttributeError) as exc:
+        # Fields the checks in read_dump let through, e.g. in the I/O rates
+        raise DumpError(f"{path}: malformed dump ({exc!r})") from None
+    return path, HostHealth(
+        host=host,
+        timestamp=snapshot.timestamp,
+        overall_score=health["overall_score"],
+        status=health["status"],
+        cpu_percent=metrics.cpu_percent,
+        memory_percent=metrics.memory_percent,
+        disk_percent=metrics.disk_percent,
+        process_count=len(snapshot.processes),
+        warnings=tuple(health["warnings"])
+    ), processes
+
+
+def iter_dump_paths(directory: str) -> Iterator[str]:
+    """Yields the dump files of a directory (not recursive), in name order."""
+    with os.scandir(directory) as entries:
+        names = sorted(
+            entry.name for entry in entries
+            if entry.name.endswith(DUMP_SUFFIXES) and entry.is_file()
+        )
+    for name in names:
+        yield os.path.join(directory, name)
+
+
+def _summaries(
+    paths: Iterable[str],
+    sort: str,
+    top_n: int,
+    workers: int
+) -> Iterator[Tuple[str, Optional[HostSummary], Optional[str]]]:
+    """Yields (path, summary, error) per dump, parsing them in a process pool."""
+    if workers <= 1:
+        for path in paths:
+            try:
+                yield path, summarize_dump(path, sort, top_n), None
+            except DumpError as exc:
+                yield path, None, str(exc)
+        return
+
+    # Submissions are capped so the futures and results in flight stay
+    # bounded by the pool size, not the number of dumps
+    limit = workers * 4
+    pending: Set[Future] = set()
+    sources: Dict[Future, str] = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        paths = iter(paths)
+        exhausted = False
+        while pending or not exhausted:
+            while not exhausted and len(pending) < limit:
+                path = next(paths, None)
+                if path is None:
+                    exhausted = True
+                    break
+                future = executor.submit(summarize_dump, path, sort, top_n)
+                sources[future] = path
+                pending.add(future)
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                path = sources.pop(future)
+                try:
+                    yield path, future.result(), None
+                except DumpError as exc:
+                    yield path, None, str(exc)
+
+
+def summarize_fleet(
+    paths: Iterable[str],
+    sort: str = "mem",
+    top_processes: int = 10,
+    top_hosts: int = 20,
+    statuses: Sequence[str] = (),
+    workers: Optional[int] = None
+) -> FleetReport:
+    """
+    Aggregates many hosts' dumps into one FleetReport.
+
+    Dumps are parsed and scored in parallel by a pool of worker
+    processes, each sending back only the host's health and top
+    processes, which are merged into the bounded rankings as they
+    arrive. Unreadable dumps are recorded in the report's errors.
+
+    Args:
+        paths: Dump files
+        sort: Process ranking, "mem" (RSS) or "cpu"
+        top_processes: Number of processes ranked across the fleet
+        top_hosts: Number of least healthy hosts ranked
+        statuses: Only rank hosts with these statuses (default: all)
+        workers: Worker processes (default: one per CPU); 1 parses in
+            this process
+
+    Returns:
+        FleetReport of every host
+    """
+    report = FleetReport(
+        top_hosts=top_hosts, top_processes=top_processes, sort=sort, statuses=statuses
+    )
+    if workers is None:
+        workers = os.cpu_count() or 1
+    for path, summary, error in _summaries(paths, sort, top_processes, workers):
+        if summary is None:
+            report.add_error(path, error)
+        else:
+            report.add(summary[1], summary[2])
+    report.errors.sort()
+    return report
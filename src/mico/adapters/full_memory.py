@@ -0,0 +1,118 @@
+"""Full memory adapter - USS/PSS reads for a bounded set of processes."""
+
+import dataclasses
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+import psutil
+from mico.domain.entities import Process
+
+
+# (uss, pss) in bytes; PSS is None where the platform does not report it
+FullMemory = Tuple[Optional[int], Optional[int]]
+
+
+def read_full_memory(proc: psutil.Process) -> FullMemory:
+    """Reads the USS and PSS of one process through psutil."""
+    info = proc.memory_full_info()
+    return getattr(info, "uss", None), getattr(info, "pss", None)
+
+
+class FullMemoryReader:
+    """
+    Reads USS/PSS for chosen processes on a bounded thread pool.
+
+    ``memory_full_info`` walks the memory map of a process, which costs
+    far more than reading its RSS, so it is only meant for a handful of
+    candidates. Reads run on at most ``max_workers`` threads and are
+    cached per (pid, create_time) for ``max_age`` seconds: a refresh
+    loop re-reads a process only once its entry is stale, and a reused
+    PID never inherits the figures of the process it replaced.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_age: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+        read: Callable[[psutil.Process], FullMemory] = read_full_memory
+    ):
+        """
+        Args:
+            max_workers: Concurrent reads (default: CPU count, at most 8)
+            max_age: Seconds a read is reused for the same process
+            clock: Monotonic clock, replaceable in tests
+            read: Reads (uss, pss) of a psutil process, replaceable in tests
+        """
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
+        self.max_age = max_age
+        self.clock = clock
+        self.read = read
+        self.reads = 0
+        self._cache: Dict[Tuple[int, float], Tuple[float, FullMemory]] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def enrich(self, processes: Sequence[Process]) -> List[Process]:
+        """
+        Returns the processes with USS/PSS filled in.
+
+        Processes that exited or cannot be read are returned unchanged.
+
+        Args:
+            processes: Processes to read
+
+        Returns:
+            Processes in the same order
+        """
+        now = self.clock()
+        self._prune(now)
+        pids = [process.pid for process in processes]
+        if len(pids) <= 1:
+            results = [self._read(pid, now) for pid in pids]
+        else:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="mico-uss")
+            results = list(self._executor.map(self._read, pids, [now] * len(pids)))
+        return [_with_full_memory(p, full) for p, full in zip(processes, results)]
+
+    def _read(self, pid: int, now: float) -> Optional[FullMemory]:
+        try:
+            proc = psutil.Process(pid)
+            key = (pid, proc.create_time())
+            with self._lock:
+                cached = self._cache.get(key)
+            if cached is not None and now - cached[0] < self.max_age:
+                return cached[1]
+            full = self.read(proc)
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            return None
+        with self._lock:
+            self._cache[key] = (now, full)
+            self.reads += 1
+        return full
+
+    def _prune(self, now: float) -> None:
+        with self._lock:
+            stale = [
+                key for key, (read_at, _) in self._cache.items() if now - read_at >= self.max_age
+            ]
+            for key in stale:
+                del self._cache[key]
+
+    def close(self) -> None:
+        """Stops the worker threads."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+def _with_full_memory(process: Process, full: Optional[FullMemory]) -> Process:
+    if full is None:
+        return process
+    uss, pss = full
+    return dataclasses.replace(
+        process, memory=dataclasses.replace(process.memory, uss_bytes=uss, pss_bytes=pss)
+    )
@@ -0,0 +1,222 @@
+"""Incremental adapter - Refreshes a process table in place between ticks."""
+
+import dataclasses
+import time
+import psutil
+from typing import Any, Dict, Iterator, List, Optional
+from mico.adapters.cpu import CpuSampler
+from mico.adapters.system import SystemAdapter
+from mico.adapters.users import UsernameCache
+from mico.domain.entities import MemoryInfo, Process, ProcessSnapshot
+
+
+class _Entry:
+    """One tracked process: its psutil handle and last built Process."""
+
+    __slots__ = ("proc", "create_time", "process", "named_at")
+
+    def __init__(self, proc: psutil.Process, create_time: float, process: Process, named_at: float):
+        self.proc = proc
+        self.create_time = create_time
+        self.process = process
+        # When the name, owner and parent were last read
+        self.named_at = named_at
+
+
+class IncrementalSystemAdapter(SystemAdapter):
+    """
+    Adapter - SystemAdapter that refreshes processes incrementally.
+
+    Processes are tracked by (pid, create_time) across calls. On each
+    refresh, only the memory counters of known processes are read again,
+    and their Process object is rebuilt only if those counters changed.
+    Name, username and parent are read when a process first appears and
+    again every ``name_ttl`` seconds, since an exec or a setuid changes
+    them without changing the PID or create time. Processes that exited,
+    or whose PID was reused, are evicted. With per-process CPU tracking,
+    CPU usage covers the time between ticks.
+    """
+
+    def __init__(
+        self,
+        cpu_sampler: Optional[CpuSampler] = None,
+        usernames: bool = True,
+        username_cache: Optional[UsernameCache] = None,
+        process_cpu: bool = False,
+        disk_probe: Optional[Any] = None,
+        io_sampler: Optional[Any] = None,
+        name_ttl: float = 30.0
+    ):
+        """
+        Takes the arguments of SystemAdapter, plus:
+
+        Args:
+            name_ttl: Seconds after which the name, username and parent of
+                a tracked process are read again
+        """
+        super().__init__(
+            cpu_sampler, usernames, username_cache, process_cpu, disk_probe, io_sampler
+        )
+        self.name_ttl = name_ttl
+        self._track_attrs = list(dict.fromkeys(self.process_attrs + ['create_time']))
+        self._name_attrs = [
+            attr for attr in self.process_attrs if attr in ('name', 'ppid', 'uids', 'username')
+        ]
+        self._entries: Dict[int, _Entry] = {}
+        # Processes that could not be read, so they are not re-read every tick
+        self._skipped: Dict[int, psutil.Process] = {}
+        self.last_stats: Dict[str, int] = {"new": 0, "changed": 0, "unchanged": 0, "evicted": 0}
+
+    def get_process_snapshot(self) -> ProcessSnapshot:
+        """
+        Refreshes the tracked processes and returns them as a snapshot.
+
+        Returns:
+            ProcessSnapshot with the processes and the collection time
+        """
+        timestamp = time.time()
+        total_memory = psutil.virtual_memory().total
+        stats = {"new": 0, "changed": 0, "unchanged": 0, "evicted": 0}
+        if self.cpu_tracker is not None:
+            self.cpu_tracker.begin()
+
+        current_pids = psutil.pids()
+        gone = set(self._entries.keys() | self._skipped.keys()) - set(current_pids)
+        for pid in gone:
+            if self._entries.pop(pid, None) is not None:
+                stats["evicted"] += 1
+            self._skipped.pop(pid, None)
+
+        processes: List[Process] = []
+        for pid in current_pids:
+            entry = self._entries.get(pid)
+            if entry is not None:
+                process = self._update(entry, total_memory, timestamp, stats)
+                if process is None:
+                    del self._entries[pid]
+                    stats["evicted"] += 1
+                    entry = None
+                else:
+                    processes.append(process)
+            if entry is None:
+                if self._is_skipped(pid):
+                    continue
+                entry = self._track(pid, total_memory, timestamp)
+                if entry is None:
+                    self._skip(pid)
+                else:
+                    self._entries[pid] = entry
+                    processes.append(entry.process)
+                    stats["new"] += 1
+
+        if self.cpu_tracker is not None:
+            self.cpu_tracker.end()
+        self.last_stats = stats
+        return ProcessSnapshot(
+            timestamp=timestamp,
+            processes=tuple(processes),
+            memory_total_bytes=total_memory
+        )
+
+    def get_all_processes(self) -> List[Process]:
+        """Refreshes the tracked processes and returns them as a list."""
+        return list(self.get_process_snapshot().processes)
+
+    def iter_processes(self) -> Iterator[Process]:
+        """Refreshes the tracked processes and yields them."""
+        return iter(self.get_process_snapshot().processes)
+
+    def _is_skipped(self, pid: int) -> bool:
+        proc = self._skipped.get(pid)
+        if proc is None:
+            return False
+        try:
+            if proc.is_running():
+                return True
+        except psutil.Error:
+            pass
+        del self._skipped[pid]
+        return False
+
+    def _skip(self, pid: int) -> None:
+        try:
+            self._skipped[pid] = psutil.Process(pid)
+        except psutil.Error:
+            pass
+
+    def _update(
+        self, entry: _Entry, total_memory: int, timestamp: float, stats: Dict[str, int]
+    ) -> Optional[Process]:
+        """Re-reads the memory (and CPU) counters, and the name once stale."""
+        process = entry.process
+        cpu_percent = process.cpu_percent
+        names = None
+        rename = timestamp - entry.named_at >= self.name_ttl
+        try:
+            # is_running() compares create times, which catches PID reuse
+            if not entry.proc.is_running():
+                return None
+            if self.cpu_tracker is None and not rename:
+                memory_info = entry.proc.memory_info()
+            else:
+                with entry.proc.oneshot():
+                    memory_info = entry.proc.memory_info()
+                    if self.cpu_tracker is not None:
+                        cpu_times = entry.proc.cpu_times()
+                    if rename:
+                        names = entry.proc.as_dict(self._name_attrs, ad_value=None)
+                if self.cpu_tracker is not None:
+                    cpu_percent = self.cpu_tracker.update(
+                        entry.proc.pid, entry.create_time, cpu_times
+                    )
+        except (psutil.NoSuchProcess, psutil.ZombieProcess):
+            return None
+        except psutil.AccessDenied:
+            stats["unchanged"] += 1
+            return process
+
+        if names is not None:
+            entry.named_at = timestamp
+            renamed = dataclasses.replace(
+                process,
+                name=names['name'] or process.name,
+                username=self._username(names) or process.username,
+                ppid=process.ppid if names['ppid'] is None else names['ppid']
+            )
+            if renamed != process:
+                process = renamed
+
+        memory = process.memory
+        if (
+            process is entry.process
+            and memory_info.rss == memory.rss_bytes
+            and memory_info.vms == memory.vms_bytes
+            and cpu_percent == process.cpu_percent
+        ):
+            stats["unchanged"] += 1
+            return process
+
+        entry.process = dataclasses.replace(
+            process,
+            memory=MemoryInfo(
+                rss_bytes=memory_info.rss,
+                vms_bytes=memory_info.vms,
+                percent=(memory_info.rss / total_memory) * 100
+            ),
+            cpu_percent=cpu_percent
+        )
+        stats["changed"] += 1
+        return entry.process
+
+    def _track(self, pid: int, total_memory: int, timestamp: float) -> Optional[_Entry]:
+        """Reads a newly seen process in full."""
+        try:
+            proc = psutil.Process(pid)
+            proc.info = proc.as_dict(self._track_attrs, ad_value=None)
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            return None
+
+        process = self._build_process(proc, total_memory)
+        if process is None:
+            return None
+        return _Entry(proc, proc.info['create_time'] or 0.0, process, timestamp)
@@ -0,0 +1,187 @@
+"""I/O rates adapter - Disk and network throughput from counter deltas."""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+import psutil
+from mico.domain.metrics import IOMetrics, IORate
+
+
+# Virtual block devices: their I/O lands on a real disk, which is counted there
+VIRTUAL_DISK_PREFIXES = ("loop", "ram", "zram")
+
+# (monotonic timestamp, disk totals, counters per disk, counters per interface)
+IOSample = Tuple[float, Any, Dict[str, Any], Dict[str, Any]]
+
+
+class IORateSampler:
+    """
+    Disk and network throughput, measured without a fixed sleep.
+
+    Counters are primed when the sampler is created, and each reading
+    reports bytes and operations per second since the previous one, the
+    way CpuSampler does for CPU time. If less than ``min_interval``
+    seconds have passed, the sampler sleeps only for the remainder; a
+    sampler created alongside the CPU sampler has usually waited long
+    enough by the time it is read.
+
+    Disk busy percentages come from the time each device spent doing
+    I/O, which psutil reports on Linux and FreeBSD only; elsewhere they
+    are None. Link utilisation needs the interface speed, which virtual
+    interfaces do not report, so it is None for them. Loopback and
+    virtual block devices are left out, and so are devices that have
+    never done any I/O. A counter that goes backwards (a device was
+    reset) counts as no activity.
+    """
+
+    def __init__(
+        self,
+        min_interval: float = 0.1,
+        stats_max_age: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+        disk_counters: Callable[..., Any] = psutil.disk_io_counters,
+        net_counters: Callable[..., Any] = psutil.net_io_counters,
+        net_stats: Callable[[], Dict[str, Any]] = psutil.net_if_stats
+    ):
+        """
+        Args:
+            min_interval: Shortest interval a reading is measured over
+            stats_max_age: Seconds interface speeds and flags are reused
+            clock: Monotonic clock, replaceable in tests
+            disk_counters: Reads disk counters (psutil.disk_io_counters), replaceable in tests
+            net_counters: Reads interface counters (psutil.net_io_counters), replaceable in tests
+            net_stats: Reads interface speeds and flags (psutil.net_if_stats), replaceable in tests
+        """
+        self.min_interval = min_interval
+        self.stats_max_age = stats_max_age
+        self.clock = clock
+        self.disk_counters = disk_counters
+        self.net_counters = net_counters
+        self.net_stats = net_stats
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Any] = {}
+        self._stats_at: Optional[float] = None
+        self._last = self._sample()
+
+    def _sample(self) -> IOSample:
+        return (
+            self.clock(),
+            self.disk_counters(perdisk=False),
+            self.disk_counters(perdisk=True) or {},
+            self.net_counters(pernic=True) or {}
+        )
+
+    def _interface_stats(self) -> Dict[str, Any]:
+        now = self.clock()
+        if self._stats_at is None or now - self._stats_at >= self.stats_max_age:
+            try:
+                self._stats = self.net_stats()
+            except OSError:
+                self._stats = {}
+            self._stats_at = now
+        return self._stats
+
+    def rates(self) -> IOMetrics:
+        """
+        Returns disk and network rates since the previous reading.
+
+        Returns:
+            IOMetrics with totals and per-device rates
+        """
+        with self._lock:
+            elapsed = self.clock() - self._last[0]
+            if elapsed < self.min_interval:
+                time.sleep(self.min_interval - elapsed)
+            sample = self._sample()
+            previous, self._last = self._last, sample
+
+        interval = sample[0] - previous[0]
+        if interval <= 0:
+            interval = self.min_interval
+
+        disks = [
+            _disk_rate(name, previous[2][name], counters, interval)
+            for name, counters in sample[2].items()
+            if name in previous[2] and _relevant_disk(name, counters)
+        ]
+        busy = [disk.busy_percent for disk in disks if disk.busy_percent is not None]
+        if sample[1] is not None and previous[1] is not None:
+            disk_total = _disk_rate(
+                "total", previous[1], sample[1], interval, max(busy) if busy else None
+            )
+        else:
+            disk_total = IORate("total")
+
+        stats = self._interface_stats()
+        interfaces = [
+            _interface_rate(name, previous[3][name], counters, interval, stats.get(name))
+            for name, counters in sample[3].items()
+            if name in previous[3] and _relevant_interface(name, counters, stats.get(name))
+        ]
+        utilisation = [nic.busy_percent for nic in interfaces if nic.busy_percent is not None]
+        network_total = IORate(
+            "total",
+            read_bytes_per_sec=sum(nic.read_bytes_per_sec for nic in interfaces),
+            write_bytes_per_sec=sum(nic.write_bytes_per_sec for nic in interfaces),
+            read_ops_per_sec=sum(nic.read_ops_per_sec for nic in interfaces),
+            write_ops_per_sec=sum(nic.write_ops_per_sec for nic in interfaces),
+            busy_percent=max(utilisation) if utilisation else None
+        )
+
+        return IOMetrics(
+            interval=interval,
+            disk=disk_total,
+            network=network_total,
+            disks=tuple(disks),
+            interfaces=tuple(interfaces)
+        )
+
+
+def _delta(last: Any, first: Any, field: str) -> float:
+    return max(0, getattr(last, field) - getattr(first, field))
+
+
+def _disk_rate(
+    name: str, first: Any, last: Any, interval: float, busy: Optional[float] = None
+) -> IORate:
+    if busy is None and hasattr(last, "busy_time"):
+        busy = min(100.0, _delta(last, first, "busy_time") / (interval * 1000) * 100)
+    return IORate(
+        name,
+        read_bytes_per_sec=_delta(last, first, "read_bytes") / interval,
+        write_bytes_per_sec=_delta(last, first, "write_bytes") / interval,
+        read_ops_per_sec=_delta(last, first, "read_count") / interval,
+        write_ops_per_sec=_delta(last, first, "write_count") / interval,
+        busy_percent=busy
+    )
+
+
+def _interface_rate(name: str, first: Any, last: Any, interval: float, stats: Any) -> IORate:
+    received = _delta(last, first, "bytes_recv") / interval
+    sent = _delta(last, first, "bytes_sent") / interval
+    utilisation = None
+    speed = getattr(stats, "speed", 0)
+    if speed:
+        # Full duplex: each direction has the whole link speed (in Mbit/s)
+        utilisation = min(100.0, max(received, sent) * 8 / (speed * 1_000_000) * 100)
+    return IORate(
+        name,
+        read_bytes_per_sec=received,
+        write_bytes_per_sec=sent,
+        read_ops_per_sec=_delta(last, first, "packets_recv") / interval,
+        write_ops_per_sec=_delta(last, first, "packets_sent") / interval,
+        busy_percent=utilisation
+    )
+
+
+def _relevant_disk(name: str, counters: Any) -> bool:
+    if name.startswith(VIRTUAL_DISK_PREFIXES):
+        return False
+    return bool(counters.read_count or counters.write_count)
+
+
+def _relevant_interface(name: str, counters: Any, stats: Any) -> bool:
+    flags = getattr(stats, "flags", "").split(",")
+    if "loopback" in flags or name == "lo" or name.startswith("lo0"):
+        return False
+    return bool(counters.bytes_recv or counters.bytes_sent)
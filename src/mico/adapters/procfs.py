@@ -0,0 +1,225 @@
+"""Procfs adapter - Reads Linux processes straight from /proc."""
+
+import os
+import sys
+import time
+from collections import namedtuple
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple
+import psutil
+from mico.adapters.system import SystemAdapter
+from mico.domain.entities import MemoryInfo, Process
+
+if TYPE_CHECKING:
+    from mico.domain.process_table import ProcessTable
+
+
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+# Large enough for stat, statm and the head of status, where Uid: is;
+# cmdline has no size limit and is read in full
+BUFFER_SIZE = 4096
+
+# Shaped like psutil's cpu_times for ProcessCpuTracker
+CpuTimes = namedtuple("CpuTimes", "user system")
+
+# One parsed process: (pid, name, ppid, rss, vms, uid or None, create_time, cpu_times)
+ProcRow = Tuple[int, str, int, int, int, Optional[int], float, CpuTimes]
+
+
+class ProcfsSystemAdapter(SystemAdapter):
+    """
+    Adapter - SystemAdapter that parses /proc instead of going through psutil.
+
+    Process collection skips psutil's per-process objects and per-attribute
+    calls: /proc is listed with ``os.scandir``, and each process costs
+    three reads (``stat``, ``statm`` and, for the owner, ``status``) into
+    one buffer allocated per scan. Fields are taken the way psutil takes
+    them, so rows match SystemAdapter's, including names longer than 15
+    characters, which come from the command line. A process that exits
+    mid-scan is skipped. System metrics, USS/PSS and the rest are
+    inherited from SystemAdapter. Linux only; see ``available``.
+    """
+
+    def __init__(self, *args, procfs_path: Optional[str] = None, **kwargs):
+        """
+        Args:
+            procfs_path: Root of the proc filesystem (default: psutil.PROCFS_PATH)
+            *args, **kwargs: Passed to SystemAdapter
+        """
+        super().__init__(*args, **kwargs)
+        self.procfs_path = procfs_path or psutil.PROCFS_PATH
+        self._boot_time: Optional[float] = None
+
+    @staticmethod
+    def available(procfs_path: Optional[str] = None) -> bool:
+        """True when running on Linux with a readable proc filesystem."""
+        if not sys.platform.startswith("linux"):
+            return False
+        return os.path.isfile(os.path.join(procfs_path or psutil.PROCFS_PATH, "self", "statm"))
+
+    @property
+    def boot_time(self) -> float:
+        """System boot time, which process start times are relative to."""
+        if self._boot_time is None:
+            self._boot_time = psutil.boot_time()
+        return self._boot_time
+
+    def _pids(self) -> List[int]:
+        with os.scandir(self.procfs_path) as entries:
+            return sorted(int(entry.name) for entry in entries if entry.name.isdigit())
+
+    def _scan(self, owners: bool) -> Iterator[ProcRow]:
+        """Yields every readable process, skipping those that exit mid-scan."""
+        buffer = bytearray(BUFFER_SIZE)
+        root = self.procfs_path
+        for pid in self._pids():
+            base = f"{root}/{pid}/"
+            stat = _read(base + "stat", buffer)
+            if stat is None:
+                continue
+            statm = _read(base + "statm", buffer)
+            if statm is None:
+                continue
+            try:
+                rpar = stat.rfind(b")")
+                name = stat[stat.find(b"(") + 1:rpar]
+                fields = stat[rpar + 2:].split()
+                memory = statm.split()
+                vms = int(memory[0]) * PAGE_SIZE
+                rss = int(memory[1]) * PAGE_SIZE
+                ppid = int(fields[1])
+                cpu_times = CpuTimes(int(fields[11]) / CLOCK_TICKS, int(fields[12]) / CLOCK_TICKS)
+                create_time = int(fields[19]) / CLOCK_TICKS + self.boot_time
+            except (IndexError, ValueError):
+                continue
+
+            uid = None
+            if owners:
+                status = _read(base + "status", buffer)
+                uid = None if status is None else _real_uid(status)
+            yield pid, _name(base, os.fsdecode(name)), ppid, rss, vms, uid, create_time, cpu_times
+
+    def _owner(self, uid: Optional[int]) -> Optional[str]:
+        if uid is None or not self.usernames:
+            return None
+        return self.username_cache.resolve(uid)
+
+    def _process_cpu(self, pid: int, create_time: float, cpu_times: CpuTimes) -> Optional[float]:
+        if self.cpu_tracker is None:
+            return None
+        return self.cpu_tracker.update(pid, create_time, cpu_times)
+
+    def _iter_processes(self, total_memory: int) -> Iterator[Process]:
+        """Yields a Process for every readable process in /proc."""
+        if self.cpu_tracker is not None:
+            self.cpu_tracker.begin()
+        for pid, name, ppid, rss, vms, uid, create_time, cpu_times in self._scan(self.usernames):
+            yield Process(
+                pid=pid,
+                name=name or 'Unknown',
+                memory=MemoryInfo(rss_bytes=rss, vms_bytes=vms, percent=(rss / total_memory) * 100),
+                username=self._owner(uid),
+                ppid=ppid,
+                cpu_percent=self._process_cpu(pid, create_time, cpu_times)
+            )
+        if self.cpu_tracker is not None:
+            self.cpu_tracker.end()
+
+    def get_process_table(self) -> "ProcessTable":
+        """
+        Collects all processes in /proc into a columnar ProcessTable.
+
+        Returns:
+            ProcessTable with one row per readable process
+        """
+        from mico.domain.process_table import ProcessTable
+
+        table = ProcessTable(time.time())
+        total_memory = psutil.virtual_memory().total
+        if self.cpu_tracker is not None:
+            self.cpu_tracker.begin()
+        for pid, name, ppid, rss, vms, uid, create_time, cpu_times in self._scan(self.usernames):
+            table.append(
+                pid,
+                name or 'Unknown',
+                rss,
+                vms,
+                (rss / total_memory) * 100,
+                self._owner(uid),
+                ppid,
+                self._process_cpu(pid, create_time, cpu_times)
+            )
+        if self.cpu_tracker is not None:
+            self.cpu_tracker.end()
+        return table
+
+    def iter_rss(self) -> Iterator[Tuple[int, float, str, int]]:
+        """Yields (pid, create_time, name, rss_bytes) of every process in /proc."""
+        for pid, name, _, rss, _, _, create_time, _ in self._scan(owners=False):
+            yield pid, create_time, name or 'Unknown', rss
+
+    def prime_process_cpu(self) -> None:
+        """Takes the first CPU-times reading of every process in /proc."""
+        tracker = self.cpu_tracker
+        if tracker is None:
+            return
+        tracker.begin()
+        for pid, _, _, _, _, _, create_time, cpu_times in self._scan(owners=False):
+            tracker.update(pid, create_time, cpu_times)
+        tracker.end()
+
+
+def _read(path: str, buffer: bytearray) -> Optional[bytes]:
+    """Reads a small /proc file through a reusable buffer; None if it is gone or unreadable."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        size = os.readv(fd, [buffer])
+    except OSError:
+        # ESRCH when the process exits between open and read
+        return None
+    finally:
+        os.close(fd)
+    return bytes(memoryview(buffer)[:size])
+
+
+def _name(base: str, name: str) -> str:
+    """Extends a name truncated to 15 characters from the command line, as psutil does."""
+    if len(name) < 15:
+        return name
+    cmdline = _read_all(base + "cmdline")
+    if cmdline:
+        extended = os.path.basename(os.fsdecode(_argv0(cmdline)))
+        if extended.startswith(name):
+            return extended
+    return name
+
+
+def _read_all(path: str) -> Optional[bytes]:
+    """Reads a /proc file of any length; None if it is gone or unreadable."""
+    try:
+        with open(path, "rb", buffering=0) as f:
+            return f.readall()
+    except OSError:
+        return None
+
+
+def _real_uid(status: bytes) -> Optional[int]:
+    start = status.find(b"\nUid:")
+    if start < 0:
+        return None
+    fields = status[start + 5:status.find(b"\n", start + 5)].split()
+    return int(fields[0]) if fields else None
+
+
+def _argv0(cmdline: bytes) -> bytes:
+    """First command-line argument, split the way psutil splits it."""
+    if cmdline.endswith(b"\0"):
+        cmdline = cmdline[:-1]
+        if b"\0" in cmdline:
+            return cmdline.split(b"\0", 1)[0]
+    # Processes that rewrite their title often separate arguments with spaces
+    return cmdline.split(b" ", 1)[0]
@@ -0,0 +1,361 @@
+"""Recording adapter - Compact binary recordings of snapshots and metrics.
+
+A recording starts with a fixed header followed by a sequence of chunks.
+Every chunk is a 4-byte kind and a 4-byte payload length:
+
+    STRS  strings added to the string table, each a u16 length + UTF-8 bytes
+    TICK  one instant: timestamp, total memory, process count, system
+          memory, system metrics, then fixed-size process rows
+
+String ids are assigned in order of first appearance across the whole
+file, so each name or username is written once per recording rather than
+once per tick. Integers are little-endian; unknown floats are NaN, and
+unknown users and parent PIDs are -1.
+"""
+
+import math
+import mmap
+import struct
+from bisect import bisect_right
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
+from mico.domain.entities import MemoryInfo, Process, ProcessSnapshot, SystemInfo, SystemMetrics
+from mico.domain.process_table import ProcessTable
+
+
+MAGIC = b"MICOREC1"
+VERSION = 3
+
+# magic, version, reserved
+HEADER = struct.Struct("<8sHH4x")
+# kind, payload length
+CHUNK = struct.Struct("<4sI")
+# timestamp, memory total bytes, process count,
+# system memory: total/available/used/free GB and percent,
+# metrics: cpu/memory/disk percent, memory total/used GB, disk total/used GB
+TICK = struct.Struct("<dQI4x5d7d")
+# pid, rss, vms, memory percent, name id, user id, ppid, cpu percent
+ROW = struct.Struct("<qQQdiiqd")
+# Version 1 rows had no ppid, version 2 rows no cpu percent
+ROWS = {1: struct.Struct("<qQQdii"), 2: struct.Struct("<qQQdiiq"), 3: ROW}
+# Values read for the fields older rows lack
+ROW_PADDING = {1: (-1, math.nan), 2: (math.nan,), 3: ()}
+STRING_LENGTH = struct.Struct("<H")
+
+STRINGS_KIND = b"STRS"
+TICK_KIND = b"TICK"
+
+
+def _float(value: Optional[float]) -> float:
+    return math.nan if value is None else float(value)
+
+
+def _optional(value: float) -> Optional[float]:
+    return None if math.isnan(value) else value
+
+
+class RecordingError(ValueError):
+    """Raised when a file is not a valid mico recording."""
+
+
+class Recorder:
+    """
+    Appends ticks to a recording file.
+
+    Each tick is packed into a single preallocated buffer and written
+    with one call through a buffered file, so recording costs a few
+    struct packs per process rather than a JSON document per tick.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: File to create (an existing file is overwritten)
+        """
+        self.path = path
+        self.ticks = 0
+        self._file: BinaryIO = open(path, "wb")
+        self._file.write(HEADER.pack(MAGIC, VERSION, 0))
+        self._strings: Dict[str, int] = {}
+        self._buffer = bytearray()
+
+    def _intern(self, value: str, new: List[bytes]) -> int:
+        string_id = self._strings.get(value)
+        if string_id is None:
+            string_id = self._strings[value] = len(self._strings)
+            encoded = value.encode("utf-8")[:0xFFFF]
+            new.append(STRING_LENGTH.pack(len(encoded)) + encoded)
+        return string_id
+
+    def record(
+        self, snapshot: ProcessSnapshot, system_info: SystemInfo, metrics: SystemMetrics
+    ) -> None:
+        """
+        Appends one tick.
+
+        Args:
+            snapshot: Processes of the tick
+            system_info: System memory of the tick
+            metrics: System metrics of the tick
+        """
+        new_strings: List[bytes] = []
+        count = len(snapshot.processes)
+        size = CHUNK.size + TICK.size + count * ROW.size
+        if len(self._buffer) < size:
+            self._buffer = bytearray(size)
+        buffer = self._buffer
+
+        memory = system_info.memory
+        TICK.pack_into(
+            buffer, CHUNK.size,
+            snapshot.timestamp, snapshot.memory_total_bytes, count,
+            _float(memory.total_gb), _float(memory.available_gb), _float(memory.used_gb),
+            _float(memory.free_gb), _float(memory.percent),
+            metrics.cpu_percent, metrics.memory_percent, metrics.disk_percent,
+            metrics.memory_total_gb, metrics.memory_used_gb,
+            metrics.disk_total_gb, metrics.disk_used_gb
+        )
+
+        intern = self._intern
+        pack_row = ROW.pack_into
+        offset = CHUNK.size + TICK.size
+        for process in snapshot.processes:
+            memory = process.memory
+            pack_row(
+                buffer, offset,
+                process.pid, memory.rss_bytes or 0, memory.vms_bytes or 0, _float(memory.percent),
+                intern(process.name, new_strings),
+                -1 if process.username is None else intern(process.username, new_strings),
+                -1 if process.ppid is None else process.ppid,
+                _float(process.cpu_percent)
+            )
+            offset += ROW.size
+        CHUNK.pack_into(buffer, 0, TICK_KIND, size - CHUNK.size)
+
+        if new_strings:
+            strings = b"".join(new_strings)
+            self._file.write(CHUNK.pack(STRINGS_KIND, len(strings)) + strings)
+        self._file.write(memoryview(buffer)[:size])
+        self._file.flush()
+        self.ticks += 1
+
+    def close(self) -> None:
+        """Flushes and closes the file."""
+        self._file.close()
+
+    def __enter__(self) -> "Recorder":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class Recording:
+    """
+    Read-only, memory-mapped view of a recording.
+
+    Opening a recording walks the chunk headers once to index the ticks
+    and load the string table. Process rows are unpacked straight from
+    the mapping when a tick is read, without copying the file.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Recording file
+
+        Raises:
+            RecordingError: If the file is not a mico recording
+        """
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise RecordingError(f"{path} is empty")
+        self.strings: List[str] = []
+        # (offset of the tick header, process count) per tick
+        self._ticks: List[Tuple[int, int]] = []
+        self.timestamps: List[float] = []
+        try:
+            self._index()
+        except RecordingError:
+            self.close()
+            raise
+
+    def _index(self) -> None:
+        data = self._map
+        if len(data) < HEADER.size:
+            raise RecordingError(f"{self.path} is not a mico recording")
+        magic, version, _ = HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise RecordingError(f"{self.path} is not a mico recording")
+        if version not in ROWS:
+            raise RecordingError(f"Unsupported recording version {version}")
+        self._row = ROWS[version]
+        self._padding = ROW_PADDING[version]
+
+        offset = HEADER.size
+        end = len(data)
+        while offset + CHUNK.size <= end:
+            kind, length = CHUNK.unpack_from(data, offset)
+            start = offset + CHUNK.size
+            if start + length > end:
+                break  # a tick cut short by an interrupted recorder
+            if kind == STRINGS_KIND:
+                self._read_strings(start, start + length)
+            elif kind == TICK_KIND:
+                timestamp, _, count = TICK.unpack_from(data, start)[:3]
+                self._ticks.append((start, count))
+                self.timestamps.append(timestamp)
+            offset = start + length
+
+    def _read_strings(self, offset: int, end: int) -> None:
+        data = self._map
+        while offset < end:
+            (length,) = STRING_LENGTH.unpack_from(data, offset)
+            offset += STRING_LENGTH.size
+            self.strings.append(data[offset:offset + length].decode("utf-8", "replace"))
+            offset += length
+
+    def __len__(self) -> int:
+        return len(self._ticks)
+
+    def index_at(self, timestamp: float) -> int:
+        """
+        Returns the last tick recorded at or before a timestamp.
+
+        Args:
+            timestamp: Time in seconds since the epoch
+
+        Raises:
+            IndexError: If the timestamp precedes the recording
+        """
+        position = bisect_right(self.timestamps, timestamp) - 1
+        if position < 0:
+            raise IndexError("timestamp precedes the recording")
+        return position
+
+    def _tick(self, index: int) -> Tuple[int, tuple]:
+        offset, _ = self._ticks[index]
+        return offset, TICK.unpack_from(self._map, offset)
+
+    def system_info(self, index: int) -> SystemInfo:
+        """Returns the system memory recorded for a tick."""
+        _, fields = self._tick(index)
+        total, available, used, free, percent = fields[3:8]
+        return SystemInfo(memory=MemoryInfo(
+            total_gb=_optional(total),
+            available_gb=_optional(available),
+            used_gb=_optional(used),
+            free_gb=_optional(free),
+            percent=_optional(percent)
+        ))
+
+    def metrics(self, index: int) -> SystemMetrics:
+        """Returns the system metrics recorded for a tick."""
+        _, fields = self._tick(index)
+        return SystemMetrics(*fields[8:15])
+
+    def iter_rows(self, index: int) -> Iterator[tuple]:
+        """Yields the raw (pid, rss, vms, percent, name_id, user_id, ppid, cpu) rows of a tick."""
+        offset, count = self._ticks[index]
+        start = offset + TICK.size
+        rows = self._row.iter_unpack(memoryview(self._map)[start:start + count * self._row.size])
+        if not self._padding:
+            return rows
+        padding = self._padding
+        return (row + padding for row in rows)
+
+    def iter_processes(self, index: int) -> Iterator[Process]:
+        """Yields the processes recorded for a tick."""
+        strings = self.strings
+        for pid, rss, vms, percent, name_id, user_id, ppid, cpu in self.iter_rows(index):
+            yield Process(
+                pid=pid,
+                name=strings[name_id],
+                memory=MemoryInfo(rss_bytes=rss, vms_bytes=vms, percent=_optional(percent)),
+                username=None if user_id < 0 else strings[user_id],
+                ppid=None if ppid < 0 else ppid,
+                cpu_percent=_optional(cpu)
+            )
+
+    def snapshot(self, index: int) -> ProcessSnapshot:
+        """Returns the process snapshot recorded for a tick."""
+        _, fields = self._tick(index)
+        return ProcessSnapshot(
+            timestamp=fields[0],
+            processes=tuple(self.iter_processes(index)),
+            memory_total_bytes=fields[1]
+        )
+
+    def table(self, index: int) -> ProcessTable:
+        """Returns the processes recorded for a tick as a ProcessTable."""
+        table = ProcessTable(self.timestamps[index])
+        strings = self.strings
+        for pid, rss, vms, percent, name_id, user_id, ppid, cpu in self.iter_rows(index):
+            table.append(
+                pid, strings[name_id], rss, vms, _optional(percent),
+                None if user_id < 0 else strings[user_id],
+                None if ppid < 0 else ppid,
+                _optional(cpu)
+            )
+        return table
+
+    def close(self) -> None:
+        """Unmaps and closes the file."""
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> "Recording":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class ReplayAdapter:
+    """Adapter - Answers from one recorded instant of a Recording."""
+
+    def __init__(self, recording: Recording, index: int = -1):
+        """
+        Args:
+            recording: Open recording
+            index: Tick to replay (negative values count from the end)
+
+        Raises:
+            IndexError: If the recording has no such tick
+        """
+        if not -len(recording) <= index < len(recording):
+            raise IndexError(f"tick {index} is out of range (recording has {len(recording)} ticks)")
+        self.recording = recording
+        self.index = index % len(recording)
+
+    @property
+    def timestamp(self) -> float:
+        """Time of the replayed tick in seconds since the epoch."""
+        return self.recording.timestamps[self.index]
+
+    def get_system_info(self) -> SystemInfo:
+        """Returns the recorded system information."""
+        return self.recording.system_info(self.index)
+
+    def get_all_processes(self) -> List[Process]:
+        """Returns the recorded processes."""
+        return list(self.recording.iter_processes(self.index))
+
+    def get_process_snapshot(self) -> ProcessSnapshot:
+        """Returns the recorded processes as a snapshot."""
+        return self.recording.snapshot(self.index)
+
+    def iter_processes(self) -> Iterator[Process]:
+        """Yields the recorded processes one by one."""
+        return self.recording.iter_processes(self.index)
+
+    def get_process_table(self) -> ProcessTable:
+        """Returns the recorded processes as a columnar ProcessTable."""
+        return self.recording.table(self.index)
+
+    def get_system_metrics(self) -> SystemMetrics:
+        """Returns the recorded system metrics."""
+        return self.recording.metrics(self.index)
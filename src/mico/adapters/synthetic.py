@@ -0,0 +1,208 @@
+"""Synthetic adapter - Deterministic, generated hosts for benchmarks and tests."""
+
+import dataclasses
+import random
+import time
+from typing import Iterator, List, Optional, Sequence, Tuple
+from mico.domain.entities import MemoryInfo, SystemInfo, Process, ProcessSnapshot, SystemMetrics
+from mico.domain.process_table import ProcessTable
+
+
+# (name, weight) - a mix of desktop helpers, services and kernel threads
+PROCESS_NAMES = [
+    ("Google Chrome Helper (Renderer)", 20),
+    ("Google Chrome Helper (GPU)", 2),
+    ("Google Chrome Helper", 8),
+    ("Google Chrome", 1),
+    ("Slack Helper (Renderer)", 4),
+    ("Code Helper (Plugin)", 4),
+    ("node", 8),
+    ("python3", 8),
+    ("java", 3),
+    ("postgres", 6),
+    ("nginx", 4),
+    ("redis-server", 1),
+    ("dockerd", 1),
+    ("containerd-shim", 4),
+    ("sshd", 2),
+    ("bash", 5),
+    ("zsh", 3),
+    ("kworker/0:1", 10),
+    ("systemd", 1),
+    ("mds_stores", 1),
+    ("WindowServer", 1),
+]
+
+# (user, weight) - a few system users own most processes
+SYSTEM_USERS = [
+    ("root", 40),
+    ("www-data", 8),
+    ("postgres", 6),
+    ("_windowserver", 1),
+    ("nobody", 2),
+]
+
+# Raw process row: (pid, name, username, rss_bytes, vms_bytes, ppid, cpu_percent)
+RawProcess = Tuple[int, str, Optional[str], int, int, int, float]
+
+
+class SyntheticSystemAdapter:
+    """
+    Adapter - Generates deterministic process populations.
+
+    The same ``count`` and ``seed`` always produce the same host. Process
+    names and users follow skewed distributions: a few names and system
+    users own most rows, plus a long tail of interactive users. RSS is
+    log-normally distributed. Processes form a tree under PID 1, with
+    helpers parented to the application they belong to. Most processes
+    are idle; a few keep one or more cores busy. Raw rows are generated once, so each
+    ``get_*`` call only measures the conversion into domain objects.
+    """
+
+    def __init__(
+        self,
+        count: int = 1000,
+        seed: int = 0,
+        total_memory_bytes: int = 64 * 1024 ** 3,
+        interactive_users: int = 50
+    ):
+        """
+        Args:
+            count: Number of processes on the host
+            seed: Random seed
+            total_memory_bytes: Total memory of the host
+            interactive_users: Size of the long tail of interactive users
+        """
+        self.count = count
+        self.seed = seed
+        self.total_memory_bytes = total_memory_bytes
+        self.rows = self._generate(count, random.Random(seed), interactive_users)
+        self.full_memory_reads = 0
+
+    def _generate(self, count: int, rng: random.Random, interactive_users: int) -> List[RawProcess]:
+        names = [name for name, _ in PROCESS_NAMES]
+        name_weights = [weight for _, weight in PROCESS_NAMES]
+
+        users: List[Optional[str]] = [user for user, _ in SYSTEM_USERS]
+        user_weights = [float(weight) for _, weight in SYSTEM_USERS]
+        for rank in range(1, interactive_users + 1):
+            users.append(f"user{rank:03d}")
+            user_weights.append(30.0 / rank)
+        users.append(None)  # processes whose owner cannot be read
+        user_weights.append(1.0)
+
+        chosen_names = rng.choices(names, name_weights, k=count)
+        chosen_users = rng.choices(users, user_weights, k=count)
+
+        rows = []
+        pid = 1
+        max_rss = self.total_memory_bytes // 8
+        for name, user in zip(chosen_names, chosen_users):
+            rss = min(max_rss, int(rng.lognormvariate(16.5, 1.6)) // 4096 * 4096)
+            vms = int(rss * rng.uniform(1.5, 30.0))
+            rows.append([pid, name, user, rss, vms])
+            pid += rng.randint(1, 4)
+
+        # Parents are drawn after the rows so populations stay seed-stable
+        applications = {}
+        for position, row in enumerate(rows):
+            name = row[1]
+            application = name.split(" Helper")[0]
+            if position == 0:
+                parent = 0
+            elif application != name and application in applications:
+                parent = applications[application]
+            elif rng.random() < 0.6:
+                parent = 1
+            else:
+                parent = rows[rng.randrange(position)][0]
+            if application == name:
+                applications.setdefault(name, row[0])
+            row.append(parent)
+
+        # CPU is drawn last, for the same reason
+        for row in rows:
+            busy = rng.random() < 0.15
+            row.append(round(rng.expovariate(1 / 40.0), 1) if busy else 0.0)
+        return [tuple(row) for row in rows]
+
+    def get_system_info(self) -> SystemInfo:
+        """Returns synthetic system information derived from the population."""
+        used = min(self.total_memory_bytes, sum(row[3] for row in self.rows))
+        available = self.total_memory_bytes - used
+        memory_info = MemoryInfo(
+            total_gb=self.total_memory_bytes / (1024 ** 3),
+            available_gb=available / (1024 ** 3),
+            used_gb=used / (1024 ** 3),
+            free_gb=available / (1024 ** 3),
+            percent=round(used / self.total_memory_bytes * 100, 1),
+            rss_bytes=None,
+            vms_bytes=None
+        )
+        return SystemInfo(memory=memory_info)
+
+    def get_all_processes(self) -> List[Process]:
+        """Returns the synthetic processes."""
+        return list(self.iter_processes())
+
+    def get_process_snapshot(self) -> ProcessSnapshot:
+        """Returns the synthetic processes as a snapshot."""
+        return ProcessSnapshot(
+            timestamp=time.time(),
+            processes=tuple(self.iter_processes()),
+            memory_total_bytes=self.total_memory_bytes
+        )
+
+    def iter_processes(self) -> Iterator[Process]:
+        """Yields the synthetic processes one by one."""
+        total = self.total_memory_bytes
+        for pid, name, username, rss, vms, ppid, cpu_percent in self.rows:
+            yield Process(
+                pid=pid,
+                name=name,
+                memory=MemoryInfo(rss_bytes=rss, vms_bytes=vms, percent=(rss / total) * 100),
+                username=username,
+                ppid=ppid,
+                cpu_percent=cpu_percent
+            )
+
+    def get_process_table(self) -> ProcessTable:
+        """Returns the synthetic processes as a columnar ProcessTable."""
+        table = ProcessTable(time.time())
+        total = self.total_memory_bytes
+        for pid, name, username, rss, vms, ppid, cpu_percent in self.rows:
+            table.append(pid, name, rss, vms, (rss / total) * 100, username, ppid, cpu_percent)
+        return table
+
+    def iter_rss(self) -> Iterator[Tuple[int, float, str, int]]:
+        """Yields (pid, create_time, name, rss_bytes) of the synthetic processes."""
+        for pid, name, _, rss, _, _, _ in self.rows:
+            yield pid, 0.0, name, rss
+
+    def read_full_memory(self, processes: Sequence[Process]) -> List[Process]:
+        """Returns the processes with a deterministic USS/PSS below their RSS."""
+        self.full_memory_reads += len(processes)
+        enriched = []
+        for process in processes:
+            rss = process.memory.rss_bytes or 0
+            # Between 10% and 100% of the RSS is unique to the process
+            uss = rss * (10 + (process.pid * 37) % 91) // 100
+            memory = dataclasses.replace(process.memory, uss_bytes=uss, pss_bytes=(uss + rss) // 2)
+            enriched.append(dataclasses.replace(process, memory=memory))
+        return enriched
+
+    def get_system_metrics(self) -> SystemMetrics:
+        """Returns deterministic synthetic system metrics."""
+        rng = random.Random(self.seed)
+        info = self.get_system_info().memory
+        disk_total_gb = 1024.0
+        disk_percent = round(rng.uniform(20.0, 95.0), 1)
+        return SystemMetrics(
+            cpu_percent=round(rng.uniform(0.0, 100.0), 1),
+            memory_percent=info.percent,
+            disk_percent=disk_percent,
+            memory_total_gb=info.total_gb,
+            memory_used_gb=info.used_gb,
+            disk_total_gb=disk_total_gb,
+            disk_used_gb=disk_total_gb * disk_percent / 100
+        )
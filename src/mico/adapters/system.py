@@ -1,8 +1,28 @@
 """System adapter - Interface with the operating system."""
 
+import sys
+import time
 import psutil
-from typing import Protocol, List
-from mico.domain.entities import MemoryInfo, SystemInfo, Process, SystemMetrics
+from typing import TYPE_CHECKING, Any, Iterator, Protocol, List, Optional, Sequence, Tuple
+from mico.domain.entities import MemoryInfo, SystemInfo, Process, ProcessSnapshot, SystemMetrics
+from mico.adapters.users import UsernameCache, shared_username_cache
+
+if TYPE_CHECKING:
+    from mico.domain.metrics import DiskUsage, IOMetrics
+    from mico.domain.process_table import ProcessTable
+
+
+PROCESS_ATTRS = ['pid', 'ppid', 'name', 'memory_info']
+
+# Read in addition when per-process CPU is tracked
+PROCESS_CPU_ATTRS = ['cpu_times', 'create_time']
+
+# Read for leak tracking
+RSS_ATTRS = ['name', 'create_time', 'memory_info']
+
+# On POSIX, uids are fetched and resolved through a shared cache instead of
+# letting psutil do a passwd lookup for every process.
+USER_ATTR = 'uids' if hasattr(psutil.Process, 'uids') else 'username'
 
 
 class ISystemAdapter(Protocol):
@@ -16,6 +36,14 @@ class ISystemAdapter(Protocol):
         """Returns all system processes."""
         ...
     
+    def get_process_snapshot(self) -> ProcessSnapshot:
+        """Returns all system processes collected in a single pass."""
+        ...
+    
+    def iter_processes(self) -> Iterator[Process]:
+        """Lazily yields system processes as they are collected."""
+        ...
+    
     def get_system_metrics(self) -> SystemMetrics:
         """Returns extended system metrics for health checking."""
         ...
@@ -24,6 +52,74 @@ class ISystemAdapter(Protocol):
 class SystemAdapter:
     """Adapter - Implementation using psutil."""
     
+    def __init__(
+        self,
+        cpu_sampler: Optional[Any] = None,
+        usernames: bool = True,
+        username_cache: Optional[UsernameCache] = None,
+        process_cpu: bool = False,
+        disk_probe: Optional[Any] = None,
+        io_sampler: Optional[Any] = None
+    ):
+        """
+        Args:
+            cpu_sampler: CPU sampler used for system metrics (default: a
+                non-blocking CpuSampler, created on first use)
+            usernames: Resolve process owners; when False, usernames are
+                left as None and no user lookups are made
+            username_cache: Cache for uid to username lookups (default:
+                the process-wide shared cache)
+            process_cpu: Track per-process CPU usage; each collection then
+                reports CPU since the previous one (see prime_process_cpu)
+            disk_probe: DiskProbe choosing and reading the volumes checked
+                for system metrics (default: every relevant volume)
+            io_sampler: IORateSampler measuring disk and network
+                throughput for system metrics (default: created on the
+                first system metrics collection)
+        """
+        self.usernames = usernames
+        self.username_cache = (
+            username_cache if username_cache is not None else shared_username_cache()
+        )
+        self.process_attrs = PROCESS_ATTRS + [USER_ATTR] if usernames else list(PROCESS_ATTRS)
+        self.cpu_tracker: Optional[Any] = None
+        if process_cpu:
+            from mico.adapters.cpu import ProcessCpuTracker
+            
+            self.cpu_tracker = ProcessCpuTracker()
+            self.process_attrs += PROCESS_CPU_ATTRS
+        self._full_memory_reader = None
+        self._cpu_sampler = cpu_sampler
+        self._disk_probe = disk_probe
+        self._io_sampler = io_sampler
+    
+    @property
+    def cpu_sampler(self) -> Any:
+        """CpuSampler used for system metrics, created on first use."""
+        if self._cpu_sampler is None:
+            from mico.adapters.cpu import CpuSampler
+            
+            self._cpu_sampler = CpuSampler()
+        return self._cpu_sampler
+    
+    @property
+    def disk_probe(self) -> Any:
+        """DiskProbe used for system metrics, created on first use."""
+        if self._disk_probe is None:
+            from mico.adapters.disks import DiskProbe
+            
+            self._disk_probe = DiskProbe()
+        return self._disk_probe
+    
+    @property
+    def io_sampler(self) -> Any:
+        """IORateSampler used for system metrics, created on first use."""
+        if self._io_sampler is None:
+            from mico.adapters.iorates import IORateSampler
+            
+            self._io_sampler = IORateSampler()
+        return self._io_sampler
+    
     def get_system_info(self) -> SystemInfo:
         """
         Collects system information.
@@ -52,9 +148,106 @@ class SystemAdapter:
         Returns:
             List of Process domain objects
         """
-        processes = []
+        return list(self.get_process_snapshot().processes)
+    
+    def get_process_snapshot(self) -> ProcessSnapshot:
+        """
+        Collects all system processes in a single pass.
+        
+        System totals are read once per snapshot rather than once per
+        process, and each process is read through ``process_iter`` with
+        an attribute list, which psutil batches inside one ``oneshot()``
+        context.
+        
+        Returns:
+            ProcessSnapshot with the processes and the collection time
+        """
+        timestamp = time.time()
+        total_memory = psutil.virtual_memory().total
+        
+        return ProcessSnapshot(
+            timestamp=timestamp,
+            processes=tuple(self._iter_processes(total_memory)),
+            memory_total_bytes=total_memory
+        )
+    
+    def iter_processes(self) -> Iterator[Process]:
+        """
+        Lazily collects system processes.
+        
+        Processes are yielded as they are read, so callers that only keep
+        a few of them (e.g. a top-N selection) never hold the full list.
+        
+        Returns:
+            Iterator over Process domain objects
+        """
+        return self._iter_processes(psutil.virtual_memory().total)
+    
+    def _iter_processes(self, total_memory: int) -> Iterator[Process]:
+        """Yields a Process for every readable system process."""
+        if self.cpu_tracker is not None:
+            self.cpu_tracker.begin()
+        for proc in psutil.process_iter(self.process_attrs):
+            process = self._build_process(proc, total_memory)
+            if process is not None:
+                yield process
+        if self.cpu_tracker is not None:
+            self.cpu_tracker.end()
+    
+    def iter_rss(self) -> Iterator[Tuple[int, float, str, int]]:
+        """
+        Yields the RSS of every readable process, for leak tracking.
+        
+        Only name, create time and memory counters are read, and no
+        Process objects are built.
+        
+        Returns:
+            Iterator over (pid, create_time, name, rss_bytes)
+        """
+        for proc in psutil.process_iter(RSS_ATTRS):
+            pinfo = proc.info
+            memory_info = pinfo.get('memory_info')
+            if memory_info is None:
+                continue
+            name = pinfo.get('name') or 'Unknown'
+            yield proc.pid, pinfo.get('create_time') or 0.0, name, memory_info.rss
+    
+    def prime_process_cpu(self) -> None:
+        """
+        Takes the first CPU-times reading of every process.
+        
+        The next collection reports each process's CPU usage since this
+        call, so a whole table costs one shared interval. Does nothing
+        when per-process CPU is not tracked.
+        """
+        tracker = self.cpu_tracker
+        if tracker is None:
+            return
+        tracker.begin()
+        for proc in psutil.process_iter(PROCESS_CPU_ATTRS):
+            cpu_times = proc.info.get('cpu_times')
+            if cpu_times is not None:
+                tracker.update(proc.pid, proc.info.get('create_time') or 0.0, cpu_times)
+        tracker.end()
+    
+    def get_process_table(self) -> "ProcessTable":
+        """
+        Collects all system processes into a columnar ProcessTable.
         
-        for proc in psutil.process_iter(['pid', 'name', 'memory_info', 'username']):
+        Rows are appended straight into the table columns, so no Process
+        or MemoryInfo objects are allocated during collection.
+        
+        Returns:
+            ProcessTable with one row per readable process
+        """
+        from mico.domain.process_table import ProcessTable
+        
+        table = ProcessTable(time.time())
+        total_memory = psutil.virtual_memory().total
+        if self.cpu_tracker is not None:
+            self.cpu_tracker.begin()
+        
+        for proc in psutil.process_iter(self.process_attrs):
             try:
                 pinfo = proc.info
                 memory_info = pinfo.get('memory_info')
@@ -65,57 +258,182 @@ class SystemAdapter:
                 if not hasattr(memory_info, 'rss') or not hasattr(memory_info, 'vms'):
                     continue
                 
-                total_memory = psutil.virtual_memory().total
-                memory_percent = (memory_info.rss / total_memory) * 100
-                
-                memory = MemoryInfo(
-                    rss_bytes=memory_info.rss,
-                    vms_bytes=memory_info.vms,
-                    percent=memory_percent
-                )
-                
-                process = Process(
-                    pid=pinfo['pid'],
-                    name=pinfo['name'] or 'Unknown',
-                    memory=memory,
-                    username=pinfo.get('username')
+                table.append(
+                    pinfo['pid'],
+                    pinfo['name'] or 'Unknown',
+                    memory_info.rss,
+                    memory_info.vms,
+                    (memory_info.rss / total_memory) * 100,
+                    self._username(pinfo),
+                    pinfo.get('ppid'),
+                    self._cpu_percent(pinfo)
                 )
                 
-                processes.append(process)
-                
             except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
                 continue
             except (AttributeError, TypeError, KeyError):
                 continue
         
-        return processes
+        if self.cpu_tracker is not None:
+            self.cpu_tracker.end()
+        return table
+    
+    def _username(self, pinfo: dict) -> Optional[str]:
+        """Returns the owner of a process from its uids or username attribute."""
+        if 'uids' in pinfo:
+            uids = pinfo['uids']
+            return None if uids is None else self.username_cache.resolve(uids.real)
+        return pinfo.get('username')
+    
+    def _cpu_percent(self, pinfo: dict) -> Optional[float]:
+        """Returns the CPU usage of a process since its previous reading."""
+        if self.cpu_tracker is None:
+            return None
+        cpu_times = pinfo.get('cpu_times')
+        if cpu_times is None:
+            return None
+        return self.cpu_tracker.update(pinfo['pid'], pinfo.get('create_time') or 0.0, cpu_times)
+    
+    def _build_process(self, proc: psutil.Process, total_memory: int) -> Optional[Process]:
+        """
+        Converts one psutil process into a Process domain object.
+        
+        Args:
+            proc: psutil process yielded by process_iter
+            total_memory: Total system memory in bytes
+        
+        Returns:
+            Process, or None when the process cannot be read
+        """
+        try:
+            pinfo = proc.info
+            memory_info = pinfo.get('memory_info')
+            
+            if memory_info is None:
+                return None
+            
+            if not hasattr(memory_info, 'rss') or not hasattr(memory_info, 'vms'):
+                return None
+            
+            memory = MemoryInfo(
+                rss_bytes=memory_info.rss,
+                vms_bytes=memory_info.vms,
+                percent=(memory_info.rss / total_memory) * 100
+            )
+            
+            return Process(
+                pid=pinfo['pid'],
+                name=pinfo['name'] or 'Unknown',
+                memory=memory,
+                username=self._username(pinfo),
+                ppid=pinfo.get('ppid'),
+                cpu_percent=self._cpu_percent(pinfo)
+            )
+            
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            return None
+        except (AttributeError, TypeError, KeyError):
+            return None
+    
+    def read_full_memory(self, processes: Sequence[Process]) -> List[Process]:
+        """
+        Reads USS/PSS for a few processes.
+        
+        Reads run on a bounded thread pool and are cached between calls,
+        see FullMemoryReader. Meant for a pre-selected set of candidates,
+        not for every process.
+        
+        Args:
+            processes: Processes to read
+        
+        Returns:
+            Processes with USS/PSS filled in where they could be read
+        """
+        if self._full_memory_reader is None:
+            from mico.adapters.full_memory import FullMemoryReader
+            
+            self._full_memory_reader = FullMemoryReader()
+        return self._full_memory_reader.enrich(processes)
     
     def get_system_metrics(self) -> SystemMetrics:
         """
         Collects extended system metrics for health checking.
         
+        Every relevant volume is checked (see DiskProbe), and the disk
+        fields report the fullest one. Disk and network rates cover the
+        time since the previous collection; the I/O counters are primed
+        before the CPU sample, so a first collection waits only once.
+        
         Returns:
-            SystemMetrics with CPU, memory, and disk information
+            SystemMetrics with CPU, memory, disk and I/O information
         """
-        cpu_percent = psutil.cpu_percent(interval=1)
-        
-        mem = psutil.virtual_memory()
-        memory_total_gb = mem.total / (1024 ** 3)
-        memory_used_gb = mem.used / (1024 ** 3)
-        memory_percent = mem.percent
-        
-        disk = psutil.disk_usage('/')
-        disk_total_gb = disk.total / (1024 ** 3)
-        disk_used_gb = disk.used / (1024 ** 3)
-        disk_percent = disk.percent
-        
-        return SystemMetrics(
-            cpu_percent=cpu_percent,
-            memory_percent=memory_percent,
-            disk_percent=disk_percent,
-            memory_total_gb=memory_total_gb,
-            memory_used_gb=memory_used_gb,
-            disk_total_gb=disk_total_gb,
-            disk_used_gb=disk_used_gb
+        io_sampler = self.io_sampler
+        cpu_percent = self.cpu_sampler.percent()
+        return build_system_metrics(
+            cpu_percent, psutil.virtual_memory(), self.disk_probe.probe(), io_sampler.rates()
         )
 
+
+def default_adapter(**options: Any) -> SystemAdapter:
+    """
+    Returns the fastest SystemAdapter available on this platform.
+    
+    On Linux, processes are read straight from /proc by
+    ProcfsSystemAdapter; elsewhere they are read through psutil.
+    
+    Args:
+        **options: Passed to the adapter
+    
+    Returns:
+        ProcfsSystemAdapter when /proc is available, SystemAdapter otherwise
+    """
+    if sys.platform.startswith("linux"):
+        from mico.adapters.procfs import ProcfsSystemAdapter
+        
+        if ProcfsSystemAdapter.available():
+            return ProcfsSystemAdapter(**options)
+    return SystemAdapter(**options)
+
+
+def build_system_metrics(
+    cpu_percent: float,
+    mem,
+    disks: Sequence["DiskUsage"],
+    io: Optional["IOMetrics"] = None
+) -> SystemMetrics:
+    """
+    Builds SystemMetrics from raw readings.
+    
+    Args:
+        cpu_percent: CPU usage percentage
+        mem: Result of psutil.virtual_memory()
+        disks: Usage of every volume checked
+        io: Disk and network rates, when measured
+    
+    Returns:
+        SystemMetrics with CPU, memory, and disk information; the disk
+        fields are those of the fullest responding volume
+    """
+    from mico.domain.metrics import DiskUsage
+    
+    memory_total_gb = mem.total / (1024 ** 3)
+    memory_used_gb = mem.used / (1024 ** 3)
+    memory_percent = mem.percent
+    
+    responding = [disk for disk in disks if disk.responding]
+    worst = max(responding, key=lambda disk: disk.percent) if responding else DiskUsage("")
+    disk_total_gb = worst.total_gb
+    disk_used_gb = worst.used_gb
+    disk_percent = worst.percent
+    
+    return SystemMetrics(
+        cpu_percent=cpu_percent,
+        memory_percent=memory_percent,
+        disk_percent=disk_percent,
+        memory_total_gb=memory_total_gb,
+        memory_used_gb=memory_used_gb,
+        disk_total_gb=disk_total_gb,
+        disk_used_gb=disk_used_gb,
+        disks=tuple(disks),
+        io=io
+    )
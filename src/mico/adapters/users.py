@@ -0,0 +1,86 @@
+"""Username cache - Shared uid to username resolution."""
+
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+try:
+    import pwd
+except ImportError:  # pragma: no cover - Windows has no passwd database
+    pwd = None
+
+
+def lookup_username(uid: int) -> str:
+    """
+    Resolves a uid through the passwd database.
+
+    Unknown uids resolve to the uid as a string, as psutil's username() does.
+    """
+    if pwd is None:
+        return str(uid)
+    try:
+        return pwd.getpwuid(uid).pw_name
+    except KeyError:
+        return str(uid)
+
+
+class UsernameCache:
+    """
+    Caches uid to username lookups.
+
+    Each passwd lookup can mean a round trip to a directory service (LDAP,
+    NIS), and most processes on a host share a handful of uids. Names are
+    kept for ``ttl`` seconds, so each distinct uid is resolved once per
+    TTL instead of once per process.
+    """
+
+    def __init__(self, ttl: float = 300.0, lookup: Callable[[int], str] = lookup_username):
+        """
+        Args:
+            ttl: Seconds a resolved name stays valid
+            lookup: Function resolving a uid to a username
+        """
+        self.ttl = ttl
+        self.lookup = lookup
+        self._names: Dict[int, Tuple[str, float]] = {}
+
+    def resolve(self, uid: int) -> str:
+        """
+        Returns the username for a uid, resolving it when not cached.
+
+        Args:
+            uid: User ID
+
+        Returns:
+            Username, or the uid as a string when it is unknown
+        """
+        now = time.monotonic()
+        cached = self._names.get(uid)
+        if cached is not None and cached[1] > now:
+            return cached[0]
+
+        name = self.lookup(uid)
+        self._names[uid] = (name, now + self.ttl)
+        return name
+
+    def invalidate(self, uid: Optional[int] = None) -> None:
+        """
+        Drops cached names.
+
+        Args:
+            uid: User ID to drop, or None to clear the whole cache
+        """
+        if uid is None:
+            self._names.clear()
+        else:
+            self._names.pop(uid, None)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+
+_shared_cache = UsernameCache()
+
+
+def shared_username_cache() -> UsernameCache:
+    """Returns the process-wide username cache shared by adapters."""
+    return _shared_cache
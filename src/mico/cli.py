@@ -1,34 +1,179 @@
-"""Command-line interface for Mico."""
+"""
+Command-line interface for Mico.
+
+Adapters and use cases are imported inside the commands that need them,
+so ``mico --version``, ``mico --help`` and daemon-backed commands do not
+pay for loading psutil or unrelated use cases. Likewise, only memory,
+top and health are defined here; the other commands live in
+``mico.commands`` and are imported when they are run (see LAZY_COMMANDS).
+"""
 
 import sys
 from mico import __version__
 import click
-from mico.adapters.system import SystemAdapter
-from mico.domain.use_cases.list_processes import ListProcessesUseCase
-from mico.domain.use_cases.filter_processes import FilterProcessesUseCase
-from mico.domain.use_cases.calculate_health import CalculateSystemHealthUseCase
+from mico.output import FORMATS
+
 
+# Commands defined in mico.commands: name -> (module, help shown by --help)
+LAZY_COMMANDS = {
+    "daemon": ("mico.commands.daemon", "Run a resident collector that serves warm snapshots."),
+    "dump": ("mico.commands.fleet", "Dump this host's processes and metrics for 'mico fleet'."),
+    "fleet": ("mico.commands.fleet", "Rank the hosts and processes of a directory of dumps."),
+    "history": ("mico.commands.watch", "Summarise recent CPU, memory and disk usage."),
+    "leaks": ("mico.commands.leaks", "Find processes whose memory keeps growing."),
+    "record": ("mico.commands.recording", "Record processes and metrics to a compact binary file."),
+    "replay": ("mico.commands.recording", "Run top, memory or health against a recorded instant."),
+    "serve": (
+        "mico.commands.daemon",
+        "Serve metrics, health scores and top processes to Prometheus.",
+    ),
+    "watch": ("mico.commands.watch", "Continuously display top processes."),
+}
 
-@click.group()
+
+class LazyGroup(click.Group):
+    """
+    Group importing the modules of LAZY_COMMANDS only when a command is run.
+    
+    Each click command costs about a millisecond to define, which every
+    invocation would pay; --help lists lazy commands by their registered
+    help instead of importing them.
+    """
+    
+    def list_commands(self, ctx: click.Context):
+        return sorted(set(self.commands) | set(LAZY_COMMANDS))
+    
+    def get_command(self, ctx: click.Context, cmd_name: str):
+        if cmd_name not in self.commands and cmd_name in LAZY_COMMANDS:
+            import importlib
+            
+            module = importlib.import_module(LAZY_COMMANDS[cmd_name][0])
+            self.add_command(getattr(module, cmd_name))
+        return self.commands.get(cmd_name)
+    
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        names = self.list_commands(ctx)
+        limit = formatter.width - 6 - max(map(len, names))
+        rows = []
+        for name in names:
+            command = self.commands.get(name)
+            if command is None:
+                rows.append((name, LAZY_COMMANDS[name][1]))
+            elif not command.hidden:
+                rows.append((name, command.get_short_help_str(limit)))
+        with formatter.section("Commands"):
+            formatter.write_dl(rows)
+
+
+@click.group(cls=LazyGroup)
 @click.version_option(version=__version__, prog_name="mico")
-def cli():
+@click.option(
+    "--no-daemon",
+    is_flag=True,
+    help="Always collect directly instead of asking a running mico daemon"
+)
+@click.option(
+    "--socket",
+    "socket_path",
+    default=None,
+    help="Daemon socket path (default: $MICO_SOCKET or a per-user path)"
+)
+@click.pass_context
+def cli(ctx: click.Context, no_daemon: bool, socket_path: str):
     """Mico - macOS System Monitoring CLI."""
-    pass
+    ctx.ensure_object(dict)
+    ctx.obj.setdefault("use_daemon", not no_daemon)
+    ctx.obj.setdefault("socket_path", socket_path)
+
+
+def _get_adapter(ctx: click.Context, processes: bool = False, **options):
+    """
+    Returns the adapter a command should collect from.
+    
+    An adapter passed in through ``ctx.obj["adapter"]`` (e.g. by tests or
+    benchmarks) is used as is. Otherwise a running daemon answers from its
+    warm snapshot, with direct collection as fallback: through
+    default_adapter() for commands that list processes (``processes``),
+    and through SystemAdapter for the others, which do not need the
+    /proc fast path. Keyword options are passed to the adapter.
+    """
+    adapter = ctx.obj.get("adapter")
+    if adapter is not None:
+        return adapter
+    
+    if ctx.obj.get("use_daemon", True):
+        from mico.adapters.daemon import connect_daemon
+        
+        client = connect_daemon(ctx.obj.get("socket_path"))
+        if client is not None:
+            return client
+    
+    if not processes:
+        from mico.adapters.system import SystemAdapter
+        
+        return SystemAdapter(**options)
+    
+    from mico.adapters.system import default_adapter
+    
+    return default_adapter(**options)
+
+
+def _require_live_host(ctx: click.Context, *options: str) -> None:
+    """
+    Rejects options that only direct collection can honour.
+    
+    Under 'mico replay' (or with any adapter passed in through
+    ``ctx.obj["adapter"]``) such options would silently report the live
+    host instead of the injected data.
+    """
+    if ctx.obj.get("adapter") is not None:
+        raise click.UsageError(
+            f"{' / '.join(options)}: only available when collecting from the live "
+            "host, not with a replayed recording or an injected adapter"
+        )
+
+
+def _format_option(*formats: str):
+    """The --format option, limited to the given formats (default: all)."""
+    return click.option(
+        "--format",
+        "output_format",
+        type=click.Choice(formats or FORMATS, case_sensitive=False),
+        default="table",
+        help=f"Output format: {', '.join(formats or FORMATS)} (default: table)"
+    )
 
 
 @cli.command()
-def memory():
+@_format_option()
+@click.pass_context
+def memory(ctx: click.Context, output_format: str):
     """Display system memory information."""
-    adapter = SystemAdapter()
+    from mico.output import OutputWriter, write_document
+    
+    adapter = _get_adapter(ctx)
     system_info = adapter.get_system_info()
     memory_info = system_info.memory
     
-    click.echo("\n💾 System Memory Information\n")
-    click.echo(f"Total:      {memory_info.total_gb:.2f} GB ({memory_info.total_mb:.0f} MB)")
-    click.echo(f"Used:       {memory_info.used_gb:.2f} GB ({memory_info.used_mb:.0f} MB)")
-    click.echo(f"Available:  {memory_info.available_gb:.2f} GB ({memory_info.available_mb:.0f} MB)")
-    click.echo(f"Free:       {memory_info.free_gb:.2f} GB ({memory_info.free_mb:.0f} MB)")
-    click.echo(f"Usage:      {memory_info.percent:.1f}%\n")
+    with OutputWriter() as out:
+        if output_format != "table":
+            write_document(out, output_format, {
+                "total_gb": memory_info.total_gb,
+                "used_gb": memory_info.used_gb,
+                "available_gb": memory_info.available_gb,
+                "free_gb": memory_info.free_gb,
+                "percent": memory_info.percent,
+            })
+            return
+        
+        out.line("\n💾 System Memory Information\n")
+        out.line(f"Total:      {memory_info.total_gb:.2f} GB ({memory_info.total_mb:.0f} MB)")
+        out.line(f"Used:       {memory_info.used_gb:.2f} GB ({memory_info.used_mb:.0f} MB)")
+        out.line(
+            f"Available:  {memory_info.available_gb:.2f} GB ({memory_info.available_mb:.0f} MB)"
+        )
+        out.line(f"Free:       {memory_info.free_gb:.2f} GB ({memory_info.free_mb:.0f} MB)")
+        out.line(f"Usage:      {memory_info.percent:.1f}%\n")
 
 
 @cli.command()
@@ -37,22 +182,57 @@ def memory():
     "-t",
     default=10,
     type=int,
-    help="Number of processes to display (default: 10)"
+    help="Number of processes to display, 0 for all (default: 10)"
 )
 @click.option(
     "--sort",
     "-s",
-    type=click.Choice(["mem", "name", "pid"], case_sensitive=False),
+    type=click.Choice(["mem", "cpu", "name", "pid"], case_sensitive=False),
     default="mem",
-    help="Sort criteria: mem (memory), name, or pid (default: mem)"
+    help="Sort criteria: mem (memory), cpu, name, or pid (default: mem)"
 )
 @click.option(
     "--filter",
     "-f",
     default="",
-    help="Filter processes by name or PID"
+    help="Filter by name or PID, or by terms such as 'user:www rss>500M name~^nginx'"
+)
+@click.option(
+    "--no-user",
+    is_flag=True,
+    help="Hide the User column and skip username lookups"
+)
+@click.option(
+    "--group",
+    "-g",
+    type=click.Choice(["tree", "app", "user"], case_sensitive=False),
+    default=None,
+    help="Aggregate RSS per process subtree, application or user"
+)
+@click.option(
+    "--accurate",
+    is_flag=True,
+    help="Read USS/PSS of the top candidates and rank memory by USS"
+)
+@click.option(
+    "--cpu-interval",
+    default=0.5,
+    type=click.FloatRange(min=0.0),
+    help="Seconds CPU usage is measured over with --sort cpu (default: 0.5)"
 )
-def top(top: int, sort: str, filter: str):
+@_format_option()
+@click.pass_context
+def top(
+    ctx: click.Context,
+    top: int,
+    sort: str,
+    filter: str,
+    no_user: bool,
+    group: str,
+    accurate: bool,
+    cpu_interval: float,
+    output_format: str
+):
     """
     Display top processes by memory consumption.
     
@@ -64,86 +244,374 @@ def top(top: int, sort: str, filter: str):
       # Top 20 processes sorted by name
       mico top --top 20 --sort name
       
+      # Busiest processes over one second
+      mico top --sort cpu --cpu-interval 1
+      
       # Filter Chrome processes
       mico top --filter chrome
+      
+      # nginx workers owned by www using more than 500 MB
+      mico top --filter 'user:www rss>500M name~^nginx'
+      
+      # Applications with their helper processes folded in
+      mico top --group app
+      
+      # Rank by unique memory (USS) instead of RSS, which counts shared pages
+      mico top --accurate
+      
+      # Every process as CSV
+      mico top --top 0 --format csv > processes.csv
     """
-    adapter = SystemAdapter()
-    all_processes = adapter.get_all_processes()
+    from mico.domain.use_cases.filter_processes import FilterProcessesUseCase
+    from mico.domain.use_cases.list_processes import ListProcessesUseCase
+    from mico.output import PROCESS_FIELDS, OutputWriter, process_record, write_records
     
-    if not all_processes:
-        click.echo("No processes found.")
-        return
+    if accurate and group:
+        raise click.UsageError("--accurate cannot be combined with --group")
+    if sort == "cpu" and group:
+        raise click.UsageError("--sort cpu cannot be combined with --group")
+    if no_user and group == "user":
+        raise click.UsageError("--group user cannot be combined with --no-user")
     
-    filtered_processes = FilterProcessesUseCase.execute(all_processes, filter)
+    process_cpu = sort == "cpu"
+    adapter = _get_adapter(ctx, processes=True, usernames=not no_user, process_cpu=process_cpu)
+    if accurate and not hasattr(adapter, "read_full_memory"):
+        # A recording has no USS/PSS to offer, and falling back to live
+        # collection would pass the live host off as the recording
+        _require_live_host(ctx, "--accurate")
+        
+        from mico.adapters.system import default_adapter
+        
+        # A daemon does not read USS/PSS: they are collected directly
+        adapter = default_adapter(usernames=not no_user, process_cpu=process_cpu)
+    if process_cpu:
+        # A daemon answers with CPU usage between its refreshes; direct
+        # collection reads every process twice around one shared interval
+        _prime_process_cpu(adapter, cpu_interval)
     
-    if not filtered_processes:
-        click.echo(f"No processes found matching filter: {filter}")
-        return
+    # Stream processes from the adapter through the filter into a bounded
+    # top-N selection, so the full process list is never built. A filter
+    # pinning PIDs is answered from a snapshot's PID index instead.
+    try:
+        if FilterProcessesUseCase.pinned_pids(filter) is not None:
+            processes = adapter.get_process_snapshot()
+        else:
+            processes = adapter.iter_processes()
+        matching_processes = FilterProcessesUseCase.stream(processes, filter)
+    except ValueError as exc:
+        raise click.BadParameter(str(exc), param_hint="--filter")
     
-    sorted_processes = ListProcessesUseCase.execute(
-        filtered_processes,
-        sort_by=sort,
-        reverse=True,
-        top_n=top
-    )
+    if group:
+        _top_groups(matching_processes, group, sort, top, filter, output_format)
+        return
     
-    click.echo(f"\n📊 Top {len(sorted_processes)} Processes (sorted by {sort})\n")
-    click.echo(f"{'PID':<8} {'Name':<30} {'Memory (MB)':<15} {'Memory (%)':<12} {'User'}")
-    click.echo("-" * 85)
+    if accurate and sort == "mem":
+        sorted_processes = ListProcessesUseCase.execute_accurate(
+            matching_processes, adapter.read_full_memory, top_n=top or sys.maxsize
+        )
+    else:
+        sorted_processes = ListProcessesUseCase.execute(
+            matching_processes,
+            sort_by=sort,
+            reverse=True,
+            top_n=top or sys.maxsize
+        )
+        if accurate:
+            sorted_processes = adapter.read_full_memory(sorted_processes)
     
-    for process in sorted_processes:
-        memory_mb = process.memory.rss_mb
-        memory_percent = process.memory.percent or 0.0
-        username = process.username or "N/A"
-        name = process.name[:28] + ".." if len(process.name) > 30 else process.name
+    with OutputWriter() as out:
+        if output_format != "table":
+            write_records(out, output_format, map(process_record, sorted_processes), PROCESS_FIELDS)
+            return
+        
+        if not sorted_processes:
+            if filter:
+                out.line(f"No processes found matching filter: {filter}")
+            else:
+                out.line("No processes found.")
+            return
         
-        click.echo(
-            f"{process.pid:<8} {name:<30} {memory_mb:>12.2f} MB {memory_percent:>10.2f}%  {username}"
+        sorted_by = "uss" if accurate and sort == "mem" else sort
+        out.line(f"\n📊 Top {len(sorted_processes)} Processes (sorted by {sorted_by})\n")
+        _write_process_table(
+            out, sorted_processes, show_user=not no_user, accurate=accurate, show_cpu=process_cpu
         )
-    
-        click.echo()
+        out.line()
 
 
 @cli.command()
-def health():
+@click.option(
+    "--cpu-window",
+    type=click.FloatRange(min=0.01),
+    default=None,
+    help="CPU sampling window in seconds (default: 0.1, or 1.0 with --accurate)"
+)
+@click.option(
+    "--accurate",
+    is_flag=True,
+    help="Block for the full CPU sampling window on every reading"
+)
+@click.option(
+    "--mount",
+    "mounts",
+    multiple=True,
+    help="Mount point (glob) to check instead of every relevant volume; repeatable"
+)
+@click.option(
+    "--exclude-mount",
+    "excluded_mounts",
+    multiple=True,
+    help="Mount point (glob) to skip; repeatable"
+)
+@click.option(
+    "--disk-timeout",
+    type=click.FloatRange(min=0.0, min_open=True),
+    default=None,
+    help="Seconds to wait for volumes before reporting them as not responding (default: 1)"
+)
+@_format_option()
+@click.pass_context
+def health(
+    ctx: click.Context,
+    cpu_window: float,
+    accurate: bool,
+    mounts,
+    excluded_mounts,
+    disk_timeout: float,
+    output_format: str
+):
     """
     Check overall system health.
     
     Displays health scores for CPU, memory, and disk usage,
-    along with warnings and recommendations.
+    along with warnings and recommendations. Every relevant volume is
+    checked and the disk score reflects the fullest one; a volume that
+    does not answer within the disk timeout is reported, not waited on.
+    Disk busy time and network link utilisation are scored too where
+    the platform reports them. When a daemon is running, readings it
+    found far from this host's usual levels are listed as anomalies.
     
     Example:
     
       mico health
+      
+      # Sample CPU over a full second
+      mico health --accurate
+      
+      # Only the data volumes, giving network mounts half a second
+      mico health --mount '/data*' --disk-timeout 0.5
+      
+      # Scores, warnings and raw metrics as JSON
+      mico health --format json
     """
-    adapter = SystemAdapter()
+    from mico.domain.use_cases.calculate_health import CalculateSystemHealthUseCase
+    from mico.output import OutputWriter, write_document
+    
+    disk_options = mounts or excluded_mounts or disk_timeout is not None
+    if cpu_window is None and not accurate and not disk_options:
+        adapter = _get_adapter(ctx)
+    else:
+        _require_live_host(
+            ctx, "--cpu-window", "--accurate", "--mount", "--exclude-mount", "--disk-timeout"
+        )
+        
+        from mico.adapters.cpu import CpuSampler
+        from mico.adapters.disks import DiskProbe
+        from mico.adapters.system import SystemAdapter
+        
+        # An explicit sampling request is always served by direct collection
+        cpu_sampler = None
+        if cpu_window is not None or accurate:
+            if cpu_window is None:
+                cpu_window = 1.0
+            cpu_sampler = CpuSampler(window=cpu_window, min_interval=cpu_window, accurate=accurate)
+        adapter = SystemAdapter(
+            cpu_sampler=cpu_sampler,
+            disk_probe=DiskProbe(
+                include=mounts,
+                exclude=excluded_mounts,
+                timeout=1.0 if disk_timeout is None else disk_timeout
+            )
+        )
     system_metrics = adapter.get_system_metrics()
     
     health_result = CalculateSystemHealthUseCase.execute(system_metrics)
+    if hasattr(adapter, "get_anomalies"):
+        # A one-off check has no baseline; the daemon has followed this host
+        try:
+            health_result["anomalies"] = [anomaly.message for anomaly in adapter.get_anomalies()]
+        except RuntimeError:
+            pass  # a daemon from before anomaly detection
     
-    click.echo(f"\n{health_result['emoji']} Overall Health: {health_result['overall_score']:.0f}/100")
-    click.echo(f"Status: {health_result['status'].upper()}\n")
-    
-    click.echo("📊 Component Scores:")
-    for component, score in health_result['scores'].items():
-        if score >= 80:
-            color = "green"
-        elif score >= 60:
-            color = "yellow"
+    with OutputWriter() as out:
+        if output_format != "table":
+            from dataclasses import asdict
+            
+            write_document(out, output_format, {
+                "overall_score": health_result["overall_score"],
+                "status": health_result["status"],
+                "is_healthy": health_result["is_healthy"],
+                "scores": health_result["scores"],
+                "warnings": health_result["warnings"],
+                "anomalies": health_result["anomalies"],
+                "metrics": asdict(system_metrics),
+            })
+            return
+        
+        out.line(
+            f"\n{health_result['emoji']} Overall Health: {health_result['overall_score']:.0f}/100"
+        )
+        out.line(f"Status: {health_result['status'].upper()}\n")
+        
+        out.line("📊 Component Scores:")
+        for component, score in health_result['scores'].items():
+            if score >= 80:
+                color = "green"
+            elif score >= 60:
+                color = "yellow"
+            else:
+                color = "red"
+            
+            out.line(f"  • {component.upper()}: " + click.style(f"{score:.0f}/100", fg=color))
+        
+        if len(system_metrics.disks) > 1 or any(
+            not disk.responding for disk in system_metrics.disks
+        ):
+            out.line("\n💽 Volumes:")
+            for disk in system_metrics.disks:
+                if disk.responding:
+                    out.line(
+                        f"  • {disk.mountpoint}: {disk.percent:.1f}% of {disk.total_gb:.0f} GB"
+                    )
+                else:
+                    out.line(click.style(f"  • {disk.mountpoint}: not responding", fg="red"))
+        
+        io = system_metrics.io
+        if io is not None:
+            out.line("\n📡 I/O:")
+            for label, rate, read, written, ops in (
+                ("Disk", io.disk, "read", "written", "IOPS"),
+                ("Network", io.network, "received", "sent", "packets/s"),
+            ):
+                line = (
+                    f"  • {label}: {rate.read_bytes_per_sec / 1024 ** 2:.2f} MB/s {read}, "
+                    f"{rate.write_bytes_per_sec / 1024 ** 2:.2f} MB/s {written}, "
+                    f"{rate.read_ops_per_sec + rate.write_ops_per_sec:.0f} {ops}"
+                )
+                if rate.busy_percent is not None:
+                    line += f", {rate.busy_percent:.0f}% busy"
+                out.line(line)
+        
+        if health_result['warnings']:
+            out.line("\n⚠️  Warnings:")
+            for warning in health_result['warnings']:
+                out.line(click.style(f"  • {warning}", fg="yellow"))
         else:
-            color = "red"
+            out.line(click.style("\n✅ No warnings - system is healthy!", fg="green"))
         
-        click.echo(f"  • {component.upper()}: ", nl=False)
-        click.echo(click.style(f"{score:.0f}/100", fg=color))
+        _write_anomalies(out, health_result["anomalies"])
+        out.line()
+
+
+def _top_groups(
+    processes, group: str, sort: str, top: int, filter: str, output_format: str
+) -> None:
+    """Aggregates processes into groups and writes the top groups."""
+    from mico.domain.use_cases.group_processes import GroupProcessesUseCase
+    from mico.output import GROUP_FIELDS, OutputWriter, group_record, write_records
     
-    if health_result['warnings']:
-        click.echo("\n⚠️  Warnings:")
-        for warning in health_result['warnings']:
-            click.echo(click.style(f"  • {warning}", fg="yellow"))
-    else:
-        click.echo(click.style("\n✅ No warnings - system is healthy!", fg="green"))
+    groups = GroupProcessesUseCase.execute(
+        processes,
+        group_by=group,
+        sort_by=sort,
+        reverse=True,
+        top_n=top or sys.maxsize
+    )
     
-    click.echo()
+    with OutputWriter() as out:
+        if output_format != "table":
+            write_records(out, output_format, map(group_record, groups), GROUP_FIELDS)
+            return
+        
+        if not groups:
+            out.line(
+                f"No processes found matching filter: {filter}" if filter else "No processes found."
+            )
+            return
+        
+        label = {"tree": "Process Trees", "app": "Applications", "user": "Users"}[group]
+        out.line(f"\n📊 Top {len(groups)} {label} (sorted by {sort})\n")
+        out.line(
+            f"{'PID':<8} {'Name':<30} {'Procs':>6} {'Memory (MB)':>15} {'Memory (%)':>11}  {'User'}"
+        )
+        out.line("-" * 85)
+        for entry in groups:
+            pid = "" if entry.pid is None else entry.pid
+            name = entry.name[:28] + ".." if len(entry.name) > 30 else entry.name
+            out.line(
+                f"{pid:<8} {name:<30} {entry.count:>6} {entry.rss_mb:>12.2f} MB "
+                f"{entry.percent or 0.0:>10.2f}%  {entry.username or ''}"
+            )
+        out.line()
+
+
+def _prime_process_cpu(adapter, interval: float) -> None:
+    """Takes the first CPU-times reading and waits out the shared interval."""
+    if getattr(adapter, "cpu_tracker", None) is None:
+        return
+    import time
+    
+    adapter.prime_process_cpu()
+    time.sleep(interval)
+
+
+def _write_process_table(
+    out,
+    processes,
+    show_user: bool = True,
+    accurate: bool = False,
+    show_cpu: bool = False
+) -> None:
+    """
+    Writes processes as the PID/Name/Memory/User table, with a CPU column
+    and USS/PSS columns when requested.
+    """
+    user_header = "User" if show_user else ""
+    cpu_header = f"{'CPU (%)':>8} " if show_cpu else ""
+    full_header = f"{'USS (MB)':>12} {'PSS (MB)':>12} " if accurate else ""
+    out.line(
+        f"{'PID':<8} {'Name':<30} {cpu_header}{'Memory (MB)':<15} {full_header}"
+        f"{'Memory (%)':<12} {user_header}"
+    )
+    out.line("-" * (85 + (26 if accurate else 0) + (9 if show_cpu else 0)))
+    
+    for process in processes:
+        memory_percent = process.memory.percent or 0.0
+        username = process.username or "N/A" if show_user else ""
+        name = process.name[:28] + ".." if len(process.name) > 30 else process.name
+        cpu = ""
+        if show_cpu:
+            cpu = f"{'-':>8} " if process.cpu_percent is None else f"{process.cpu_percent:>7.1f}% "
+        full = ""
+        if accurate:
+            full = "".join(
+                f"{'-':>12} " if value is None else f"{value:>12.2f} "
+                for value in (process.memory.uss_mb, process.memory.pss_mb)
+            )
+        
+        out.line(
+            f"{process.pid:<8} {name:<30} {cpu}{process.memory.rss_mb:>12.2f} MB "
+            f"{full}{memory_percent:>10.2f}%  {username}"
+        )
+
+
+def _write_anomalies(out, messages) -> None:
+    """Writes anomaly messages under their own heading, if there are any."""
+    if not messages:
+        return
+    out.line("\n🔍 Anomalies:")
+    for message in messages:
+        out.line(click.style(f"  • {message}", fg="magenta"))
 
 
 if __name__ == "__main__":
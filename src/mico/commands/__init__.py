@@ -0,0 +1,5 @@
+"""
+CLI commands other than memory, top and health.
+
+They are imported by mico.cli only when run, see LAZY_COMMANDS.
+"""
@@ -0,0 +1,135 @@
+"""
+Long-running services: the daemon and the Prometheus exporter.
+"""
+
+import sys
+import click
+
+
+@click.command()
+@click.option(
+    "--interval",
+    "-i",
+    default=2.0,
+    type=click.FloatRange(min=0.1),
+    help="Seconds between snapshot refreshes (default: 2)"
+)
+@click.option(
+    "--history-size",
+    default=3600,
+    type=click.IntRange(min=1),
+    help="Metrics samples kept for 'mico history' (default: 3600)"
+)
+@click.pass_context
+def daemon(ctx: click.Context, interval: float, history_size: int):
+    """
+    Run a resident collector that serves warm snapshots.
+    
+    While the daemon is running, top, memory and health answer from its
+    in-memory snapshot over a local Unix socket instead of walking every
+    process themselves. Per-process CPU usage is measured between
+    refreshes, so 'top --sort cpu' answers without waiting.
+    
+    Example:
+    
+      mico daemon --interval 5
+    """
+    import signal
+    from mico.adapters.cpu import CpuSampler
+    from mico.adapters.daemon import DaemonServer
+    from mico.adapters.incremental import IncrementalSystemAdapter
+    
+    sampler = CpuSampler(window=interval).start()
+    server = DaemonServer(
+        IncrementalSystemAdapter(cpu_sampler=sampler, process_cpu=True),
+        socket_path=ctx.obj.get("socket_path"),
+        interval=interval,
+        history_size=history_size
+    )
+    
+    try:
+        server.start()
+    except RuntimeError as exc:
+        raise click.ClickException(str(exc))
+    
+    click.echo(f"mico daemon listening on {server.socket_path} (refresh every {interval:g}s)")
+    # Treat SIGTERM like Ctrl-C so the socket file is cleaned up
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sampler.stop()
+
+
+@click.command()
+@click.option(
+    "--host",
+    default="127.0.0.1",
+    help="Address to listen on (default: 127.0.0.1)"
+)
+@click.option(
+    "--port",
+    "-p",
+    default=9721,
+    type=click.IntRange(min=0, max=65535),
+    help="Port to listen on (default: 9721)"
+)
+@click.option(
+    "--max-age",
+    default=5.0,
+    type=click.FloatRange(min=0.0),
+    help="Seconds a collection answers scrapes before a new one is made (default: 5)"
+)
+@click.option(
+    "--top",
+    "-t",
+    default=10,
+    type=click.IntRange(min=0),
+    help="Number of processes whose RSS is published (default: 10)"
+)
+@click.pass_context
+def serve(ctx: click.Context, host: str, port: int, max_age: float, top: int):
+    """
+    Serve metrics, health scores and top processes to Prometheus.
+    
+    Metrics are published in the OpenMetrics format at /metrics.
+    Scrapes arriving within --max-age seconds, including concurrent
+    scrapes from several Prometheus replicas, share one collection.
+    
+    Example:
+    
+      mico serve --port 9721 --max-age 10
+    """
+    import signal
+    import threading
+    from mico.adapters.exporter import ExporterServer, MetricsExporter
+    
+    sampler = None
+    adapter = ctx.obj.get("adapter")
+    if adapter is None:
+        from mico.adapters.cpu import CpuSampler
+        from mico.adapters.incremental import IncrementalSystemAdapter
+        
+        # A background sampler keeps CPU readings from blocking scrapes
+        sampler = CpuSampler(window=max(max_age, 1.0)).start()
+        adapter = IncrementalSystemAdapter(cpu_sampler=sampler)
+    
+    server = ExporterServer(MetricsExporter(adapter, max_age=max_age, top_n=top), host, port)
+    try:
+        server.start()
+    except OSError as exc:
+        raise click.ClickException(f"Cannot listen on {host}:{port}: {exc}")
+    
+    bound_host, bound_port = server.address
+    click.echo(f"mico exporter serving http://{bound_host}:{bound_port}/metrics")
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        if sampler is not None:
+            sampler.stop()
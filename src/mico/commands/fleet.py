@@ -0,0 +1,170 @@
+"""
+Commands for fleets of hosts: dump and fleet.
+"""
+
+import click
+from mico.cli import _format_option, _get_adapter
+
+
+@click.command()
+@click.argument("path", default="-", type=click.Path(dir_okay=False, allow_dash=True))
+@click.option(
+    "--host",
+    default=None,
+    help="Host name recorded in the dump (default: this host's name)"
+)
+@click.pass_context
+def dump(ctx: click.Context, path: str, host: str):
+    """
+    Dump this host's processes and metrics for 'mico fleet'.
+    
+    Writes one JSON document to PATH, or to stdout when PATH is '-'
+    (the default). A path ending in .gz is gzip-compressed.
+    
+    Examples:
+    
+      mico dump "/shared/fleet/$(hostname).json.gz"
+    
+      mico dump | ssh collector 'cat > fleet/web-01.json'
+    """
+    import json
+    from mico.adapters.fleet import dump_document, write_dump
+    
+    adapter = _get_adapter(ctx, processes=True)
+    document = dump_document(adapter.get_process_snapshot(), adapter.get_system_metrics(), host)
+    if path == "-":
+        click.echo(json.dumps(document, separators=(",", ":")))
+    else:
+        write_dump(path, document)
+
+
+@click.command()
+@click.argument("directory", type=click.Path(exists=True, file_okay=False))
+@click.option(
+    "--top",
+    "-t",
+    default=10,
+    type=click.IntRange(min=1),
+    help="Number of processes to rank across the fleet (default: 10)"
+)
+@click.option(
+    "--hosts",
+    "-n",
+    default=20,
+    type=click.IntRange(min=1),
+    help="Number of least healthy hosts to list (default: 20)"
+)
+@click.option(
+    "--sort",
+    "-s",
+    type=click.Choice(["mem", "cpu"], case_sensitive=False),
+    default="mem",
+    help="Rank processes by mem (RSS) or cpu (default: mem)"
+)
+@click.option(
+    "--status",
+    "statuses",
+    multiple=True,
+    type=click.Choice(["critical", "warning", "healthy"], case_sensitive=False),
+    help="Only list hosts with this status; repeatable"
+)
+@click.option(
+    "--workers",
+    "-j",
+    default=None,
+    type=click.IntRange(min=1),
+    help="Processes parsing dumps in parallel (default: one per CPU)"
+)
+@_format_option()
+def fleet(
+    directory: str, top: int, hosts: int, sort: str, statuses, workers: int, output_format: str
+):
+    """
+    Rank the hosts and processes of a directory of dumps.
+    
+    Reads every .json and .json.gz file written by 'mico dump' in
+    DIRECTORY, parsing and scoring them in parallel across a pool of
+    worker processes. Lists the least healthy hosts and the biggest
+    processes across the fleet; only these rankings are kept, so memory
+    stays bounded however many hosts there are.
+    
+    Examples:
+    
+      mico fleet /shared/fleet
+    
+      # Which hosts are critical?
+      mico fleet /shared/fleet --status critical --hosts 100
+    
+      # Busiest processes across the fleet, as JSON
+      mico fleet /shared/fleet --sort cpu --top 25 --format json
+    """
+    from dataclasses import asdict
+    from mico.adapters.fleet import iter_dump_paths, summarize_fleet
+    from mico.output import OutputWriter, write_document
+    
+    report = summarize_fleet(
+        iter_dump_paths(directory),
+        sort=sort,
+        top_processes=top,
+        top_hosts=hosts,
+        statuses=statuses,
+        workers=workers
+    )
+    
+    with OutputWriter() as out:
+        if output_format != "table":
+            write_document(out, output_format, {
+                "summary": report.summary(),
+                "hosts": [asdict(host) for host in report.hosts],
+                "processes": [asdict(process) for process in report.processes],
+                "errors": [message for _, message in report.errors],
+            })
+            return
+    
+        _write_fleet(out, report)
+
+
+def _write_fleet(out, report) -> None:
+    """Writes the fleet rankings as tables."""
+    summary = report.summary()
+    out.line(
+        f"\n🌐 Fleet: {summary['hosts']} hosts — "
+        + click.style(f"{summary['critical']} critical", fg="red") + ", "
+        + click.style(f"{summary['warning']} warning", fg="yellow") + ", "
+        + click.style(f"{summary['healthy']} healthy", fg="green")
+    )
+    for _, message in report.errors:
+        out.line(click.style(f"  • Skipped {message}", fg="yellow"))
+    
+    hosts = report.hosts
+    if hosts:
+        colors = {"critical": "red", "warning": "yellow", "healthy": "green"}
+        out.line("\n🩺 Least healthy hosts\n")
+        out.line(
+            f"{'Host':<24} {'Score':>6} {'Status':<9} {'CPU':>6} {'Memory':>7} {'Disk':>6}  Warning"
+        )
+        out.line("-" * 90)
+        for host in hosts:
+            name = host.host[:21] + "..." if len(host.host) > 24 else host.host
+            out.line(
+                f"{name:<24} {host.overall_score:>6.0f} "
+                + click.style(f"{host.status:<9}", fg=colors.get(host.status))
+                + f" {host.cpu_percent:>5.1f}% {host.memory_percent:>6.1f}%"
+                + f" {host.disk_percent:>5.1f}%"
+                + f"  {host.warnings[0] if host.warnings else ''}"
+            )
+    
+    processes = report.processes
+    if processes:
+        out.line(f"\n📊 Top {len(processes)} processes across the fleet (sorted by {report.sort})\n")
+        out.line(f"{'Host':<24} {'PID':<8} {'Name':<30} {'Memory':>12} {'CPU':>7}")
+        out.line("-" * 85)
+        for process in processes:
+            host = process.host[:21] + "..." if len(process.host) > 24 else process.host
+            name = process.name[:27] + "..." if len(process.name) > 30 else process.name
+            cpu = "-" if process.cpu_percent is None else f"{process.cpu_percent:.1f}%"
+            out.line(
+                f"{host:<24} {process.pid:<8} {name:<30} "
+                f"{process.rss_bytes / 1024 ** 2:>9.2f} MB {cpu:>7}"
+            )
+    out.line()
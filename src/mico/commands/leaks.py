@@ -0,0 +1,136 @@
+"""
+The leaks command, ranking processes by memory growth.
+"""
+
+import sys
+import click
+from mico.cli import _format_option
+
+
+@click.command()
+@click.option(
+    "--interval",
+    "-i",
+    default=30.0,
+    type=click.FloatRange(min=0.0),
+    help="Seconds between RSS readings (default: 30)"
+)
+@click.option(
+    "--duration",
+    "-d",
+    default=3600.0,
+    type=click.FloatRange(min=0.0),
+    help="Seconds to sample for; 0 samples until interrupted (default: 3600)"
+)
+@click.option(
+    "--min-duration",
+    default=600.0,
+    type=click.FloatRange(min=0.0),
+    help="Seconds a process must have been followed to be ranked (default: 600)"
+)
+@click.option(
+    "--min-confidence",
+    default=0.8,
+    type=click.FloatRange(min=0.0, max=1.0),
+    help="Smallest R² of the RSS trend, 0-1 (default: 0.8)"
+)
+@click.option(
+    "--min-growth",
+    default=0.0,
+    type=float,
+    help="Smallest growth in MB/hour to report (default: 0)"
+)
+@click.option(
+    "--top",
+    "-t",
+    default=10,
+    type=click.IntRange(min=1),
+    help="Number of processes to show (default: 10)"
+)
+@_format_option()
+@click.pass_context
+def leaks(
+    ctx: click.Context,
+    interval: float,
+    duration: float,
+    min_duration: float,
+    min_confidence: float,
+    min_growth: float,
+    top: int,
+    output_format: str
+):
+    """
+    Find processes whose memory keeps growing.
+    
+    Reads the RSS of every process at each interval and keeps a running
+    least-squares trend per process (by PID and start time), without
+    storing the readings, so it can be left running for days. Processes
+    are ranked by growth in MB/hour; the confidence is the R² of the
+    trend, which stays low for memory that jumps once or swings up and
+    down. The table is refreshed after every reading.
+    
+    Examples:
+    
+      # Sample for an hour, every 30 seconds
+      mico leaks
+      
+      # Keep watching until interrupted, ranking after 30 minutes of data
+      mico leaks --duration 0 --interval 60 --min-duration 1800
+      
+      # Only steady growth of at least 5 MB/hour, as JSON
+      mico leaks --min-confidence 0.95 --min-growth 5 --format json
+    """
+    import time
+    from mico.domain.leaks import LeakTracker
+    from mico.output import LEAK_FIELDS, OutputWriter, leak_record, write_records
+    
+    adapter = ctx.obj.get("adapter")
+    if adapter is None:
+        from mico.adapters.system import default_adapter
+        
+        adapter = default_adapter(usernames=False)
+    
+    tracker = LeakTracker()
+    interactive = sys.stdout.isatty() and output_format == "table"
+    out = OutputWriter()
+    started = time.monotonic()
+    suspects = []
+    try:
+        while True:
+            tick = time.monotonic()
+            tracker.update(time.time(), adapter.iter_rss())
+            suspects = tracker.suspects(min_duration, min_confidence, min_growth, top)
+            elapsed = tick - started
+            finished = duration and elapsed + interval > duration
+            if output_format == "table" and (interactive or finished):
+                if interactive:
+                    click.clear()
+                _write_leaks(out, suspects, len(tracker), elapsed)
+                out.flush()
+            if finished:
+                break
+            time.sleep(max(0.0, interval - (time.monotonic() - tick)))
+    except KeyboardInterrupt:
+        if output_format == "table" and not interactive:
+            _write_leaks(out, suspects, len(tracker), time.monotonic() - started)
+    
+    if output_format != "table":
+        write_records(out, output_format, map(leak_record, suspects), LEAK_FIELDS)
+    out.flush()
+
+
+def _write_leaks(out, suspects, tracked: int, elapsed: float) -> None:
+    """Writes the leak ranking as a table."""
+    out.line(f"\n💧 Memory growth over {elapsed:.0f}s ({tracked} processes tracked)\n")
+    if not suspects:
+        out.line("No process shows sustained memory growth yet.")
+        return
+    
+    out.line(f"{'PID':<8} {'Name':<30} {'MB/hour':>10} {'R²':>6} {'RSS':>12} {'Followed':>10}")
+    out.line("-" * 81)
+    for suspect in suspects:
+        name = suspect.name[:27] + "..." if len(suspect.name) > 30 else suspect.name
+        out.line(
+            f"{suspect.pid:<8} {name:<30} {suspect.growth_mb_per_hour:>10.2f} "
+            f"{suspect.r_squared:>6.2f} {suspect.rss_mb:>9.2f} MB {suspect.duration / 60:>7.0f} min"
+        )
@@ -0,0 +1,147 @@
+"""
+Commands for recordings: record and replay.
+"""
+
+import click
+from mico.cli import health, memory, top
+
+
+@click.command()
+@click.argument("path", type=click.Path(dir_okay=False, writable=True))
+@click.option(
+    "--interval",
+    "-i",
+    default=2.0,
+    type=click.FloatRange(min=0.0),
+    help="Seconds between ticks (default: 2)"
+)
+@click.option(
+    "--count",
+    "-n",
+    default=0,
+    type=click.IntRange(min=0),
+    help="Number of ticks to record (default: 0, record until interrupted)"
+)
+@click.pass_context
+def record(ctx: click.Context, path: str, interval: float, count: int):
+    """
+    Record processes and metrics to a compact binary file.
+    
+    Every tick stores system metrics and one fixed-size row per process;
+    names and users are written once per file. Replay the file with
+    'mico replay'.
+    
+    Example:
+    
+      # One tick every 5 seconds for an hour
+      mico record host.mrec --interval 5 --count 720
+    """
+    import os
+    import time
+    from mico.adapters.recording import Recorder
+    
+    sampler = None
+    adapter = ctx.obj.get("adapter")
+    if adapter is None:
+        from mico.adapters.cpu import CpuSampler
+        from mico.adapters.incremental import IncrementalSystemAdapter
+        
+        sampler = CpuSampler(window=max(interval, 0.1)).start()
+        adapter = IncrementalSystemAdapter(cpu_sampler=sampler, process_cpu=True)
+    
+    click.echo(f"Recording to {path} every {interval:g}s (Ctrl-C to stop)")
+    recorder = Recorder(path)
+    try:
+        while True:
+            started = time.monotonic()
+            recorder.record(
+                adapter.get_process_snapshot(),
+                adapter.get_system_info(),
+                adapter.get_system_metrics()
+            )
+            if count and recorder.ticks >= count:
+                break
+            time.sleep(max(0.0, interval - (time.monotonic() - started)))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        recorder.close()
+        if sampler is not None:
+            sampler.stop()
+    
+    click.echo(f"Recorded {recorder.ticks} ticks ({os.path.getsize(path) / 1024:.1f} KB)")
+
+
+@click.group(invoke_without_command=True)
+@click.argument("path", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--tick",
+    type=int,
+    default=None,
+    help="Tick to replay; negative values count from the end (default: the last)"
+)
+@click.option(
+    "--at",
+    type=click.FloatRange(min=0.0),
+    default=None,
+    help="Replay the tick recorded this many seconds after the first one"
+)
+@click.pass_context
+def replay(ctx: click.Context, path: str, tick: int, at: float):
+    """
+    Run top, memory or health against a recorded instant.
+    
+    Without a command, prints what the recording contains. Replay
+    options go before the file, command options after the command.
+    
+    Examples:
+    
+      mico replay host.mrec
+      
+      # Top processes ten minutes into the recording
+      mico replay --at 600 host.mrec top --top 5
+      
+      # Health at the first tick
+      mico replay --tick 0 host.mrec health
+    """
+    import time
+    from mico.adapters.recording import Recording, RecordingError, ReplayAdapter
+    
+    if tick is not None and at is not None:
+        raise click.UsageError("Use either --tick or --at, not both")
+    
+    try:
+        recording = Recording(path)
+    except RecordingError as exc:
+        raise click.ClickException(str(exc))
+    ctx.call_on_close(recording.close)
+    if not len(recording):
+        raise click.ClickException(f"{path} holds no ticks")
+    
+    if at is not None:
+        tick = recording.index_at(recording.timestamps[0] + at)
+    try:
+        adapter = ReplayAdapter(recording, -1 if tick is None else tick)
+    except IndexError as exc:
+        raise click.BadParameter(str(exc), param_hint="--tick")
+    ctx.obj["adapter"] = adapter
+    
+    if ctx.invoked_subcommand is None:
+        first, last = recording.timestamps[0], recording.timestamps[-1]
+        stamp = "%Y-%m-%d %H:%M:%S"
+        click.echo(f"\n🎞  {path}\n")
+        click.echo(f"Ticks:      {len(recording)}")
+        click.echo(f"From:       {time.strftime(stamp, time.localtime(first))}")
+        click.echo(
+            f"To:         {time.strftime(stamp, time.localtime(last))} ({last - first:.0f}s)"
+        )
+        click.echo(f"Strings:    {len(recording.strings)}")
+        click.echo(
+            f"Replaying:  tick {adapter.index} at "
+            f"{time.strftime(stamp, time.localtime(adapter.timestamp))}\n"
+        )
+
+
+replay.add_command(top)
+replay.add_command(memory)
+replay.add_command(health)
@@ -0,0 +1,279 @@
+"""
+Commands following the system over time: watch and history.
+"""
+
+import sys
+import click
+from mico.cli import (
+    _format_option,
+    _prime_process_cpu,
+    _require_live_host,
+    _write_anomalies,
+    _write_process_table,
+)
+
+
+def _stamped(anomaly) -> str:
+    """Returns an anomaly message prefixed with the time of the reading."""
+    import time
+    
+    return f"{time.strftime('%H:%M:%S', time.localtime(anomaly.timestamp))}  {anomaly.message}"
+
+
+def _write_history_summary(out, summary) -> None:
+    """Writes a MetricsHistory summary as one row per metric."""
+    stats = list(next(iter(summary["metrics"].values())))
+    out.line(f"{'Metric':<8} " + " ".join(f"{name:>8}" for name in stats))
+    out.line("-" * (9 + 9 * len(stats)))
+    
+    for metric, values in summary["metrics"].items():
+        cells = " ".join(
+            f"{'-':>8}" if value is None else f"{value:>7.1f}%" for value in values.values()
+        )
+        out.line(f"{metric.upper():<8} {cells}")
+
+
+@click.command()
+@click.option(
+    "--interval",
+    "-i",
+    default=2.0,
+    type=click.FloatRange(min=0.0),
+    help="Seconds between refreshes (default: 2)"
+)
+@click.option(
+    "--top",
+    "-t",
+    default=10,
+    type=int,
+    help="Number of processes to display (default: 10)"
+)
+@click.option(
+    "--sort",
+    "-s",
+    type=click.Choice(["mem", "cpu", "name", "pid"], case_sensitive=False),
+    default="mem",
+    help="Sort criteria: mem (memory), cpu, name, or pid (default: mem)"
+)
+@click.option(
+    "--filter",
+    "-f",
+    default="",
+    help="Filter by name or PID, or by terms such as 'user:www rss>500M name~^nginx'"
+)
+@click.option(
+    "--iterations",
+    "-n",
+    default=0,
+    type=click.IntRange(min=0),
+    help="Number of refreshes before exiting (default: 0, run until interrupted)"
+)
+@click.option(
+    "--window",
+    "-w",
+    default=300.0,
+    type=click.FloatRange(min=0.0, min_open=True),
+    help="Seconds of metrics history summarised below the table (default: 300)"
+)
+@click.option(
+    "--accurate",
+    is_flag=True,
+    help="Read USS/PSS of the top candidates and rank memory by USS"
+)
+@_format_option("table", "ndjson", "csv")
+@click.pass_context
+def watch(
+    ctx: click.Context,
+    interval: float,
+    top: int,
+    sort: str,
+    filter: str,
+    iterations: int,
+    window: float,
+    accurate: bool,
+    output_format: str
+):
+    """
+    Continuously display top processes.
+    
+    Processes are tracked between refreshes, so each tick only re-reads
+    memory counters of known processes, reads new processes in full and
+    drops the ones that exited. With --sort cpu, CPU usage covers the
+    time between ticks. System metrics of every tick are kept in a ring
+    buffer and summarised below the table, together with readings that
+    strayed from their usual level during the window.
+    
+    Examples:
+    
+      # Refresh every second
+      mico watch --interval 1
+      
+      # Three refreshes of the top 5 python processes
+      mico watch -n 3 --top 5 --filter python
+      
+      # Rank by USS; each process is re-read at most every 10 seconds
+      mico watch --accurate
+      
+      # Stream every tick as NDJSON rows stamped with the tick time
+      mico watch --format ndjson | jq .
+    """
+    import time
+    from mico.domain.use_cases.filter_processes import FilterProcessesUseCase
+    from mico.domain.use_cases.list_processes import ListProcessesUseCase
+    from mico.output import PROCESS_FIELDS, OutputWriter, process_record, write_records
+    
+    from mico.domain.anomaly import AnomalyDetector
+    from mico.domain.filters import compile_filter
+    from mico.domain.history import MetricsHistory
+    
+    try:
+        compile_filter(filter)
+    except ValueError as exc:
+        raise click.BadParameter(str(exc), param_hint="--filter")
+    
+    adapter = ctx.obj.get("adapter")
+    if adapter is None:
+        from mico.adapters.incremental import IncrementalSystemAdapter
+        
+        adapter = IncrementalSystemAdapter(process_cpu=sort == "cpu")
+    if accurate and not hasattr(adapter, "read_full_memory"):
+        # A recording or an injected adapter has no USS/PSS to offer
+        _require_live_host(ctx, "--accurate")
+    if sort == "cpu":
+        # Later ticks measure CPU between ticks; this gives the first one a reading
+        _prime_process_cpu(adapter, min(interval, 0.5))
+    
+    # Enough samples to cover the window at the refresh interval
+    history = MetricsHistory(max(1, int(window / max(interval, 0.1)) + 1))
+    detector = AnomalyDetector()
+    anomalies = []
+    interactive = sys.stdout.isatty() and output_format == "table"
+    out = OutputWriter()
+    tick = 0
+    try:
+        while True:
+            started = time.monotonic()
+            snapshot = adapter.get_process_snapshot()
+            matching_processes = FilterProcessesUseCase.stream(snapshot, filter)
+            if accurate and sort == "mem":
+                # USS/PSS reads are cached between ticks by the adapter
+                sorted_processes = ListProcessesUseCase.execute_accurate(
+                    matching_processes, adapter.read_full_memory, top_n=top or sys.maxsize
+                )
+            else:
+                sorted_processes = ListProcessesUseCase.execute(
+                    matching_processes,
+                    sort_by=sort,
+                    reverse=True,
+                    top_n=top or sys.maxsize
+                )
+                if accurate:
+                    sorted_processes = adapter.read_full_memory(sorted_processes)
+            elapsed_ms = (time.monotonic() - started) * 1000
+            metrics = adapter.get_system_metrics()
+            history.append(metrics, snapshot.timestamp)
+            anomalies.extend(detector.update(metrics, snapshot.timestamp))
+            anomalies = [
+                anomaly for anomaly in anomalies if anomaly.timestamp >= snapshot.timestamp - window
+            ]
+            
+            if output_format != "table":
+                write_records(
+                    out,
+                    output_format,
+                    (
+                        {"timestamp": snapshot.timestamp, **process_record(p)}
+                        for p in sorted_processes
+                    ),
+                    ("timestamp",) + PROCESS_FIELDS,
+                    header=tick == 0,
+                )
+            else:
+                if interactive:
+                    click.clear()
+                stamp = time.strftime("%H:%M:%S", time.localtime(snapshot.timestamp))
+                out.line(
+                    f"\n👀 {stamp}  {len(snapshot)} processes, refreshed in {elapsed_ms:.1f} ms "
+                    f"(every {interval:g}s, sorted by {sort})\n"
+                )
+                _write_process_table(
+                    out, sorted_processes, accurate=accurate, show_cpu=sort == "cpu"
+                )
+                out.line(f"\n📈 Last {window:g}s ({len(history)} samples)\n")
+                _write_history_summary(out, history.summary(window))
+                _write_anomalies(out, [_stamped(anomaly) for anomaly in anomalies])
+            out.flush()
+            
+            tick += 1
+            if iterations and tick >= iterations:
+                break
+            time.sleep(max(0.0, interval - (time.monotonic() - started)))
+    except KeyboardInterrupt:
+        pass
+
+
+@click.command()
+@click.option(
+    "--window",
+    "-w",
+    default=None,
+    type=click.FloatRange(min=0.0, min_open=True),
+    help="Seconds of history to summarise (default: everything the daemon kept)"
+)
+@click.option(
+    "--percentile",
+    "-p",
+    "percentiles",
+    multiple=True,
+    type=click.FloatRange(min=0.0, max=100.0),
+    help="Percentile to report; repeat for several (default: 50, 95, 99)"
+)
+@_format_option()
+@click.pass_context
+def history(ctx: click.Context, window: float, percentiles, output_format: str):
+    """
+    Summarise recent CPU, memory and disk usage.
+    
+    The running daemon keeps every refresh in a fixed-size ring buffer;
+    this command reports min, mean, max and percentiles over a window of
+    it, and lists the readings the daemon found far from their usual
+    level. 'mico watch' shows the same summary below its table.
+    
+    Examples:
+    
+      # The last five minutes
+      mico history --window 300
+      
+      # Median and 90th percentile of the last hour
+      mico history -w 3600 -p 50 -p 90
+    """
+    from mico.adapters.codec import anomaly_from_dict
+    from mico.adapters.daemon import connect_daemon
+    from mico.output import OutputWriter, write_document
+    
+    client = connect_daemon(ctx.obj.get("socket_path"))
+    if client is None:
+        raise click.ClickException(
+            "No mico daemon is running; start one with 'mico daemon' to record history"
+        )
+    summary = client.get_history(window, percentiles or (50, 95, 99))
+    
+    with OutputWriter() as out:
+        if output_format != "table":
+            write_document(out, output_format, summary)
+            return
+        
+        if not summary["samples"]:
+            out.line("No metrics recorded in this window yet.")
+            return
+        
+        span = f"last {window:g}s" if window else "all history"
+        out.line(
+            f"\n📈 Metrics history ({span}: {summary['samples']} samples "
+            f"over {summary['span']:.0f}s)\n"
+        )
+        _write_history_summary(out, summary)
+        _write_anomalies(out, [
+            _stamped(anomaly_from_dict(anomaly)) for anomaly in summary.get("anomalies", ())
+        ])
+        out.line()
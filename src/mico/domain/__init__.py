@@ -1,6 +1,34 @@
-"""Domain entities and business logic."""
+"""
+Domain entities and business logic.
 
-from mico.domain.entities import MemoryInfo, SystemInfo, Process, SystemMetrics
+Entities are loaded on first access, so importing one domain module does
+not define the value objects of every other.
+"""
 
-__all__ = ["MemoryInfo", "SystemInfo", "Process", "SystemMetrics"]
+import importlib
+from typing import Any
 
+_EXPORTS = {
+    "MemoryInfo": "mico.domain.entities",
+    "SystemInfo": "mico.domain.entities",
+    "Process": "mico.domain.entities",
+    "ProcessGroup": "mico.domain.entities",
+    "ProcessSnapshot": "mico.domain.entities",
+    "SystemMetrics": "mico.domain.entities",
+    "ProcessTable": "mico.domain.process_table",
+    "DiskUsage": "mico.domain.metrics",
+    "IOMetrics": "mico.domain.metrics",
+    "IORate": "mico.domain.metrics",
+}
+
+__all__ = [
+    "MemoryInfo", "SystemInfo", "Process", "ProcessGroup", "ProcessSnapshot", "ProcessTable",
+    "SystemMetrics", "DiskUsage", "IOMetrics", "IORate",
+]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module), name)
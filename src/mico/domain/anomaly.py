@@ -0,0 +1,193 @@
+"""Anomaly detection - Streaming EWMA baselines for system metrics."""
+
+import math
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+from mico.domain.entities import SystemMetrics
+
+
+# Metric name -> (label, reading from SystemMetrics or None when not measured)
+METRICS: Dict[str, tuple] = {
+    "cpu": ("CPU usage", lambda metrics: metrics.cpu_percent),
+    "memory": ("memory usage", lambda metrics: metrics.memory_percent),
+    "disk": ("disk usage", lambda metrics: metrics.disk_percent),
+    "disk_io": ("disk busy time", lambda metrics: metrics.io and metrics.io.disk.busy_percent),
+    "network": ("link utilisation", lambda metrics: metrics.io and metrics.io.network.busy_percent),
+}
+
+
+@dataclass(frozen=True)
+class Anomaly:
+    """
+    Value Object - A reading far from its metric's usual level.
+
+    Attributes:
+        metric: Metric name ("cpu", "memory", "disk", "disk_io", "network")
+        value: The reading, in percent
+        mean: Usual level of the metric before this reading
+        stddev: Usual spread of the metric before this reading
+        timestamp: Time of the reading in seconds since the epoch
+    """
+
+    metric: str
+    value: float
+    mean: float
+    stddev: float
+    timestamp: float
+
+    @property
+    def deviation(self) -> float:
+        """Distance from the usual level in standard deviations (signed)."""
+        return (self.value - self.mean) / self.stddev
+
+    @property
+    def message(self) -> str:
+        """Human-readable description, in the style of the health warnings."""
+        label = METRICS[self.metric][0] if self.metric in METRICS else self.metric
+        direction = "high" if self.value > self.mean else "low"
+        return (
+            f"Unusually {direction} {label}: {self.value:.1f}% "
+            f"(usually {self.mean:.1f}% ± {self.stddev:.1f})"
+        )
+
+
+class EwmaStatistic:
+    """
+    Exponentially weighted mean and variance of one metric.
+
+    Each update is O(1) and the state is three numbers, however long
+    the metric has been followed. Recent readings weigh more: with
+    ``alpha`` = 0.05 the baseline forgets a reading's influence by half
+    after about 14 updates.
+    """
+
+    __slots__ = ("alpha", "mean", "variance", "count")
+
+    def __init__(self, alpha: float):
+        """
+        Args:
+            alpha: Weight of each new reading, between 0 and 1
+        """
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be between 0 and 1")
+        self.alpha = alpha
+        self.mean = 0.0
+        self.variance = 0.0
+        self.count = 0
+
+    @property
+    def stddev(self) -> float:
+        """Exponentially weighted standard deviation."""
+        return math.sqrt(self.variance)
+
+    def update(self, value: float) -> None:
+        """Folds one reading into the mean and variance."""
+        if self.count == 0:
+            self.mean = value
+        else:
+            difference = value - self.mean
+            increment = self.alpha * difference
+            self.mean += increment
+            self.variance = (1 - self.alpha) * (self.variance + difference * increment)
+        self.count += 1
+
+
+class AnomalyDetector:
+    """
+    Flags readings that stray from each metric's own recent baseline.
+
+    Fixed thresholds fit neither a batch host that always runs at 90% CPU
+    nor an idle one where 50% is alarming. The detector instead follows
+    every metric with an EwmaStatistic and flags a reading more than
+    ``threshold`` standard deviations from the mean. A level that
+    persists becomes the new baseline, so a sustained change is reported
+    while the baseline catches up rather than forever.
+
+    Nothing is flagged until a metric has ``warmup`` readings, and the
+    spread is never taken below ``min_stddev`` percentage points, so
+    flat metrics do not turn every small wobble into an anomaly.
+    Memory and time per update are constant.
+    """
+
+    def __init__(
+        self,
+        alpha: float = 0.05,
+        threshold: float = 3.0,
+        warmup: int = 20,
+        min_stddev: float = 2.0,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Args:
+            alpha: Weight of each new reading in the baselines
+            threshold: Standard deviations from the mean that are flagged
+            warmup: Readings of a metric before it can be flagged
+            min_stddev: Smallest spread used, in percentage points
+            clock: Wall clock stamping anomalies, replaceable in tests
+        """
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be between 0 and 1")
+        if threshold <= 0:
+            raise ValueError("threshold must be positive")
+        self.alpha = alpha
+        self.threshold = threshold
+        self.warmup = warmup
+        self.min_stddev = min_stddev
+        self.clock = clock
+        self.statistics: Dict[str, EwmaStatistic] = {}
+
+    def observe(
+        self, metric: str, value: float, timestamp: Optional[float] = None
+    ) -> Optional[Anomaly]:
+        """
+        Checks one reading against its baseline, then folds it in.
+
+        Args:
+            metric: Metric name
+            value: The reading
+            timestamp: Time of the reading (default: now)
+
+        Returns:
+            Anomaly when the reading is out of line, None otherwise
+        """
+        statistic = self.statistics.get(metric)
+        if statistic is None:
+            statistic = self.statistics[metric] = EwmaStatistic(self.alpha)
+
+        anomaly = None
+        if statistic.count >= self.warmup:
+            stddev = max(statistic.stddev, self.min_stddev)
+            if abs(value - statistic.mean) > self.threshold * stddev:
+                anomaly = Anomaly(
+                    metric,
+                    value,
+                    statistic.mean,
+                    stddev,
+                    self.clock() if timestamp is None else timestamp
+                )
+        statistic.update(value)
+        return anomaly
+
+    def update(self, metrics: SystemMetrics, timestamp: Optional[float] = None) -> List[Anomaly]:
+        """
+        Checks every measured metric of a sample.
+
+        Args:
+            metrics: Sample to check
+            timestamp: Time of the sample (default: now)
+
+        Returns:
+            Anomalies found in the sample, in metric order
+        """
+        if timestamp is None:
+            timestamp = self.clock()
+        anomalies = []
+        for metric, (_, read) in METRICS.items():
+            value = read(metrics)
+            if value is None:
+                continue
+            anomaly = self.observe(metric, value, timestamp)
+            if anomaly is not None:
+                anomalies.append(anomaly)
+        return anomalies
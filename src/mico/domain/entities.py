@@ -1,7 +1,24 @@
 """Domain entities - Core business objects."""
 
 from dataclasses import dataclass
-from typing import Optional
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional, Tuple
+
+if TYPE_CHECKING:
+    from mico.domain.metrics import DiskUsage, IOMetrics
+
+
+# Value objects of the health path, kept in mico.domain.metrics so that
+# commands which never read system metrics do not pay for defining them
+_METRICS_EXPORTS = ("DiskUsage", "IORate", "IOMetrics")
+
+
+def __getattr__(name: str) -> Any:
+    if name in _METRICS_EXPORTS:
+        from mico.domain import metrics
+        
+        return getattr(metrics, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 @dataclass(frozen=True)
@@ -19,6 +36,10 @@ class MemoryInfo:
         available_gb: Available memory in GB (for system memory)
         used_gb: Used memory in GB (for system memory)
         free_gb: Free memory in GB (for system memory)
+        uss_bytes: Unique Set Size - memory freed if the process exited (for
+            processes, only read in accurate mode)
+        pss_bytes: Proportional Set Size - RSS with shared pages split among
+            the processes sharing them (for processes, Linux only)
     """
     
     rss_bytes: Optional[int] = None
@@ -28,6 +49,8 @@ class MemoryInfo:
     available_gb: Optional[float] = None
     used_gb: Optional[float] = None
     free_gb: Optional[float] = None
+    uss_bytes: Optional[int] = None
+    pss_bytes: Optional[int] = None
     
     @property
     def rss_mb(self) -> float:
@@ -43,6 +66,20 @@ class MemoryInfo:
             return 0.0
         return self.vms_bytes / (1024 * 1024)
     
+    @property
+    def uss_mb(self) -> Optional[float]:
+        """Unique Set Size in MB, when it was read."""
+        if self.uss_bytes is None:
+            return None
+        return self.uss_bytes / (1024 * 1024)
+    
+    @property
+    def pss_mb(self) -> Optional[float]:
+        """Proportional Set Size in MB, when it was read."""
+        if self.pss_bytes is None:
+            return None
+        return self.pss_bytes / (1024 * 1024)
+    
     @property
     def total_mb(self) -> float:
         """Total memory in MB."""
@@ -88,19 +125,25 @@ class Process:
         name: Process name
         memory: Memory information for this process
         username: Username that owns the process
+        ppid: Parent process ID, when known
+        cpu_percent: CPU usage since the previous reading of the process, when
+            known (100 is one full core)
     """
     
     pid: int
     name: str
     memory: MemoryInfo
     username: Optional[str] = None
+    ppid: Optional[int] = None
+    cpu_percent: Optional[float] = None
     
     def matches_filter(self, filter_text: str) -> bool:
         """
         Domain logic - checks if process matches filter.
         
         Args:
-            filter_text: Text to filter by (name or PID)
+            filter_text: Filter expression (name, PID, or terms such as
+                user:root rss>100M, see mico.domain.filters)
         
         Returns:
             True if process matches filter
@@ -108,16 +151,80 @@ class Process:
         if not filter_text:
             return True
         
-        filter_lower = filter_text.lower()
-        return (
-            filter_lower in self.name.lower() or
-            str(self.pid) == filter_text
-        )
+        from mico.domain.filters import compile_filter
+        
+        return compile_filter(filter_text).matches(self)
     
     def __str__(self) -> str:
         return f"{self.name} (PID: {self.pid}) - {self.memory.rss_mb:.2f} MB"
 
 
+@dataclass(frozen=True)
+class ProcessGroup:
+    """
+    Value Object - Processes aggregated into one application, user or subtree.
+    
+    Attributes:
+        name: Group name (application, username, or subtree root name)
+        count: Number of processes in the group
+        rss_bytes: Total Resident Set Size of the group
+        vms_bytes: Total Virtual Memory Size of the group
+        percent: Total memory usage percentage, when known
+        pid: PID of the subtree root (process-tree groups only)
+        username: Owner of the subtree root, or the user of a user group
+    """
+    
+    name: str
+    count: int
+    rss_bytes: int
+    vms_bytes: int
+    percent: Optional[float] = None
+    pid: Optional[int] = None
+    username: Optional[str] = None
+    
+    @property
+    def rss_mb(self) -> float:
+        """Total Resident Set Size in MB."""
+        return self.rss_bytes / (1024 * 1024)
+
+
+@dataclass(frozen=True)
+class ProcessSnapshot:
+    """
+    Value Object - Processes collected in a single pass.
+
+    Iterating a snapshot yields its processes, so it can be handed
+    directly to the process use cases.
+
+    Attributes:
+        timestamp: Collection time in seconds since the epoch
+        processes: Processes observed during the pass
+        memory_total_bytes: Total system memory used for the percentages
+    """
+
+    timestamp: float
+    processes: Tuple[Process, ...]
+    memory_total_bytes: int = 0
+
+    @cached_property
+    def folded_names(self) -> Tuple[str, ...]:
+        """Casefolded process names, computed once per snapshot."""
+        names = [p.name for p in self.processes]
+        folded = {name: name.casefold() for name in set(names)}
+        return tuple(map(folded.__getitem__, names))
+    
+    @cached_property
+    def pid_index(self) -> Dict[int, int]:
+        """Position of each PID in ``processes``, for O(1) PID lookups."""
+        return {p.pid: position for position, p in enumerate(self.processes)}
+    
+    def __iter__(self) -> Iterator[Process]:
+        return iter(self.processes)
+
+    def __len__(self) -> int:
+        return len(self.processes)
+
+
 @dataclass(frozen=True)
 class SystemInfo:
     """
@@ -138,11 +245,14 @@ class SystemMetrics:
     Attributes:
         cpu_percent: CPU usage percentage
         memory_percent: Memory usage percentage
-        disk_percent: Disk usage percentage
+        disk_percent: Disk usage percentage (of the fullest volume when
+            several are checked)
         memory_total_gb: Total memory in GB
         memory_used_gb: Used memory in GB
-        disk_total_gb: Total disk space in GB
-        disk_used_gb: Used disk space in GB
+        disk_total_gb: Total disk space in GB (of the same volume)
+        disk_used_gb: Used disk space in GB (of the same volume)
+        disks: Every volume checked, when known
+        io: Disk and network throughput, when measured
     """
     
     cpu_percent: float
@@ -152,18 +262,30 @@ class SystemMetrics:
     memory_used_gb: float
     disk_total_gb: float
     disk_used_gb: float
+    disks: Tuple["DiskUsage", ...] = ()
+    io: Optional["IOMetrics"] = None
     
     @property
     def is_healthy(self) -> bool:
         """
         Determines if system is healthy based on thresholds.
         
+        Disk and network pressure count when they were measured.
+        
         Returns:
             True if system is healthy, False otherwise
         """
-        return (
+        if not (
             self.cpu_percent < 80 and
             self.memory_percent < 85 and
             self.disk_percent < 90
+        ):
+            return False
+        if self.io is None:
+            return True
+        disk_busy = self.io.disk.busy_percent
+        link_busy = self.io.network.busy_percent
+        return (
+            (disk_busy is None or disk_busy < 90) and
+            (link_busy is None or link_busy < 90)
         )
-
@@ -0,0 +1,355 @@
+"""Process filters - Compiles filter expressions into a single predicate.
+
+A filter expression is a whitespace-separated list of terms that must all
+match (AND). Within a term, alternatives separated by ``|`` are OR'd.
+
+    chrome              name contains "chrome" (case-insensitive) or PID is 42 for "42"
+    chrome|firefox      name contains "chrome" or "firefox"; 1|2 also matches PIDs 1 and 2
+    name:chrome         name contains "chrome"
+    name:chrom*         name matches the glob (case-insensitive)
+    name=nginx          name is exactly "nginx" (case-insensitive)
+    name~^nginx         name matches the regular expression (case-insensitive)
+    user:www|root       owner is www or root (globs allowed)
+    pid:100-200         PID in the inclusive range; pid:42 or pid=42 for one PID
+    pid>1000            PID comparison (>, >=, <, <=)
+    rss>500M            resident memory above 500 MiB (K, M, G, T suffixes)
+    vms<=2G             virtual memory comparison
+
+Text without any ``field:``/``field~``/``field>`` term keeps the original
+behaviour: the whole text is matched against the name, or as an exact PID.
+Plain text is always a substring match, so ``foo[1]`` finds "foo[1]"; globs
+are only expanded in ``name:`` and ``user:`` terms.
+"""
+
+import fnmatch
+import functools
+import operator
+import re
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+from mico.domain.entities import Process
+
+
+_TERM = re.compile(r"^(name|user|pid|rss|vms)(>=|<=|:|~|=|>|<)(.+)$", re.IGNORECASE)
+_SIZE = re.compile(r"^(\d+(?:\.\d+)?)\s*([kmgt]?)(?:i?b)?$", re.IGNORECASE)
+_SIZE_UNITS = {"": 1, "k": 1024, "m": 1024 ** 2, "g": 1024 ** 3, "t": 1024 ** 4}
+_COMPARISONS = {
+    ">": operator.gt, ">=": operator.ge, "<": operator.lt, "<=": operator.le,
+    "=": operator.eq, ":": operator.eq,
+}
+
+# A term alternative: (field, test). Fields are "name" (casefolded name),
+# "name_raw" (original name), "user" (username or None), "pid", "rss" and "vms".
+Alternative = Tuple[str, Callable]
+
+
+def parse_size(text: str) -> int:
+    """
+    Parses a byte size such as ``500M``, ``1.5G`` or ``4096``.
+
+    Raises:
+        ValueError: If the size cannot be parsed
+    """
+    match = _SIZE.match(text.strip())
+    if match is None:
+        raise ValueError(f"Invalid size: {text!r} (expected e.g. 512K, 500M, 1.5G)")
+    return int(float(match.group(1)) * _SIZE_UNITS[match.group(2).lower()])
+
+
+def _canonical_pid(text: str) -> Optional[int]:
+    """Returns text as a PID if it is written exactly like one."""
+    if text.isdigit() and str(int(text)) == text:
+        return int(text)
+    return None
+
+
+def _text_test(
+    value: str, exact: bool = False, glob: bool = True
+) -> Callable[[Optional[str]], bool]:
+    """Builds a case-insensitive test: glob, exact or substring."""
+    folded = value.casefold()
+    if glob and any(char in folded for char in "*?["):
+        pattern = re.compile(fnmatch.translate(folded))
+        return lambda text: text is not None and pattern.match(text) is not None
+    if exact:
+        return lambda text: text == folded
+    return lambda text: text is not None and folded in text
+
+
+class ProcessFilter:
+    """
+    Compiled filter expression.
+
+    Terms are parsed once into closures. Names are casefolded once per
+    distinct name rather than once per process. When the expression pins
+    exact PIDs, ``pids`` holds them, and ``apply`` looks them up through
+    a snapshot's PID index instead of scanning.
+    """
+
+    def __init__(self, text: str):
+        """
+        Args:
+            text: Filter expression
+
+        Raises:
+            ValueError: If the expression is invalid
+        """
+        self.text = text
+        self.terms: List[List[Alternative]] = self._parse(text)
+        self.pids: Optional[FrozenSet[int]] = self._exact_pids()
+        self._predicate = self._compile()
+
+    def _parse(self, text: str) -> List[List[Alternative]]:
+        tokens = text.split()
+        if not any(_TERM.match(token) for token in tokens):
+            return [self._alternatives(text)] if text else []
+        return [self._term(token) for token in tokens]
+
+    def _alternatives(self, text: str) -> List[Alternative]:
+        """Plain text: ``|``-separated name substrings or exact PIDs."""
+        return [alternative for value in text.split("|") for alternative in self._bare(value)]
+
+    @staticmethod
+    def _bare(text: str) -> List[Alternative]:
+        """Plain text: name substring, or exact PID."""
+        alternatives: List[Alternative] = [("name", _text_test(text, glob=False))]
+        pid = _canonical_pid(text)
+        if pid is not None:
+            alternatives.append(("pid", lambda value, pid=pid: value == pid))
+        return alternatives
+
+    def _term(self, token: str) -> List[Alternative]:
+        match = _TERM.match(token)
+        if match is None:
+            return self._alternatives(token)
+
+        field, op, value = match.group(1).lower(), match.group(2), match.group(3)
+
+        if field == "name" and op == "~":
+            try:
+                pattern = re.compile(value, re.IGNORECASE)
+            except re.error as exc:
+                raise ValueError(f"Invalid regular expression {value!r}: {exc}")
+            return [("name_raw", lambda name: pattern.search(name) is not None)]
+
+        if op == "~":
+            raise ValueError(f"'~' (regex) is only supported for name, not {field}")
+
+        alternatives = []
+        for option in value.split("|"):
+            if not option:
+                raise ValueError(f"Empty alternative in filter term {token!r}")
+            if field == "name":
+                if op not in (":", "="):
+                    raise ValueError(f"Only ':', '=' and '~' are supported for name, not {op!r}")
+                alternatives.append(("name", _text_test(option, exact=op == "=")))
+            elif field == "user":
+                if op not in (":", "="):
+                    raise ValueError(f"Only ':' and '=' are supported for user, not {op!r}")
+                test = _text_test(option, exact=True)
+                alternatives.append(
+                    ("user", lambda user, test=test: test(user.casefold() if user else None))
+                )
+            elif field == "pid":
+                alternatives.append(("pid", self._number_test(op, option, int)))
+            else:
+                alternatives.append((field, self._number_test(op, option, parse_size)))
+        return alternatives
+
+    @staticmethod
+    def _number_test(op: str, value: str, parse: Callable[[str], int]) -> Callable[[int], bool]:
+        if op == ":" and "-" in value.strip("-"):
+            low, high = value.split("-", 1)
+            try:
+                low_value, high_value = parse(low), parse(high)
+            except ValueError:
+                raise ValueError(f"Invalid range: {value!r}")
+            return lambda number: low_value <= number <= high_value
+        try:
+            bound = parse(value)
+        except ValueError:
+            raise ValueError(f"Invalid number: {value!r}")
+        compare = _COMPARISONS[op]
+        return lambda number: compare(number, bound)
+
+    def _exact_pids(self) -> Optional[FrozenSet[int]]:
+        """Returns the PIDs a term pins with pid:N / pid=N alternatives."""
+        for token, alternatives in zip(self.text.split(), self.terms):
+            match = _TERM.match(token)
+            if match is None or match.group(1).lower() != "pid" or match.group(2) not in (":", "="):
+                continue
+            options = match.group(3).split("|")
+            pids = [_canonical_pid(option) for option in options]
+            if all(pid is not None for pid in pids):
+                return frozenset(pids)
+        return None
+
+    def _compile(self) -> Callable[[Process, str], bool]:
+        """Binds every alternative to a process and chains them with and/or."""
+        getters = {
+            "name": None,
+            "name_raw": lambda p: p.name,
+            "user": lambda p: p.username,
+            "pid": lambda p: p.pid,
+            "rss": lambda p: p.memory.rss_bytes or 0,
+            "vms": lambda p: p.memory.vms_bytes or 0,
+        }
+        terms = []
+        for alternatives in self.terms:
+            predicates = []
+            for field, test in alternatives:
+                getter = getters[field]
+                if field in ("name", "name_raw", "user"):
+                    # Few distinct names and users per host: test each once
+                    test = _memoize(test)
+                if getter is None:
+                    predicates.append(lambda p, folded, test=test: test(folded))
+                else:
+                    predicates.append(lambda p, folded, test=test, get=getter: test(get(p)))
+            terms.append(_any(predicates))
+        return _all(terms)
+
+    def matches(self, process: Process, folded_name: Optional[str] = None) -> bool:
+        """
+        Checks one process against the filter.
+
+        Args:
+            process: Process to check
+            folded_name: The process name already casefolded, if known
+
+        Returns:
+            True if the process matches every term
+        """
+        if folded_name is None:
+            folded_name = process.name.casefold()
+        return self._predicate(process, folded_name)
+
+    def apply(self, processes: Iterable[Process]) -> Iterator[Process]:
+        """
+        Lazily yields the processes that match.
+
+        A ProcessSnapshot supplies its precomputed casefolded names and,
+        for exact-PID filters, its PID index. Other iterables get names
+        casefolded once per distinct name.
+
+        Args:
+            processes: Processes to filter (any iterable)
+
+        Returns:
+            Iterator over matching processes, in input order
+        """
+        if not self.terms:
+            yield from processes
+            return
+
+        predicate = self._predicate
+        pid_index = getattr(processes, "pid_index", None)
+        if self.pids is not None and pid_index is not None:
+            rows = processes.processes
+            folded_names = processes.folded_names
+            for position in sorted(pid_index[pid] for pid in self.pids if pid in pid_index):
+                if predicate(rows[position], folded_names[position]):
+                    yield rows[position]
+            return
+
+        folded_names = getattr(processes, "folded_names", None)
+        if folded_names is not None:
+            for process, folded_name in zip(processes, folded_names):
+                if predicate(process, folded_name):
+                    yield process
+            return
+
+        folded_cache: Dict[str, str] = {}
+        for process in processes:
+            folded_name = folded_cache.get(process.name)
+            if folded_name is None:
+                folded_name = folded_cache[process.name] = process.name.casefold()
+            if predicate(process, folded_name):
+                yield process
+
+    def row_test(self, table) -> Callable[[int], bool]:
+        """
+        Builds a row predicate for a ProcessTable.
+
+        String tests run once per interned name or user, and the row
+        predicate looks the results up by index.
+
+        Args:
+            table: ProcessTable to test rows of
+
+        Returns:
+            Predicate taking a row index
+        """
+        folded_names = [name.casefold() for name in table.names]
+        columns = {"pid": table.pids, "rss": table.rss, "vms": table.vms}
+
+        name_ids, user_ids = table.name_ids, table.user_ids
+        terms = []
+        for alternatives in self.terms:
+            checks = []
+            for field, test in alternatives:
+                if field in ("name", "name_raw"):
+                    source = folded_names if field == "name" else table.names
+                    hits = [test(name) for name in source]
+                    checks.append(lambda row, hits=hits: hits[name_ids[row]])
+                elif field == "user":
+                    # user_ids of -1 (unknown) index the trailing test(None)
+                    hits = [test(user) for user in table.users] + [test(None)]
+                    checks.append(lambda row, hits=hits: hits[user_ids[row]])
+                else:
+                    column = columns[field]
+                    checks.append(lambda row, column=column, test=test: test(column[row]))
+            terms.append(_any(checks))
+        return _all(terms)
+
+
+def _memoize(test: Callable[[Optional[str]], bool]) -> Callable[[Optional[str]], bool]:
+    """Caches a string test's result per distinct input."""
+    results: Dict[Optional[str], bool] = {}
+
+    def cached(text: Optional[str]) -> bool:
+        result = results.get(text)
+        if result is None:
+            result = results[text] = test(text)
+        return result
+
+    return cached
+
+
+def _any(predicates: List[Callable[..., bool]]) -> Callable[..., bool]:
+    """Chains predicates with ``or`` as nested closures, without generators."""
+    first = predicates[0]
+    if len(predicates) == 1:
+        return first
+    rest = _any(predicates[1:])
+    return lambda *args: first(*args) or rest(*args)
+
+
+def _all(predicates: List[Callable[..., bool]]) -> Callable[..., bool]:
+    """Chains predicates with ``and``; an empty list always matches."""
+    if not predicates:
+        return lambda *args: True
+    first = predicates[0]
+    if len(predicates) == 1:
+        return first
+    rest = _all(predicates[1:])
+    return lambda *args: first(*args) and rest(*args)
+
+
+@functools.lru_cache(maxsize=128)
+def compile_filter(text: str) -> ProcessFilter:
+    """
+    Compiles a filter expression.
+
+    Compiled filters are cached by expression, so callers checking one
+    process at a time (Process.matches_filter) parse it only once.
+
+    Args:
+        text: Filter expression (see module documentation)
+
+    Returns:
+        ProcessFilter for the expression
+
+    Raises:
+        ValueError: If the expression is invalid
+    """
+    return ProcessFilter(text.strip() if text else "")
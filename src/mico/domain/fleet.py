@@ -0,0 +1,220 @@
+"""Fleet aggregation - Bounded rankings of hosts and processes across many hosts."""
+
+import heapq
+from collections import Counter
+from dataclasses import dataclass
+from itertools import islice
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from mico.domain.entities import Process
+
+
+# Sort criteria of the fleet-wide process ranking, named as in ``mico top``
+SORTS = ("mem", "cpu")
+
+
+@dataclass(frozen=True)
+class HostHealth:
+    """
+    Value Object - Health of one host, as computed from its dump.
+
+    Attributes:
+        host: Host name
+        timestamp: Collection time of the dump in seconds since the epoch
+        overall_score: Overall health score (0-100)
+        status: "healthy", "warning" or "critical"
+        cpu_percent: CPU usage
+        memory_percent: Memory usage
+        disk_percent: Usage of the fullest volume
+        process_count: Number of processes in the dump
+        warnings: Health warnings, most important first
+    """
+
+    host: str
+    timestamp: float
+    overall_score: float
+    status: str
+    cpu_percent: float
+    memory_percent: float
+    disk_percent: float
+    process_count: int
+    warnings: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class FleetProcess:
+    """
+    Value Object - A process of one host in a fleet.
+
+    Attributes:
+        host: Host the process runs on
+        pid: Process ID on that host
+        name: Process name
+        username: Process owner, if known
+        rss_bytes: Resident set size in bytes
+        memory_percent: Share of the host's memory
+        cpu_percent: CPU usage, if it was measured
+    """
+
+    host: str
+    pid: int
+    name: str
+    username: Optional[str]
+    rss_bytes: int
+    memory_percent: float
+    cpu_percent: Optional[float] = None
+
+
+def _process_key(sort: str) -> Callable[[FleetProcess], tuple]:
+    """Ascending key putting the biggest processes first, ties broken by host and PID."""
+    if sort == "cpu":
+        return lambda process: (-(process.cpu_percent or 0.0), process.host, process.pid)
+    if sort == "mem":
+        return lambda process: (-process.rss_bytes, process.host, process.pid)
+    raise ValueError(f"Unknown sort: {sort!r} (expected one of {', '.join(SORTS)})")
+
+
+def _host_key(host: HostHealth) -> tuple:
+    """Ascending key putting the least healthy hosts first."""
+    return (host.overall_score, host.host)
+
+
+def rank_processes(
+    host: str, processes: Iterable[Process], sort: str = "mem", top_n: int = 10
+) -> List[FleetProcess]:
+    """
+    Picks the top processes of one host, in fleet order.
+
+    Unknown RSS and memory percentages count as 0.
+
+    Args:
+        host: Host the processes run on
+        processes: Processes of the host
+        sort: "mem" (RSS) or "cpu"
+        top_n: Maximum number of processes
+
+    Returns:
+        FleetProcesses sorted the way FleetReport merges them
+    """
+    key = _process_key(sort)
+    return heapq.nsmallest(
+        top_n,
+        (
+            FleetProcess(
+                host=host,
+                pid=process.pid,
+                name=process.name,
+                username=process.username,
+                rss_bytes=process.memory.rss_bytes or 0,
+                memory_percent=process.memory.percent or 0.0,
+                cpu_percent=process.cpu_percent
+            )
+            for process in processes
+        ),
+        key=key
+    )
+
+
+class FleetReport:
+    """
+    Streaming rankings of hosts by health and of processes across hosts.
+
+    Hosts are added one at a time, each with its own top processes
+    already sorted (see ``rank_processes``). Pending hosts are folded in
+    batches with a k-way ``heapq.merge`` into the running rankings,
+    which never hold more than ``top_hosts`` hosts and ``top_processes``
+    processes; apart from status counts and unreadable dumps, memory
+    does not grow with the size of the fleet.
+    """
+
+    def __init__(
+        self,
+        top_hosts: int = 20,
+        top_processes: int = 10,
+        sort: str = "mem",
+        statuses: Sequence[str] = (),
+        batch_size: int = 64
+    ):
+        """
+        Args:
+            top_hosts: Number of least healthy hosts kept
+            top_processes: Number of processes kept across the fleet
+            sort: Process ranking, "mem" (RSS) or "cpu"
+            statuses: Only rank hosts with these statuses (default: all)
+            batch_size: Hosts buffered before they are merged in
+        """
+        self.top_hosts = top_hosts
+        self.top_processes = top_processes
+        self.sort = sort
+        self.statuses = frozenset(statuses)
+        self.batch_size = batch_size
+        self.counts: Counter = Counter()
+        self.errors: List[Tuple[str, str]] = []
+        self._process_key = _process_key(sort)
+        self._hosts: List[HostHealth] = []
+        self._processes: List[FleetProcess] = []
+        self._pending_hosts: List[HostHealth] = []
+        self._pending_processes: List[List[FleetProcess]] = []
+
+    @property
+    def host_count(self) -> int:
+        """Number of hosts added."""
+        return sum(self.counts.values())
+
+    def add(self, host: HostHealth, processes: Sequence[FleetProcess] = ()) -> None:
+        """
+        Adds one host and its top processes.
+
+        Args:
+            host: Health of the host
+            processes: Top processes of the host, sorted by rank_processes
+        """
+        self.counts[host.status] += 1
+        if not self.statuses or host.status in self.statuses:
+            self._pending_hosts.append(host)
+        if processes:
+            self._pending_processes.append(list(processes))
+        if (
+            len(self._pending_hosts) >= self.batch_size
+            or len(self._pending_processes) >= self.batch_size
+        ):
+            self._merge()
+
+    def add_error(self, source: str, message: str) -> None:
+        """Records a dump that could not be read."""
+        self.errors.append((source, message))
+
+    def _merge(self) -> None:
+        if self._pending_hosts:
+            self._hosts = list(islice(
+                heapq.merge(self._hosts, sorted(self._pending_hosts, key=_host_key), key=_host_key),
+                self.top_hosts
+            ))
+            self._pending_hosts = []
+        if self._pending_processes:
+            self._processes = list(islice(
+                heapq.merge(self._processes, *self._pending_processes, key=self._process_key),
+                self.top_processes
+            ))
+            self._pending_processes = []
+
+    @property
+    def hosts(self) -> List[HostHealth]:
+        """Least healthy hosts, lowest score first."""
+        self._merge()
+        return list(self._hosts)
+
+    @property
+    def processes(self) -> List[FleetProcess]:
+        """Top processes across the fleet, biggest first."""
+        self._merge()
+        return list(self._processes)
+
+    def summary(self) -> Dict[str, int]:
+        """Number of hosts per status, plus unreadable dumps."""
+        return {
+            "hosts": self.host_count,
+            "critical": self.counts["critical"],
+            "warning": self.counts["warning"],
+            "healthy": self.counts["healthy"],
+            "unreadable": len(self.errors),
+        }
@@ -0,0 +1,178 @@
+"""Metrics history - Fixed-capacity ring buffer of system metric samples."""
+
+import math
+import time
+from array import array
+from typing import Dict, List, Optional, Sequence
+from mico.domain.entities import SystemMetrics
+
+
+METRICS = ("cpu", "memory", "disk")
+
+
+def percentile(sorted_values: Sequence[float], percent: float) -> float:
+    """
+    Linear-interpolated percentile of already sorted values.
+
+    Args:
+        sorted_values: Values in ascending order (must not be empty)
+        percent: Percentile between 0 and 100
+
+    Returns:
+        The percentile value
+    """
+    if not 0 <= percent <= 100:
+        raise ValueError("percent must be between 0 and 100")
+    position = (len(sorted_values) - 1) * percent / 100
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    if lower == upper:
+        return sorted_values[lower]
+    weight = position - lower
+    return sorted_values[lower] * (1 - weight) + sorted_values[upper] * weight
+
+
+class MetricsHistory:
+    """
+    Fixed-capacity ring buffer of CPU, memory and disk samples.
+
+    Samples are stored as C doubles in preallocated arrays, one per
+    column. Appending is O(1) and allocates no per-sample objects. When
+    the buffer is full, the oldest sample is overwritten. Window queries
+    walk back from the newest sample only as far as the window reaches.
+    """
+
+    __slots__ = ("capacity", "timestamps", "columns", "_head", "_size")
+
+    def __init__(self, capacity: int = 3600):
+        """
+        Args:
+            capacity: Maximum number of samples kept
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.timestamps = array("d", bytes(8 * capacity))
+        self.columns = {metric: array("d", bytes(8 * capacity)) for metric in METRICS}
+        self._head = 0
+        self._size = 0
+
+    def append(self, metrics: SystemMetrics, timestamp: Optional[float] = None) -> None:
+        """
+        Records one metrics sample.
+
+        Args:
+            metrics: Sample to record
+            timestamp: Sample time in seconds since the epoch (default: now)
+        """
+        self.append_values(
+            time.time() if timestamp is None else timestamp,
+            metrics.cpu_percent,
+            metrics.memory_percent,
+            metrics.disk_percent
+        )
+
+    def append_values(self, timestamp: float, cpu: float, memory: float, disk: float) -> None:
+        """Records one sample from raw values."""
+        head = self._head
+        self.timestamps[head] = timestamp
+        self.columns["cpu"][head] = cpu
+        self.columns["memory"][head] = memory
+        self.columns["disk"][head] = disk
+        self._head = (head + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _positions(self, window: Optional[float], now: Optional[float]) -> List[int]:
+        """Buffer positions inside the window, oldest first."""
+        if self._size == 0:
+            return []
+        newest = (self._head - 1) % self.capacity
+        if now is None:
+            now = self.timestamps[newest]
+        start = -math.inf if window is None else now - window
+
+        positions = []
+        position = newest
+        for _ in range(self._size):
+            if self.timestamps[position] < start:
+                break
+            positions.append(position)
+            position = (position - 1) % self.capacity
+        positions.reverse()
+        return positions
+
+    def values(
+        self, metric: str, window: Optional[float] = None, now: Optional[float] = None
+    ) -> List[float]:
+        """
+        Returns the samples of one metric inside a window, oldest first.
+
+        Args:
+            metric: One of "cpu", "memory", "disk"
+            window: Window length in seconds, or None for every sample
+            now: End of the window (default: newest sample time)
+        """
+        column = self.columns[metric]
+        return [column[position] for position in self._positions(window, now)]
+
+    def min(self, metric: str, window: Optional[float] = None) -> Optional[float]:
+        """Returns the minimum of a metric over the window, or None if empty."""
+        values = self.values(metric, window)
+        return min(values) if values else None
+
+    def max(self, metric: str, window: Optional[float] = None) -> Optional[float]:
+        """Returns the maximum of a metric over the window, or None if empty."""
+        values = self.values(metric, window)
+        return max(values) if values else None
+
+    def mean(self, metric: str, window: Optional[float] = None) -> Optional[float]:
+        """Returns the mean of a metric over the window, or None if empty."""
+        values = self.values(metric, window)
+        return sum(values) / len(values) if values else None
+
+    def percentile(
+        self, metric: str, percent: float, window: Optional[float] = None
+    ) -> Optional[float]:
+        """Returns a percentile of a metric over the window, or None if empty."""
+        values = self.values(metric, window)
+        return percentile(sorted(values), percent) if values else None
+
+    def summary(
+        self,
+        window: Optional[float] = None,
+        percentiles: Sequence[float] = (50, 95, 99),
+        now: Optional[float] = None
+    ) -> Dict[str, object]:
+        """
+        Summarises every metric over a window in one pass per metric.
+
+        Args:
+            window: Window length in seconds, or None for every sample
+            percentiles: Percentiles to report
+            now: End of the window (default: newest sample time)
+
+        Returns:
+            Dict with the sample count, the covered time span and, for each
+            metric, min/max/mean and the requested percentiles
+        """
+        positions = self._positions(window, now)
+        span = self.timestamps[positions[-1]] - self.timestamps[positions[0]] if positions else 0.0
+
+        metrics: Dict[str, Dict[str, Optional[float]]] = {}
+        for metric in METRICS:
+            column = self.columns[metric]
+            values = sorted(column[position] for position in positions)
+            stats: Dict[str, Optional[float]] = {
+                "min": values[0] if values else None,
+                "max": values[-1] if values else None,
+                "mean": sum(values) / len(values) if values else None,
+            }
+            for percent in percentiles:
+                stats[f"p{percent:g}"] = percentile(values, percent) if values else None
+            metrics[metric] = stats
+
+        return {"samples": len(positions), "window": window, "span": span, "metrics": metrics}
@@ -0,0 +1,190 @@
+"""Leak tracking - Incremental RSS growth trends per process."""
+
+import heapq
+from array import array
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Tuple
+
+
+MB = 1024 ** 2
+HOUR = 3600.0
+
+# One RSS reading: (pid, create_time, name, rss_bytes)
+RssSample = Tuple[int, float, str, int]
+
+
+@dataclass(frozen=True)
+class LeakSuspect:
+    """
+    Value Object - A process whose RSS keeps growing.
+
+    Attributes:
+        pid: Process ID
+        name: Process name
+        create_time: Process creation time, telling reused PIDs apart
+        growth_mb_per_hour: Least-squares slope of RSS over time
+        r_squared: How well a straight line fits the readings (0-1); close
+            to 1 means steady growth rather than a one-off jump
+        duration: Seconds between the first and latest reading
+        samples: Number of readings
+        rss_mb: Latest RSS in MB
+    """
+
+    pid: int
+    name: str
+    create_time: float
+    growth_mb_per_hour: float
+    r_squared: float
+    duration: float
+    samples: int
+    rss_mb: float
+
+
+class LeakTracker:
+    """
+    Least-squares RSS trend of every process, without keeping readings.
+
+    Each process, keyed by (pid, create_time), owns one slot in a set of
+    ``array("d")`` columns holding the running sums of a
+    simple linear regression of RSS (MB) over time (hours) since its
+    first reading. An update is O(1) per process and the store holds a
+    fixed number of doubles per process however long it runs, so the
+    tracker can follow thousands of processes for days. Slots of exited
+    processes are reused.
+    """
+
+    __slots__ = (
+        "names", "first_time", "first_rss", "last_time", "last_rss",
+        "count", "sum_t", "sum_y", "sum_tt", "sum_ty", "sum_yy", "_slots", "_free",
+    )
+
+    _COLUMNS = (
+        "first_time", "first_rss", "last_time", "last_rss",
+        "count", "sum_t", "sum_y", "sum_tt", "sum_ty", "sum_yy",
+    )
+
+    def __init__(self):
+        self.names: List[str] = []
+        for column in self._COLUMNS:
+            setattr(self, column, array("d"))
+        self._slots: Dict[Tuple[int, float], int] = {}
+        self._free: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def update(self, timestamp: float, samples: Iterable[RssSample]) -> None:
+        """
+        Folds one reading of every process into its trend.
+
+        Processes missing from ``samples`` have exited and are forgotten.
+
+        Args:
+            timestamp: Time of the readings in seconds since the epoch
+            samples: (pid, create_time, name, rss_bytes) per process
+        """
+        seen = set()
+        for pid, create_time, name, rss in samples:
+            key = (pid, create_time)
+            slot = self._slots.get(key)
+            if slot is None:
+                slot = self._allocate(key, name, timestamp, rss)
+            seen.add(key)
+
+            t = (timestamp - self.first_time[slot]) / HOUR
+            y = (rss - self.first_rss[slot]) / MB
+            self.count[slot] += 1
+            self.sum_t[slot] += t
+            self.sum_y[slot] += y
+            self.sum_tt[slot] += t * t
+            self.sum_ty[slot] += t * y
+            self.sum_yy[slot] += y * y
+            self.last_time[slot] = timestamp
+            self.last_rss[slot] = rss
+
+        for key in [key for key in self._slots if key not in seen]:
+            self._free.append(self._slots.pop(key))
+
+    def _allocate(self, key: Tuple[int, float], name: str, timestamp: float, rss: int) -> int:
+        if self._free:
+            slot = self._free.pop()
+            self.names[slot] = name
+            for column in self._COLUMNS:
+                getattr(self, column)[slot] = 0.0
+        else:
+            slot = len(self.names)
+            self.names.append(name)
+            for column in self._COLUMNS:
+                getattr(self, column).append(0.0)
+        # Readings are taken relative to the first one, which keeps the
+        # sums small and the regression numerically stable
+        self.first_time[slot] = timestamp
+        self.first_rss[slot] = rss
+        self._slots[key] = slot
+        return slot
+
+    def trend(self, slot: int) -> Tuple[float, float]:
+        """
+        Returns the regression of one slot.
+
+        Returns:
+            Tuple of (slope in MB/hour, r squared); (0.0, 0.0) until the
+            readings span some time
+        """
+        n = self.count[slot]
+        sum_t = self.sum_t[slot]
+        sum_y = self.sum_y[slot]
+        spread_t = n * self.sum_tt[slot] - sum_t * sum_t
+        if n < 2 or spread_t <= 0:
+            return 0.0, 0.0
+        covariance = n * self.sum_ty[slot] - sum_t * sum_y
+        slope = covariance / spread_t
+        spread_y = n * self.sum_yy[slot] - sum_y * sum_y
+        if spread_y <= 0:
+            return slope, 0.0
+        return slope, min(1.0, covariance * covariance / (spread_t * spread_y))
+
+    def suspects(
+        self,
+        min_duration: float = 600.0,
+        min_r_squared: float = 0.8,
+        min_growth: float = 0.0,
+        top_n: int = 10
+    ) -> List[LeakSuspect]:
+        """
+        Ranks processes by sustained RSS growth.
+
+        Args:
+            min_duration: Seconds a process must have been followed
+            min_r_squared: Smallest goodness of fit, filtering out processes
+                whose RSS jumped once or swings up and down
+            min_growth: Smallest growth in MB/hour
+            top_n: Maximum number of suspects
+
+        Returns:
+            LeakSuspects, fastest growing first
+        """
+        candidates = []
+        for (pid, create_time), slot in self._slots.items():
+            duration = self.last_time[slot] - self.first_time[slot]
+            if duration < min_duration or self.count[slot] < 3:
+                continue
+            slope, r_squared = self.trend(slot)
+            if slope <= min_growth or r_squared < min_r_squared:
+                continue
+            candidates.append((slope, pid, create_time, slot, r_squared, duration))
+
+        return [
+            LeakSuspect(
+                pid=pid,
+                name=self.names[slot],
+                create_time=create_time,
+                growth_mb_per_hour=slope,
+                r_squared=r_squared,
+                duration=duration,
+                samples=int(self.count[slot]),
+                rss_mb=self.last_rss[slot] / MB
+            )
+            for slope, pid, create_time, slot, r_squared, duration
+            in heapq.nlargest(top_n, candidates, key=lambda candidate: candidate[0])
+        ]
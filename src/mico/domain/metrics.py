@@ -0,0 +1,74 @@
+"""Metrics value objects - Volume usage and I/O rates read for health checks."""
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+
+@dataclass(frozen=True)
+class DiskUsage:
+    """
+    Value Object - Usage of one mounted volume.
+    
+    Attributes:
+        mountpoint: Mount point of the volume
+        fstype: Filesystem type
+        total_gb: Total space in GB
+        used_gb: Used space in GB
+        percent: Used space percentage
+        responding: False when the volume could not be read in time (a
+            hung network mount, for instance); sizes are then zero
+    """
+    
+    mountpoint: str
+    fstype: str = ""
+    total_gb: float = 0.0
+    used_gb: float = 0.0
+    percent: float = 0.0
+    responding: bool = True
+
+
+@dataclass(frozen=True)
+class IORate:
+    """
+    Value Object - Throughput of one disk or network interface.
+    
+    For network interfaces "read" is received and "write" is sent
+    traffic, and operations are packets.
+    
+    Attributes:
+        name: Device or interface name ("total" for the whole system)
+        read_bytes_per_sec: Bytes read (received) per second
+        write_bytes_per_sec: Bytes written (sent) per second
+        read_ops_per_sec: Read operations (packets received) per second
+        write_ops_per_sec: Write operations (packets sent) per second
+        busy_percent: Share of the interval a disk was busy, or link
+            utilisation of an interface; None when unknown
+    """
+    
+    name: str
+    read_bytes_per_sec: float = 0.0
+    write_bytes_per_sec: float = 0.0
+    read_ops_per_sec: float = 0.0
+    write_ops_per_sec: float = 0.0
+    busy_percent: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class IOMetrics:
+    """
+    Value Object - Disk and network throughput over an interval.
+    
+    Attributes:
+        interval: Seconds the rates were measured over
+        disk: Totals over every disk; busy_percent is that of the busiest
+        network: Totals over every interface except loopback;
+            busy_percent is the utilisation of the busiest link
+        disks: Rates per disk
+        interfaces: Rates per network interface
+    """
+    
+    interval: float
+    disk: IORate
+    network: IORate
+    disks: Tuple[IORate, ...] = ()
+    interfaces: Tuple[IORate, ...] = ()
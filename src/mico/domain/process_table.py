@@ -0,0 +1,181 @@
+"""Process table - Columnar storage for process collections."""
+
+import math
+import time
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+from mico.domain.entities import MemoryInfo, Process
+
+
+class ProcessTable:
+    """
+    Columnar, array-backed collection of processes.
+
+    Rows are stored across typed arrays rather than as one Process and
+    one MemoryInfo object per process. Names and usernames are interned
+    into string tables and referenced by index, and Process objects are
+    only built when a row is read.
+
+    Attributes:
+        timestamp: Collection time in seconds since the epoch
+        pids: Process IDs
+        rss: Resident Set Size in bytes
+        vms: Virtual Memory Size in bytes
+        percent: Memory usage percentage (NaN when unknown)
+        name_ids: Index into ``names`` for each row
+        user_ids: Index into ``users`` for each row (-1 when unknown)
+        ppids: Parent process IDs (-1 when unknown)
+        cpu: CPU usage percentage (NaN when unknown)
+        names: Interned process names
+        users: Interned usernames
+    """
+
+    __slots__ = (
+        "timestamp", "pids", "rss", "vms", "percent", "name_ids", "user_ids", "ppids", "cpu",
+        "names", "users", "_name_index", "_user_index",
+    )
+
+    def __init__(self, timestamp: Optional[float] = None):
+        self.timestamp = time.time() if timestamp is None else timestamp
+        self.pids = array("q")
+        self.rss = array("Q")
+        self.vms = array("Q")
+        self.percent = array("d")
+        self.name_ids = array("i")
+        self.user_ids = array("i")
+        self.ppids = array("q")
+        self.cpu = array("d")
+        self.names: List[str] = []
+        self.users: List[str] = []
+        self._name_index: Dict[str, int] = {}
+        self._user_index: Dict[str, int] = {}
+
+    @classmethod
+    def from_processes(
+        cls,
+        processes: Iterable[Process],
+        timestamp: Optional[float] = None
+    ) -> "ProcessTable":
+        """
+        Builds a table from Process objects (a list or a ProcessSnapshot).
+
+        Args:
+            processes: Processes to store
+            timestamp: Collection time; taken from a snapshot when omitted
+
+        Returns:
+            ProcessTable holding one row per process
+        """
+        if timestamp is None:
+            timestamp = getattr(processes, "timestamp", None)
+
+        table = cls(timestamp)
+        for process in processes:
+            table.append(
+                process.pid,
+                process.name,
+                process.memory.rss_bytes,
+                process.memory.vms_bytes,
+                process.memory.percent,
+                process.username,
+                process.ppid,
+                process.cpu_percent
+            )
+        return table
+
+    def append(
+        self,
+        pid: int,
+        name: str,
+        rss_bytes: Optional[int],
+        vms_bytes: Optional[int],
+        percent: Optional[float],
+        username: Optional[str] = None,
+        ppid: Optional[int] = None,
+        cpu_percent: Optional[float] = None
+    ) -> None:
+        """
+        Appends one row to the table.
+
+        Missing byte counts are stored as 0, missing percentages as NaN
+        and a missing parent PID as -1.
+        """
+        self.pids.append(pid)
+        self.rss.append(rss_bytes or 0)
+        self.vms.append(vms_bytes or 0)
+        self.percent.append(math.nan if percent is None else percent)
+        self.name_ids.append(self._intern(name, self.names, self._name_index))
+        if username is None:
+            self.user_ids.append(-1)
+        else:
+            self.user_ids.append(self._intern(username, self.users, self._user_index))
+        self.ppids.append(-1 if ppid is None else ppid)
+        self.cpu.append(math.nan if cpu_percent is None else cpu_percent)
+
+    @staticmethod
+    def _intern(value: str, table: List[str], index: Dict[str, int]) -> int:
+        """Returns the string table index of value, adding it if needed."""
+        position = index.get(value)
+        if position is None:
+            position = len(table)
+            table.append(value)
+            index[value] = position
+        return position
+
+    def name(self, row: int) -> str:
+        """Returns the process name of a row."""
+        return self.names[self.name_ids[row]]
+
+    def username(self, row: int) -> Optional[str]:
+        """Returns the username of a row, or None when unknown."""
+        user_id = self.user_ids[row]
+        return None if user_id < 0 else self.users[user_id]
+
+    def process(self, row: int) -> Process:
+        """
+        Builds the Process view of a row.
+
+        Args:
+            row: Row index
+
+        Returns:
+            Process domain object for the row
+        """
+        percent = self.percent[row]
+        cpu_percent = self.cpu[row]
+        return Process(
+            pid=self.pids[row],
+            name=self.names[self.name_ids[row]],
+            memory=MemoryInfo(
+                rss_bytes=self.rss[row],
+                vms_bytes=self.vms[row],
+                percent=None if math.isnan(percent) else percent
+            ),
+            username=self.username(row),
+            ppid=None if self.ppids[row] < 0 else self.ppids[row],
+            cpu_percent=None if math.isnan(cpu_percent) else cpu_percent
+        )
+
+    def processes(self, rows: Optional[Sequence[int]] = None) -> List[Process]:
+        """
+        Builds Process views for the given rows.
+
+        Args:
+            rows: Row indices, or None for every row
+
+        Returns:
+            List of Process domain objects in row order
+        """
+        if rows is None:
+            rows = range(len(self.pids))
+        return [self.process(row) for row in rows]
+
+    def __len__(self) -> int:
+        return len(self.pids)
+
+    def __getitem__(self, row: int) -> Process:
+        return self.process(row)
+
+    def __iter__(self) -> Iterator[Process]:
+        for row in range(len(self.pids)):
+            yield self.process(row)
@@ -1,8 +1,30 @@
-"""Use cases - Business logic layer."""
+"""
+Use cases - Business logic layer.
 
-from mico.domain.use_cases.list_processes import ListProcessesUseCase
-from mico.domain.use_cases.filter_processes import FilterProcessesUseCase
-from mico.domain.use_cases.calculate_health import CalculateSystemHealthUseCase
+Use cases are loaded on first access, so a command only imports the use
+cases it runs.
+"""
 
-__all__ = ["ListProcessesUseCase", "FilterProcessesUseCase", "CalculateSystemHealthUseCase"]
+import importlib
+from typing import Any
 
+_EXPORTS = {
+    "ListProcessesUseCase": "mico.domain.use_cases.list_processes",
+    "FilterProcessesUseCase": "mico.domain.use_cases.filter_processes",
+    "CalculateSystemHealthUseCase": "mico.domain.use_cases.calculate_health",
+    "GroupProcessesUseCase": "mico.domain.use_cases.group_processes",
+}
+
+__all__ = [
+    "ListProcessesUseCase",
+    "FilterProcessesUseCase",
+    "CalculateSystemHealthUseCase",
+    "GroupProcessesUseCase",
+]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module), name)
@@ -1,26 +1,80 @@
 """Use case: Calculate system health score."""
 
-from typing import Dict, Any
+import math
+from array import array
+from typing import Dict, Any, List, Optional, Sequence
+from mico.domain.anomaly import AnomalyDetector
 from mico.domain.entities import SystemMetrics
+from mico.domain.metrics import IOMetrics
+
+
+# Score ladders shared by the batch path, mirroring the _calculate_*_score
+# methods: (upper bound, base, origin, slope) per branch, a branch scoring
+# base - (value - origin) * slope (or base when origin is None), and a
+# final (base, origin, slope) branch clamped at zero.
+_LADDERS = {
+    "cpu": ([(50, 100.0, None, None), (70, 100.0, 50, 1.5), (85, 70.0, 70, 2.0)], (40.0, 85, 2.5)),
+    "memory": (
+        [(60, 100.0, None, None), (75, 100.0, 60, 1.33), (85, 80.0, 75, 2.0)],
+        (60.0, 85, 3.0),
+    ),
+    "disk": ([(70, 100.0, None, None), (80, 100.0, 70, 2.0), (90, 80.0, 80, 3.0)], (50.0, 90, 5.0)),
+}
+
+# Component weights once disk and network pressure are measured; the
+# weights of the components present are scaled back up to a total of 1.
+# Without I/O rates the score keeps its 0.4 / 0.4 / 0.2 weighting.
+_IO_WEIGHTS = {"cpu": 0.3, "memory": 0.3, "disk": 0.15, "disk_io": 0.15, "network": 0.1}
+
+_numpy_module: Any = None
+
+
+def _numpy() -> Optional[Any]:
+    """Imports NumPy on first use; returns None when it is not installed."""
+    global _numpy_module
+    if _numpy_module is None:
+        try:
+            import numpy
+        except ImportError:
+            numpy = False
+        _numpy_module = numpy
+    return _numpy_module or None
 
 
 class CalculateSystemHealthUseCase:
     """Use case: Calculate overall system health score."""
     
+    # Status codes returned by execute_batch index this tuple
+    STATUSES = ("healthy", "warning", "critical")
+    
     @staticmethod
-    def execute(system_metrics: SystemMetrics) -> Dict[str, Any]:
+    def execute(
+        system_metrics: SystemMetrics, detector: Optional[AnomalyDetector] = None
+    ) -> Dict[str, Any]:
         """
         Calculates system health score based on metrics.
         
+        When the metrics carry I/O rates, disk busy time and network link
+        utilisation are scored as "disk_io" and "network" components and
+        the busiest devices are named in the warnings.
+        
+        The warnings come from fixed thresholds. Given a detector that
+        has followed earlier samples, readings far from this host's own
+        baseline are reported as anomalies as well, and the sample is
+        folded into the baseline.
+        
         Args:
             system_metrics: System metrics to evaluate
+            detector: AnomalyDetector carrying the baselines of earlier samples
         
         Returns:
-            Dict with score, status, warnings, and recommendations
+            Dict with score, status, warnings, anomalies and recommendations
         """
         scores = {
             "cpu": CalculateSystemHealthUseCase._calculate_cpu_score(system_metrics.cpu_percent),
-            "memory": CalculateSystemHealthUseCase._calculate_memory_score(system_metrics.memory_percent),
+            "memory": CalculateSystemHealthUseCase._calculate_memory_score(
+                system_metrics.memory_percent
+            ),
             "disk": CalculateSystemHealthUseCase._calculate_disk_score(system_metrics.disk_percent),
         }
         
@@ -36,16 +90,46 @@ class CalculateSystemHealthUseCase:
         elif system_metrics.memory_percent > 70:
             warnings.append(f"Memory usage elevated: {system_metrics.memory_percent:.1f}%")
         
-        if system_metrics.disk_percent > 90:
+        if system_metrics.disks:
+            for disk in system_metrics.disks:
+                if not disk.responding:
+                    warnings.append(f"Volume not responding: {disk.mountpoint}")
+                elif disk.percent > 90:
+                    warnings.append(
+                        f"Disk space critical on {disk.mountpoint}: {disk.percent:.1f}% used"
+                    )
+                elif disk.percent > 80:
+                    warnings.append(
+                        f"Disk space low on {disk.mountpoint}: {disk.percent:.1f}% used"
+                    )
+        elif system_metrics.disk_percent > 90:
             warnings.append(f"Disk space critical: {system_metrics.disk_percent:.1f}% used")
         elif system_metrics.disk_percent > 80:
             warnings.append(f"Disk space low: {system_metrics.disk_percent:.1f}% used")
         
-        overall_score = (
-            scores["cpu"] * 0.4 +
-            scores["memory"] * 0.4 +
-            scores["disk"] * 0.2
-        )
+        io = system_metrics.io
+        if io is not None:
+            if io.disk.busy_percent is not None:
+                scores["disk_io"] = CalculateSystemHealthUseCase._calculate_disk_io_score(
+                    io.disk.busy_percent
+                )
+            if io.network.busy_percent is not None:
+                scores["network"] = CalculateSystemHealthUseCase._calculate_network_score(
+                    io.network.busy_percent
+                )
+            warnings.extend(CalculateSystemHealthUseCase._io_warnings(io))
+        
+        if len(scores) == 3:
+            overall_score = (
+                scores["cpu"] * 0.4 +
+                scores["memory"] * 0.4 +
+                scores["disk"] * 0.2
+            )
+        else:
+            total_weight = sum(_IO_WEIGHTS[component] for component in scores)
+            overall_score = sum(
+                score * _IO_WEIGHTS[component] for component, score in scores.items()
+            ) / total_weight
         
         if overall_score >= 80:
             status = "healthy"
@@ -63,9 +147,90 @@ class CalculateSystemHealthUseCase:
             "emoji": emoji,
             "scores": scores,
             "warnings": warnings,
+            "anomalies": [] if detector is None else [
+                anomaly.message for anomaly in detector.update(system_metrics)
+            ],
             "is_healthy": system_metrics.is_healthy,
         }
     
+    @staticmethod
+    def execute_batch(
+        cpu_percent: Sequence[float],
+        memory_percent: Sequence[float],
+        disk_percent: Sequence[float],
+        use_numpy: Optional[bool] = None
+    ) -> Dict[str, Any]:
+        """
+        Calculates health scores for whole columns of metrics at once.
+        
+        Every element gets exactly the scores, overall score and status
+        that ``execute`` returns for the same values when no I/O rates are
+        known. Disk and network pressure are not part of the batch
+        columns, and no warnings are built.
+        
+        With NumPy, the score ladders are evaluated as array expressions.
+        Without it, each element goes through the scalar score methods.
+        
+        Args:
+            cpu_percent: CPU usage percentages
+            memory_percent: Memory usage percentages
+            disk_percent: Disk usage percentages
+            use_numpy: Force (True) or avoid (False) NumPy; by default it
+                is used when installed
+        
+        Returns:
+            Dict with "scores" (per-component arrays), "overall_score" and
+            "status" (codes indexing STATUSES); NumPy arrays when NumPy is
+            used, array.array otherwise
+        
+        Raises:
+            ValueError: If the columns differ in length
+            ImportError: If use_numpy is True and NumPy is not installed
+        """
+        if not len(cpu_percent) == len(memory_percent) == len(disk_percent):
+            raise ValueError(
+                "cpu_percent, memory_percent and disk_percent must have the same length"
+            )
+        
+        np = _numpy() if use_numpy is not False else None
+        if use_numpy and np is None:
+            raise ImportError("NumPy is required for use_numpy=True (pip install 'mico[fast]')")
+        if np is not None:
+            return CalculateSystemHealthUseCase._execute_batch_numpy(
+                np, cpu_percent, memory_percent, disk_percent
+            )
+        
+        cpu = array("d", map(CalculateSystemHealthUseCase._calculate_cpu_score, cpu_percent))
+        memory = array(
+            "d", map(CalculateSystemHealthUseCase._calculate_memory_score, memory_percent)
+        )
+        disk = array("d", map(CalculateSystemHealthUseCase._calculate_disk_score, disk_percent))
+        overall = array("d", [
+            c * 0.4 + m * 0.4 + d * 0.2 for c, m, d in zip(cpu, memory, disk)
+        ])
+        status = array("b", [0 if o >= 80 else 1 if o >= 60 else 2 for o in overall])
+        return {
+            "overall_score": array("d", [round(o, 1) for o in overall]),
+            "status": status,
+            "scores": {"cpu": cpu, "memory": memory, "disk": disk},
+        }
+    
+    @staticmethod
+    def _execute_batch_numpy(np: Any, cpu_percent, memory_percent, disk_percent) -> Dict[str, Any]:
+        scores = {
+            name: _ladder_numpy(np, np.asarray(values, dtype=np.float64), *_LADDERS[name])
+            for name, values in (
+                ("cpu", cpu_percent), ("memory", memory_percent), ("disk", disk_percent)
+            )
+        }
+        overall = scores["cpu"] * 0.4 + scores["memory"] * 0.4 + scores["disk"] * 0.2
+        status = np.where(overall >= 80, 0, np.where(overall >= 60, 1, 2)).astype(np.int8)
+        return {
+            "overall_score": _round_numpy(np, overall),
+            "status": status,
+            "scores": scores,
+        }
+    
     @staticmethod
     def _calculate_cpu_score(cpu_percent: float) -> float:
         """Calculate CPU health score (0-100)."""
@@ -101,4 +266,81 @@ class CalculateSystemHealthUseCase:
             return 80.0 - ((disk_percent - 80) * 3.0)
         else:
             return max(0.0, 50.0 - ((disk_percent - 90) * 5.0))
+    
+    @staticmethod
+    def _calculate_disk_io_score(busy_percent: float) -> float:
+        """Calculate disk I/O pressure score (0-100) from the busiest disk."""
+        if busy_percent < 60:
+            return 100.0
+        elif busy_percent < 80:
+            return 100.0 - ((busy_percent - 60) * 1.5)
+        elif busy_percent < 95:
+            return 70.0 - ((busy_percent - 80) * 2.0)
+        else:
+            return max(0.0, 40.0 - ((busy_percent - 95) * 8.0))
+    
+    @staticmethod
+    def _calculate_network_score(utilisation_percent: float) -> float:
+        """Calculate network pressure score (0-100) from the busiest link."""
+        if utilisation_percent < 50:
+            return 100.0
+        elif utilisation_percent < 70:
+            return 100.0 - ((utilisation_percent - 50) * 1.5)
+        elif utilisation_percent < 90:
+            return 70.0 - ((utilisation_percent - 70) * 1.5)
+        else:
+            return max(0.0, 40.0 - ((utilisation_percent - 90) * 4.0))
+    
+    @staticmethod
+    def _io_warnings(io: IOMetrics) -> List[str]:
+        """Names the disks and links under pressure."""
+        warnings = []
+        for disk in io.disks:
+            if disk.busy_percent is None:
+                continue
+            if disk.busy_percent > 90:
+                warnings.append(f"Disk I/O saturated on {disk.name}: {disk.busy_percent:.0f}% busy")
+            elif disk.busy_percent > 75:
+                warnings.append(f"Disk I/O elevated on {disk.name}: {disk.busy_percent:.0f}% busy")
+        for interface in io.interfaces:
+            if interface.busy_percent is None:
+                continue
+            if interface.busy_percent > 90:
+                warnings.append(
+                    f"Network link saturated on {interface.name}: "
+                    f"{interface.busy_percent:.0f}% utilised"
+                )
+            elif interface.busy_percent > 70:
+                warnings.append(
+                    f"Network link busy on {interface.name}: {interface.busy_percent:.0f}% utilised"
+                )
+        return warnings
+
 
+def _ladder_numpy(np: Any, values: Any, branches, final) -> Any:
+    """Evaluates a score ladder over an array, branch by branch."""
+    base, origin, slope = final
+    tail = base - ((values - origin) * slope)
+    # max(0.0, x) keeps 0.0 unless x > 0.0, which also maps NaN to 0.0
+    result = np.where(tail > 0.0, tail, 0.0)
+    for bound, base, origin, slope in reversed(branches):
+        branch = base if origin is None else base - ((values - origin) * slope)
+        result = np.where(values < bound, branch, result)
+    return result
+
+
+def _round_numpy(np: Any, values: Any) -> Any:
+    """
+    Rounds to one decimal exactly like the built-in round().
+    
+    np.round scales by ten before rounding, which can tip values lying
+    next to a .x5 boundary the other way. Those few values are rounded
+    again with round(); every other value already matches it.
+    """
+    scaled = values * 10
+    rounded = np.round(scaled) / 10
+    near_half = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    for index in np.flatnonzero(near_half | ~np.isfinite(values)):
+        value = float(values[index])
+        rounded[index] = round(value, 1) if math.isfinite(value) else value
+    return rounded
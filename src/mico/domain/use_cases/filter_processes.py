@@ -1,26 +1,114 @@
-"""Use case: Filter processes by criteria."""
+"""Use case: Filter processes by criteria.
 
-from typing import List
+The filter compiler is only imported when there is an expression to
+compile, so unfiltered listings do not pay for loading it.
+"""
+
+from typing import TYPE_CHECKING, FrozenSet, Iterable, Iterator, List, Optional
 from mico.domain.entities import Process
 
+if TYPE_CHECKING:
+    from mico.domain.process_table import ProcessTable
+
 
 class FilterProcessesUseCase:
-    """Use case: Filter processes by name or PID."""
+    """Use case: Filter processes by a filter expression."""
     
     @staticmethod
-    def execute(processes: List[Process], filter_text: str) -> List[Process]:
+    def execute(processes: Iterable[Process], filter_text: str) -> List[Process]:
         """
-        Filter processes by name or PID.
+        Filter processes by a filter expression.
+        
+        The expression is compiled once into a single predicate (see
+        mico.domain.filters), e.g. ``chrome`` or ``user:www rss>500M name~^nginx``.
         
         Args:
-            processes: List of processes
-            filter_text: Text to filter by (name or PID)
+            processes: Processes to filter (a list or a ProcessSnapshot)
+            filter_text: Filter expression (name, PID or field terms)
         
         Returns:
             Filtered list of processes
+        
+        Raises:
+            ValueError: If the filter expression is invalid
         """
         if not filter_text:
-            return processes
+            return processes if isinstance(processes, list) else list(processes)
+        from mico.domain.filters import compile_filter
         
-        return [p for p in processes if p.matches_filter(filter_text)]
-
+        return list(compile_filter(filter_text).apply(processes))
+    
+    @staticmethod
+    def stream(processes: Iterable[Process], filter_text: str) -> Iterator[Process]:
+        """
+        Lazily filter processes by a filter expression.
+        
+        Unlike execute, no list is built: matching processes are yielded
+        as the input is consumed, so this can sit between a generator
+        from the adapter and ListProcessesUseCase. The expression is
+        compiled, and validated, before this returns.
+        
+        Args:
+            processes: Processes to filter (any iterable)
+            filter_text: Filter expression (name, PID or field terms)
+        
+        Returns:
+            Iterator over the matching processes
+        
+        Raises:
+            ValueError: If the filter expression is invalid
+        """
+        if not filter_text:
+            return iter(processes)
+        from mico.domain.filters import compile_filter
+        
+        return compile_filter(filter_text).apply(processes)
+    
+    @staticmethod
+    def pinned_pids(filter_text: str) -> Optional[FrozenSet[int]]:
+        """
+        Returns the PIDs a filter expression pins with ``pid:N``/``pid=N``.
+        
+        When this is not None, filtering a ProcessSnapshot looks the PIDs
+        up in its index instead of testing every process, so callers
+        should collect a snapshot rather than stream from the adapter.
+        
+        Args:
+            filter_text: Filter expression (name, PID or field terms)
+        
+        Returns:
+            The pinned PIDs, or None if the expression does not pin any
+        
+        Raises:
+            ValueError: If the filter expression is invalid
+        """
+        if not filter_text:
+            return None
+        from mico.domain.filters import compile_filter
+        
+        return compile_filter(filter_text).pids
+    
+    @staticmethod
+    def execute_table(table: "ProcessTable", filter_text: str) -> List[int]:
+        """
+        Filter a ProcessTable by a filter expression, column by column.
+        
+        Name and user terms are evaluated once per interned string instead
+        of once per row, and numeric terms read the typed columns directly.
+        
+        Args:
+            table: Columnar process table
+            filter_text: Filter expression (name, PID or field terms)
+        
+        Returns:
+            Indices of the matching rows, in table order
+        
+        Raises:
+            ValueError: If the filter expression is invalid
+        """
+        if not filter_text:
+            return list(range(len(table)))
+        from mico.domain.filters import compile_filter
+        
+        row_test = compile_filter(filter_text).row_test(table)
+        return [row for row in range(len(table)) if row_test(row)]
@@ -0,0 +1,183 @@
+"""Use case: Group processes by application, user or process tree."""
+
+from typing import Any, Callable, Dict, Iterable, List, Literal, Optional, Sequence
+from mico.domain.entities import Process, ProcessGroup
+from mico.domain.use_cases.list_processes import select_top
+
+
+GroupCriteria = Literal["tree", "app", "user"]
+
+# Per-group running totals: [count, rss, vms, percent, percent known]
+_Totals = List[Any]
+
+_UNRESOLVED = -2
+_VISITING = -3
+
+# Sort keys of GroupProcessesUseCase.execute
+_GROUP_KEYS: Dict[str, Callable[[ProcessGroup], Any]] = {
+    "mem": lambda g: g.rss_bytes,
+    "name": lambda g: g.name.lower(),
+    "pid": lambda g: g.pid if g.pid is not None else -1,
+}
+
+
+def application_name(name: str) -> str:
+    """
+    Returns the application a process name belongs to.
+    
+    Helper processes are folded into their application, e.g.
+    ``Google Chrome Helper (Renderer)`` becomes ``Google Chrome``, and
+    a trailing ``(...)`` role suffix is dropped.
+    """
+    application = name.split(" Helper", 1)[0]
+    if application.endswith(")") and " (" in application:
+        application = application[:application.rindex(" (")]
+    return application.strip() or name
+
+
+def subtree_heads(processes: Sequence[Process]) -> List[int]:
+    """
+    Maps every process to the head of its subtree.
+    
+    A head is a process without a known parent (a root), or a direct
+    child of a root, so every application launched by init/launchd
+    heads its own subtree. The parent index is built in one pass, and
+    each ancestor chain is walked once thanks to path compression.
+    
+    Args:
+        processes: Processes with their ppid
+    
+    Returns:
+        For each process position, the position of its subtree head
+    """
+    index = {process.pid: position for position, process in enumerate(processes)}
+    parents = [
+        -1 if process.ppid is None or process.ppid == process.pid else index.get(process.ppid, -1)
+        for process in processes
+    ]
+    
+    heads = [_UNRESOLVED] * len(processes)
+    for start in range(len(processes)):
+        path = []
+        node = start
+        while heads[node] == _UNRESOLVED:
+            parent = parents[node]
+            if parent < 0 or parents[parent] < 0:
+                heads[node] = node
+                break
+            heads[node] = _VISITING
+            path.append(node)
+            node = parent
+        head = heads[node]
+        if head == _VISITING:
+            # A ppid cycle (stale parents): the node closing it heads the subtree
+            head = heads[node] = node
+        for visited in path:
+            heads[visited] = head
+    return heads
+
+
+class GroupProcessesUseCase:
+    """Use case: Aggregate processes into groups and rank the groups."""
+    
+    @staticmethod
+    def execute(
+        processes: Iterable[Process],
+        group_by: GroupCriteria = "app",
+        sort_by: str = "mem",
+        reverse: bool = True,
+        top_n: int = 10
+    ) -> List[ProcessGroup]:
+        """
+        Aggregates processes and returns the top groups.
+        
+        Each group reports its process count and total RSS/VMS. Groups
+        are built in one pass over the processes, and the top groups are
+        selected with the same bounded-heap selection as process listing.
+        
+        Args:
+            processes: Processes to group (any iterable, e.g. a ProcessSnapshot)
+            group_by: "tree" (subtrees under init), "app" (application
+                name, helpers folded in) or "user"
+            sort_by: Sorting criteria (mem, name, pid)
+            reverse: True for descending order
+            top_n: Maximum number of groups to return
+        
+        Returns:
+            Sorted and limited list of process groups
+        
+        Raises:
+            ValueError: If group_by is not a known criterion
+        """
+        if group_by == "tree":
+            groups = GroupProcessesUseCase._group_tree(
+                processes if isinstance(processes, (list, tuple)) else list(processes)
+            )
+        elif group_by == "app":
+            groups = GroupProcessesUseCase._group_by(processes, lambda p: application_name(p.name))
+        elif group_by == "user":
+            groups = GroupProcessesUseCase._group_by(processes, lambda p: p.username, by_user=True)
+        else:
+            raise ValueError(f"Unknown grouping: {group_by!r} (expected tree, app or user)")
+        
+        key = _GROUP_KEYS.get(sort_by, _GROUP_KEYS["pid"])
+        return select_top(groups, key, top_n, reverse)
+    
+    @staticmethod
+    def _group_by(
+        processes: Iterable[Process],
+        key: Callable[[Process], Optional[str]],
+        by_user: bool = False
+    ) -> List[ProcessGroup]:
+        totals: Dict[Optional[str], _Totals] = {}
+        for process in processes:
+            group_key = key(process)
+            entry = totals.get(group_key)
+            if entry is None:
+                entry = totals[group_key] = [0, 0, 0, 0.0, False]
+            _add(entry, process)
+        
+        return [
+            _group(entry, name if name is not None else "N/A", username=name if by_user else None)
+            for name, entry in totals.items()
+        ]
+    
+    @staticmethod
+    def _group_tree(processes: Sequence[Process]) -> List[ProcessGroup]:
+        totals: Dict[int, _Totals] = {}
+        for process, head in zip(processes, subtree_heads(processes)):
+            entry = totals.get(head)
+            if entry is None:
+                entry = totals[head] = [0, 0, 0, 0.0, False]
+            _add(entry, process)
+        
+        groups = []
+        for head, entry in totals.items():
+            root = processes[head]
+            groups.append(_group(entry, root.name, pid=root.pid, username=root.username))
+        return groups
+
+
+def _add(entry: _Totals, process: Process) -> None:
+    memory = process.memory
+    entry[0] += 1
+    entry[1] += memory.rss_bytes or 0
+    entry[2] += memory.vms_bytes or 0
+    if memory.percent is not None:
+        entry[3] += memory.percent
+        entry[4] = True
+
+
+def _group(
+    entry: _Totals, name: str, pid: Optional[int] = None, username: Optional[str] = None
+) -> ProcessGroup:
+    count, rss, vms, percent, percent_known = entry
+    return ProcessGroup(
+        name=name,
+        count=count,
+        rss_bytes=rss,
+        vms_bytes=vms,
+        percent=percent if percent_known else None,
+        pid=pid,
+        username=username
+    )
@@ -1,10 +1,57 @@
 """Use case: List processes with sorting."""
 
-from typing import List, Literal
+import heapq
+import math
+from typing import (
+    TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Literal, Optional, Sequence, TypeVar
+)
 from mico.domain.entities import Process
 
+if TYPE_CHECKING:
+    from mico.domain.process_table import ProcessTable
 
-SortCriteria = Literal["mem", "name", "pid"]
+
+SortCriteria = Literal["mem", "cpu", "name", "pid"]
+
+T = TypeVar("T")
+
+# Sort keys of ListProcessesUseCase.execute; processes without a CPU reading sort lowest
+_PROCESS_KEYS: Dict[str, Callable[[Process], Any]] = {
+    "mem": lambda p: p.memory.rss_bytes or 0,
+    "cpu": lambda p: -1.0 if p.cpu_percent is None else p.cpu_percent,
+    "name": lambda p: p.name.lower(),
+    "pid": lambda p: p.pid,
+}
+
+
+def select_top(
+    items: Iterable[T],
+    key: Callable[[T], Any],
+    top_n: int,
+    reverse: bool = True
+) -> List[T]:
+    """
+    Select the first top_n items of a sort without sorting everything.
+    
+    Uses a bounded heap, so the cost is O(n log k) and the input can be
+    any iterable, including a generator. The result is identical to
+    ``sorted(items, key=key, reverse=reverse)[:top_n]``, ties included.
+    
+    Args:
+        items: Items to select from
+        key: Sort key
+        top_n: Maximum number of items to return
+        reverse: True for descending order
+    
+    Returns:
+        Selected items in sorted order
+    """
+    if top_n < 0:
+        # Negative limits keep the slicing semantics of a full sort
+        return sorted(items, key=key, reverse=reverse)[:top_n]
+    if reverse:
+        return heapq.nlargest(top_n, items, key=key)
+    return heapq.nsmallest(top_n, items, key=key)
 
 
 class ListProcessesUseCase:
@@ -12,7 +59,7 @@ class ListProcessesUseCase:
     
     @staticmethod
     def execute(
-        processes: List[Process],
+        processes: Iterable[Process],
         sort_by: SortCriteria = "mem",
         reverse: bool = True,
         top_n: int = 10
@@ -20,33 +67,114 @@ class ListProcessesUseCase:
         """
         List processes with sorting and limit.
         
+        Only the top_n processes are kept while the input is consumed, so
+        processes can be streamed in from a generator.
+        
         Args:
-            processes: List of available processes
-            sort_by: Sorting criteria (mem, name, pid)
+            processes: Available processes (any iterable, e.g. a ProcessSnapshot)
+            sort_by: Sorting criteria (mem, cpu, name, pid); processes
+                without a CPU reading sort below every other for cpu
             reverse: True for descending order
             top_n: Maximum number of processes to return
         
         Returns:
             Sorted and limited list of processes
         """
+        key = _PROCESS_KEYS.get(sort_by, _PROCESS_KEYS["pid"])
+        return select_top(processes, key, top_n, reverse)
+    
+    @staticmethod
+    def execute_accurate(
+        processes: Iterable[Process],
+        read_full_memory: Callable[[Sequence[Process]], List[Process]],
+        top_n: int = 10
+    ) -> List[Process]:
+        """
+        List the processes using the most unique memory (USS).
+        
+        USS can never exceed RSS, so processes are read in RSS order, in
+        batches of top_n popped from a heap, and reading stops once the top_n-th largest USS
+        found is at least the RSS of the next unread process. Only a few
+        batches are usually read, whatever the number of processes.
+        Processes whose USS cannot be read rank by their RSS.
+        
+        Args:
+            processes: Available processes (any iterable, e.g. a ProcessSnapshot)
+            read_full_memory: Returns the given processes with USS/PSS filled
+                in (e.g. SystemAdapter.read_full_memory)
+            top_n: Maximum number of processes to return
+        
+        Returns:
+            Processes sorted by USS, largest first
+        """
+        if top_n <= 0:
+            return []
+        
+        # A max-heap on RSS: building it is linear, and only the batches
+        # actually read are popped, so the candidates are never fully sorted
+        candidates = [(-_rss(process), index, process) for index, process in enumerate(processes)]
+        heapq.heapify(candidates)
+        selected: List[Process] = []
+        while candidates:
+            if len(selected) == top_n and _uss(selected[-1]) >= -candidates[0][0]:
+                break
+            batch = [heapq.heappop(candidates)[2] for _ in range(min(top_n, len(candidates)))]
+            selected = heapq.nlargest(top_n, selected + read_full_memory(batch), key=_uss)
+        return selected
+    
+    @staticmethod
+    def execute_table(
+        table: "ProcessTable",
+        sort_by: SortCriteria = "mem",
+        reverse: bool = True,
+        top_n: int = 10,
+        rows: Optional[Sequence[int]] = None
+    ) -> List[Process]:
+        """
+        List rows of a ProcessTable with sorting and limit.
+        
+        Row indices are selected against the table columns, and Process
+        objects are only built for the rows that are returned.
+        
+        Args:
+            table: Columnar process table
+            sort_by: Sorting criteria (mem, cpu, name, pid)
+            reverse: True for descending order
+            top_n: Maximum number of processes to return
+            rows: Row indices to consider (e.g. from a filter), or None for all
+        
+        Returns:
+            Sorted and limited list of processes
+        """
+        if rows is None:
+            rows = range(len(table))
+        
+        key: Callable[[int], Any]
         if sort_by == "mem":
-            sorted_processes = sorted(
-                processes,
-                key=lambda p: p.memory.rss_bytes or 0,
-                reverse=reverse
-            )
+            key = table.rss.__getitem__
+        elif sort_by == "cpu":
+            cpu = table.cpu
+            
+            def key(row: int) -> float:
+                return -1.0 if math.isnan(cpu[row]) else cpu[row]
         elif sort_by == "name":
-            sorted_processes = sorted(
-                processes,
-                key=lambda p: p.name.lower(),
-                reverse=reverse
-            )
+            folded = [name.lower() for name in table.names]
+            name_ids = table.name_ids
+            
+            def key(row: int) -> str:
+                return folded[name_ids[row]]
         else:  # pid
-            sorted_processes = sorted(
-                processes,
-                key=lambda p: p.pid,
-                reverse=reverse
-            )
+            key = table.pids.__getitem__
         
-        return sorted_processes[:top_n]
+        return table.processes(select_top(rows, key, top_n, reverse))
+
+
+def _rss(process: Process) -> int:
+    return process.memory.rss_bytes or 0
+
 
+def _uss(process: Process) -> int:
+    memory = process.memory
+    if memory.uss_bytes is None:
+        return memory.rss_bytes or 0
+    return memory.uss_bytes
@@ -0,0 +1,199 @@
+"""
+Output - Buffered rendering of command results as tables, JSON or CSV.
+
+Everything a command prints goes through one OutputWriter, which hands
+stdout large chunks instead of issuing one write per line. Rows are
+serialised one at a time as they are produced, so a full process dump
+is never held in memory as a single document.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+import click
+
+
+FORMATS = ("table", "json", "ndjson", "csv")
+
+PROCESS_FIELDS = (
+    "pid", "ppid", "name", "user", "cpu_percent",
+    "rss_bytes", "vms_bytes", "uss_bytes", "pss_bytes", "memory_percent",
+)
+
+GROUP_FIELDS = ("name", "pid", "user", "count", "rss_bytes", "vms_bytes", "memory_percent")
+
+LEAK_FIELDS = (
+    "pid", "name", "create_time", "growth_mb_per_hour", "r_squared", "duration", "samples",
+    "rss_mb",
+)
+
+
+class OutputWriter:
+    """
+    Accumulates text and writes it to stdout in chunks.
+
+    Usable as a context manager; whatever is still buffered is written
+    when the block exits.
+    """
+
+    def __init__(self, buffer_size: int = 64 * 1024):
+        """
+        Args:
+            buffer_size: Characters buffered before a write is issued
+        """
+        self.buffer_size = buffer_size
+        self._chunks: List[str] = []
+        self._size = 0
+
+    def write(self, text: str) -> None:
+        """Buffers text, writing the buffer out once it is full."""
+        self._chunks.append(text)
+        self._size += len(text)
+        if self._size >= self.buffer_size:
+            self.flush()
+
+    def line(self, text: str = "") -> None:
+        """Buffers one line of text."""
+        self.write(text + "\n")
+
+    def flush(self) -> None:
+        """Writes everything buffered so far."""
+        if self._chunks:
+            # click.echo strips styles when stdout is not a terminal
+            click.echo("".join(self._chunks), nl=False)
+            self._chunks = []
+            self._size = 0
+
+    def __enter__(self) -> "OutputWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.flush()
+
+
+def process_record(process: Any) -> Dict[str, Any]:
+    """Returns the machine-readable fields of a Process."""
+    return {
+        "pid": process.pid,
+        "ppid": process.ppid,
+        "name": process.name,
+        "user": process.username,
+        "cpu_percent": process.cpu_percent,
+        "rss_bytes": process.memory.rss_bytes,
+        "vms_bytes": process.memory.vms_bytes,
+        "uss_bytes": process.memory.uss_bytes,
+        "pss_bytes": process.memory.pss_bytes,
+        "memory_percent": process.memory.percent,
+    }
+
+
+def group_record(group: Any) -> Dict[str, Any]:
+    """Returns the machine-readable fields of a ProcessGroup."""
+    return {
+        "name": group.name,
+        "pid": group.pid,
+        "user": group.username,
+        "count": group.count,
+        "rss_bytes": group.rss_bytes,
+        "vms_bytes": group.vms_bytes,
+        "memory_percent": group.percent,
+    }
+
+
+def leak_record(suspect: Any) -> Dict[str, Any]:
+    """Returns the machine-readable fields of a LeakSuspect."""
+    return {field: getattr(suspect, field) for field in LEAK_FIELDS}
+
+
+def write_records(
+    out: OutputWriter,
+    fmt: str,
+    records: Iterable[Dict[str, Any]],
+    fields: Sequence[str],
+    header: bool = True
+) -> int:
+    """
+    Streams records as a JSON array, NDJSON lines or CSV rows.
+
+    Args:
+        out: Writer to write to
+        fmt: "json", "ndjson" or "csv"
+        records: Records to write, consumed one at a time
+        fields: CSV columns, in order
+        header: Whether to write the CSV header row
+
+    Returns:
+        Number of records written
+    """
+    count = 0
+    if fmt == "csv":
+        import csv
+
+        writer = csv.writer(out, lineterminator="\n")
+        if header:
+            writer.writerow(fields)
+        for record in records:
+            writer.writerow([_csv_value(record.get(field)) for field in fields])
+            count += 1
+        return count
+
+    import json
+
+    if fmt == "ndjson":
+        # One encoder for the whole stream; json.dumps with options builds one per call
+        encode = json.JSONEncoder(separators=(",", ":")).encode
+        for record in records:
+            out.write(encode(record) + "\n")
+            count += 1
+        return count
+
+    out.write("[")
+    for record in records:
+        out.write(("\n  " if count == 0 else ",\n  ") + json.dumps(record))
+        count += 1
+    out.write("\n]\n" if count else "]\n")
+    return count
+
+
+def write_document(out: OutputWriter, fmt: str, document: Dict[str, Any]) -> None:
+    """
+    Writes one result as a JSON object, an NDJSON line or a one-row CSV.
+
+    Nested objects become underscore-joined CSV columns, lists of objects
+    are numbered (``disks_0_percent``), and other lists are joined with
+    "; ".
+
+    Args:
+        out: Writer to write to
+        fmt: "json", "ndjson" or "csv"
+        document: Result to write
+    """
+    if fmt == "json":
+        import json
+
+        out.write(json.dumps(document, indent=2) + "\n")
+        return
+    if fmt == "ndjson":
+        write_records(out, fmt, [document], ())
+        return
+
+    flat = _flatten(document)
+    write_records(out, fmt, [flat], list(flat))
+
+
+def _flatten(document: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    flat: Dict[str, Any] = {}
+    for key, value in document.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{name}_"))
+        elif isinstance(value, (list, tuple)) and value and isinstance(value[0], dict):
+            for position, item in enumerate(value):
+                flat.update(_flatten(item, f"{name}_{position}_"))
+        elif isinstance(value, (list, tuple)):
+            flat[name] = "; ".join(str(item) for item in value)
+        else:
+            flat[name] = value
+    return flat
+
+
+def _csv_value(value: Optional[Any]) -> Any:
+    return "" if value is None else value
@@ -1,2 +1 @@
 """Tests for Mico."""
-
@@ -2,7 +2,8 @@
 
 import pytest
 from mico.adapters.system import SystemAdapter
-from mico.domain.entities import SystemInfo, MemoryInfo, Process, SystemMetrics
+from mico.domain.entities import SystemInfo, MemoryInfo, Process, ProcessSnapshot, SystemMetrics
+from mico.domain.process_table import ProcessTable
 
 
 def test_system_adapter_get_system_info():
@@ -33,6 +34,65 @@ def test_system_adapter_get_all_processes():
         assert process.memory.rss_bytes is not None
 
 
+def test_system_adapter_get_process_snapshot():
+    """Test SystemAdapter.get_process_snapshot returns a timestamped ProcessSnapshot."""
+    adapter = SystemAdapter()
+    snapshot = adapter.get_process_snapshot()
+    
+    assert isinstance(snapshot, ProcessSnapshot)
+    assert snapshot.timestamp > 0
+    assert snapshot.memory_total_bytes > 0
+    assert len(snapshot) > 0
+    
+    for process in list(snapshot)[:5]:
+        assert isinstance(process, Process)
+        expected = process.memory.rss_bytes / snapshot.memory_total_bytes * 100
+        assert process.memory.percent == pytest.approx(expected)
+
+
+def test_system_adapter_iter_processes():
+    """Test SystemAdapter.iter_processes lazily yields Process objects."""
+    processes = SystemAdapter().iter_processes()
+    
+    assert not isinstance(processes, list)
+    first = next(processes)
+    assert isinstance(first, Process)
+    assert first.memory.rss_bytes is not None
+
+
+def test_system_adapter_get_process_table():
+    """Test SystemAdapter.get_process_table returns a populated ProcessTable."""
+    table = SystemAdapter().get_process_table()
+    
+    assert isinstance(table, ProcessTable)
+    assert len(table) > 0
+    assert len(table.names) <= len(table)
+    
+    process = table[0]
+    assert isinstance(process, Process)
+    assert process.pid > 0
+    assert process.memory.rss_bytes == table.rss[0]
+    assert any(p.ppid is not None for p in table)
+
+
+def test_system_adapter_reads_system_totals_once(monkeypatch):
+    """Test get_process_snapshot reads virtual memory once per snapshot."""
+    import psutil
+    
+    calls = []
+    real_virtual_memory = psutil.virtual_memory
+    
+    def counting_virtual_memory():
+        calls.append(1)
+        return real_virtual_memory()
+    
+    monkeypatch.setattr(psutil, "virtual_memory", counting_virtual_memory)
+    snapshot = SystemAdapter().get_process_snapshot()
+    
+    assert len(snapshot) > 1
+    assert len(calls) == 1
+
+
 def test_system_adapter_get_system_metrics():
     """Test SystemAdapter.get_system_metrics returns SystemMetrics."""
     adapter = SystemAdapter()
@@ -47,4 +107,398 @@ def test_system_adapter_get_system_metrics():
     assert metrics.disk_percent <= 100
     assert metrics.memory_total_gb > 0
     assert metrics.disk_total_gb > 0
+    assert metrics.io is not None
+    assert metrics.io.interval > 0
+
+
+def test_synthetic_adapter_is_deterministic():
+    """Test SyntheticSystemAdapter generates the same host for the same seed."""
+    from mico.adapters.synthetic import SyntheticSystemAdapter
+    
+    first = SyntheticSystemAdapter(count=500, seed=7)
+    second = SyntheticSystemAdapter(count=500, seed=7)
+    other = SyntheticSystemAdapter(count=500, seed=8)
+    
+    assert first.get_all_processes() == second.get_all_processes()
+    assert first.get_all_processes() != other.get_all_processes()
+    assert first.get_system_metrics() == second.get_system_metrics()
+    
+    processes = first.get_all_processes()
+    assert len(processes) == 500
+    assert len({p.pid for p in processes}) == 500
+    assert len(first.get_process_table()) == 500
+    assert 0 <= first.get_system_info().memory.percent <= 100
+
+
+def test_incremental_adapter_tracks_new_and_exited_processes():
+    """Test IncrementalSystemAdapter reuses unchanged rows and evicts exited processes."""
+    import subprocess
+    import sys
+    from mico.adapters.incremental import IncrementalSystemAdapter
+    
+    adapter = IncrementalSystemAdapter()
+    first = {p.pid: p for p in adapter.get_process_snapshot()}
+    assert adapter.last_stats["new"] == len(first)
+    
+    child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    try:
+        second = {p.pid: p for p in adapter.get_process_snapshot()}
+        assert child.pid in second
+        assert adapter.last_stats["new"] >= 1
+        
+        unchanged = [
+            pid for pid in first if pid in second and second[pid].memory == first[pid].memory
+        ]
+        assert unchanged
+        assert all(second[pid] is first[pid] for pid in unchanged)
+    finally:
+        child.kill()
+        child.wait()
+    
+    third = {p.pid: p for p in adapter.get_process_snapshot()}
+    assert child.pid not in third
+    assert adapter.last_stats["evicted"] >= 1
+
+
+def test_incremental_adapter_rereads_names_after_exec():
+    """Test IncrementalSystemAdapter picks up the new name of a process that exec'd."""
+    import subprocess
+    import sys
+    import time
+    import psutil
+    from mico.adapters.incremental import IncrementalSystemAdapter
+    
+    probe = object()
+    fresh = IncrementalSystemAdapter(name_ttl=0, disk_probe=probe)
+    cached = IncrementalSystemAdapter(name_ttl=3600)
+    assert fresh.disk_probe is probe
+    
+    # The child execs sleep, keeping its PID and create time, once stdin closes
+    script = "import os, sys; sys.stdin.read(); os.execvp('sleep', ['sleep', '30'])"
+    child = subprocess.Popen([sys.executable, "-c", script], stdin=subprocess.PIPE)
+    try:
+        before = {p.pid: p for p in fresh.get_process_snapshot()}[child.pid]
+        cached.get_process_snapshot()
+        child.stdin.close()
+        
+        deadline = time.monotonic() + 10
+        while psutil.Process(child.pid).name() != "sleep" and time.monotonic() < deadline:
+            time.sleep(0.05)
+        
+        assert before.name != "sleep"
+        assert {p.pid: p for p in fresh.get_process_snapshot()}[child.pid].name == "sleep"
+        assert {p.pid: p for p in cached.get_process_snapshot()}[child.pid].name == before.name
+    finally:
+        child.kill()
+        child.wait()
+
+
+def test_username_cache_resolves_each_uid_once():
+    """Test UsernameCache hits the lookup once per uid within the TTL."""
+    from mico.adapters.users import UsernameCache
+    
+    lookups = []
+    cache = UsernameCache(ttl=60, lookup=lambda uid: lookups.append(uid) or f"user{uid}")
+    
+    names = [cache.resolve(uid) for uid in [0, 501, 0, 501, 0]]
+    
+    assert names == ["user0", "user501", "user0", "user501", "user0"]
+    assert lookups == [0, 501]
+    
+    cache.invalidate(0)
+    cache.resolve(0)
+    assert lookups == [0, 501, 0]
+    
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_username_cache_expires_entries():
+    """Test UsernameCache resolves again once an entry is older than the TTL."""
+    from mico.adapters.users import UsernameCache
+    
+    lookups = []
+    cache = UsernameCache(ttl=0, lookup=lambda uid: lookups.append(uid) or "name")
+    
+    cache.resolve(1)
+    cache.resolve(1)
+    
+    assert lookups == [1, 1]
+
+
+def test_system_adapter_usernames_match_psutil():
+    """Test cached username resolution matches psutil's own lookup."""
+    import psutil
+    
+    processes = SystemAdapter().get_all_processes()
+    checked = 0
+    for process in processes[:20]:
+        try:
+            expected = psutil.Process(process.pid).username()
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+        assert process.username == expected
+        checked += 1
+    
+    assert checked > 0
+
+
+def test_system_adapter_without_usernames():
+    """Test usernames=False skips user resolution entirely."""
+    processes = SystemAdapter(usernames=False).get_all_processes()
+    
+    assert processes
+    assert all(process.username is None for process in processes)
 
+
+def test_full_memory_reader_reads_and_caches_per_process():
+    """Test USS/PSS reads are cached per (pid, create_time) until they go stale."""
+    import os
+    from mico.adapters.full_memory import FullMemoryReader
+    
+    now = [0.0]
+    reader = FullMemoryReader(max_workers=2, max_age=10.0, clock=lambda: now[0])
+    own = Process(pid=os.getpid(), name="python", memory=MemoryInfo(rss_bytes=1, vms_bytes=1))
+    gone = Process(pid=2 ** 22 + 12345, name="gone", memory=MemoryInfo(rss_bytes=1, vms_bytes=1))
+    
+    first, missing = reader.enrich([own, gone])
+    assert first.memory.uss_bytes is not None and first.memory.uss_bytes > 0
+    assert missing is gone
+    assert reader.reads == 1
+    
+    reader.enrich([own, own])
+    assert reader.reads == 1
+    
+    now[0] = 10.0
+    reader.enrich([own])
+    assert reader.reads == 2
+    reader.close()
+
+
+def test_system_adapter_read_full_memory():
+    """Test SystemAdapter fills USS in for the processes it is given."""
+    adapter = SystemAdapter()
+    processes = sorted(adapter.get_all_processes(), key=lambda p: p.pid)[-3:]
+    
+    enriched = adapter.read_full_memory(processes)
+    
+    assert [p.pid for p in enriched] == [p.pid for p in processes]
+    assert all(p.memory.rss_bytes == q.memory.rss_bytes for p, q in zip(enriched, processes))
+
+
+def _partition(mountpoint, device, fstype="ext4", opts="rw"):
+    from collections import namedtuple
+    
+    Partition = namedtuple("Partition", "device mountpoint fstype opts")
+    return Partition(device, mountpoint, fstype, opts)
+
+
+def test_disk_probe_selects_relevant_volumes():
+    """Test images, read-only and duplicate mounts are skipped, and filters apply."""
+    from mico.adapters.disks import DiskProbe
+    
+    partitions = [
+        _partition("/", "/dev/sda1", opts="ro"),
+        _partition("/data", "/dev/sdb1"),
+        _partition("/srv/data", "/dev/sdb1"),
+        _partition("/snap/core/1", "/dev/loop0", "squashfs", "ro"),
+        _partition("/mnt/backup", "/dev/sdc1", opts="ro"),
+        _partition("/mnt/nfs", "server:/export", "nfs"),
+    ]
+    probe = DiskProbe(partitions=lambda: partitions)
+    assert probe.mountpoints() == [("/", "ext4"), ("/data", "ext4"), ("/mnt/nfs", "nfs")]
+    
+    probe = DiskProbe(exclude=["/mnt/*"], partitions=lambda: partitions)
+    assert [mount for mount, _ in probe.mountpoints()] == ["/", "/data"]
+    
+    probe = DiskProbe(include=["/mnt/*"], partitions=lambda: partitions)
+    assert [mount for mount, _ in probe.mountpoints()] == ["/mnt/backup", "/mnt/nfs"]
+    
+    probe = DiskProbe(partitions=lambda: [])
+    assert probe.mountpoints() == [("/", "")]
+
+
+def test_disk_probe_bounds_hung_mounts():
+    """Test a hung mount is reported within the timeout and its stat is not restarted."""
+    import threading
+    import time
+    from collections import namedtuple
+    from mico.adapters.disks import DiskProbe
+    
+    Usage = namedtuple("Usage", "total used percent")
+    release = threading.Event()
+    calls = []
+    
+    def usage(mountpoint):
+        calls.append(mountpoint)
+        if mountpoint == "/mnt/nfs":
+            release.wait()
+        return Usage(100 * 1024 ** 3, 95 * 1024 ** 3, 95.0)
+    
+    probe = DiskProbe(
+        timeout=0.1,
+        max_age=0.0,
+        partitions=lambda: [
+            _partition("/", "/dev/sda1"),
+            _partition("/mnt/nfs", "server:/", "nfs"),
+        ],
+        usage=usage,
+    )
+    
+    started = time.perf_counter()
+    root, nfs = probe.probe()
+    assert time.perf_counter() - started < 0.5
+    assert root.responding and root.percent == 95.0 and root.total_gb == 100.0
+    assert not nfs.responding
+    
+    probe.probe()
+    assert calls.count("/mnt/nfs") == 1
+    
+    release.set()
+    time.sleep(0.05)
+    assert all(disk.responding for disk in probe.probe())
+    
+    metrics = SystemAdapter(disk_probe=probe).get_system_metrics()
+    assert metrics.disk_percent == 95.0
+    assert [disk.mountpoint for disk in metrics.disks] == ["/", "/mnt/nfs"]
+
+
+def test_disk_probe_caches_results():
+    """Test a probe result is reused until it is max_age seconds old."""
+    from collections import namedtuple
+    from mico.adapters.disks import DiskProbe
+    
+    Usage = namedtuple("Usage", "total used percent")
+    now = [0.0]
+    calls = []
+    probe = DiskProbe(
+        max_age=5.0,
+        clock=lambda: now[0],
+        partitions=lambda: [_partition("/", "/dev/sda1")],
+        usage=lambda mountpoint: calls.append(mountpoint) or Usage(1, 1, 100.0)
+    )
+    
+    first = probe.probe()
+    now[0] = 4.0
+    assert probe.probe() is first
+    now[0] = 5.0
+    probe.probe()
+    assert len(calls) == 2
+
+
+def test_metrics_codec_round_trips_disks():
+    """Test per-volume usage survives the daemon's JSON codec."""
+    import json
+    from mico.adapters.codec import metrics_from_dict, metrics_to_dict
+    from mico.domain.entities import DiskUsage
+    
+    metrics = SystemMetrics(
+        10.0, 20.0, 90.0, 16.0, 3.2, 100.0, 90.0,
+        disks=(
+            DiskUsage("/", "apfs", 500.0, 100.0, 20.0),
+            DiskUsage("/Volumes/nas", "smbfs", responding=False),
+        ),
+    )
+    
+    assert metrics_from_dict(json.loads(json.dumps(metrics_to_dict(metrics)))) == metrics
+
+
+def test_metrics_codec_round_trips_io_rates():
+    """Test disk and network rates survive the daemon's JSON codec."""
+    import json
+    from mico.adapters.codec import metrics_from_dict, metrics_to_dict
+    from mico.domain.entities import IOMetrics, IORate
+    
+    sda = IORate("sda", 1e6, 2e6, 10.0, 20.0, 35.0)
+    eth0 = IORate("eth0", 3e6, 4e6, 300.0, 400.0)
+    metrics = SystemMetrics(
+        10.0, 20.0, 30.0, 16.0, 3.2, 100.0, 30.0,
+        io=IOMetrics(
+            1.0,
+            IORate("total", 1e6, 2e6, 10.0, 20.0, 35.0),
+            IORate("total", 3e6, 4e6, 300.0, 400.0),
+            disks=(sda,),
+            interfaces=(eth0,),
+        ),
+    )
+    
+    assert metrics_from_dict(json.loads(json.dumps(metrics_to_dict(metrics)))) == metrics
+
+
+def test_io_rate_sampler_computes_rates_from_deltas():
+    """Test rates per device and in total, with loopback, idle and reset devices handled."""
+    from collections import namedtuple
+    from mico.adapters.iorates import IORateSampler
+    
+    Disk = namedtuple("Disk", "read_count write_count read_bytes write_bytes busy_time")
+    Nic = namedtuple("Nic", "bytes_sent bytes_recv packets_sent packets_recv")
+    Stats = namedtuple("Stats", "speed flags")
+    now = [0.0]
+    disks = [{
+        "sda": Disk(100, 100, 10_000, 20_000, 1_000),
+        "sdb": Disk(50, 0, 5_000, 0, 500),
+        "loop0": Disk(10, 0, 1_000, 0, 10),
+        "sdc": Disk(0, 0, 0, 0, 0),
+    }]
+    nics = [{
+        "eth0": Nic(1_000, 2_000, 10, 20),
+        "lo": Nic(9_000, 9_000, 90, 90),
+    }]
+    
+    def disk_counters(perdisk):
+        if perdisk:
+            return disks[0]
+        return Disk(*map(sum, zip(*disks[0].values())))
+    
+    sampler = IORateSampler(
+        clock=lambda: now[0],
+        disk_counters=disk_counters,
+        net_counters=lambda pernic: nics[0],
+        net_stats=lambda: {"eth0": Stats(1000, "up,broadcast"), "lo": Stats(0, "up,loopback")}
+    )
+    
+    now[0] = 2.0
+    disks[0] = {
+        "sda": Disk(300, 500, 1_010_000, 4_020_000, 2_800),
+        "sdb": Disk(5, 0, 500, 0, 50),  # counters reset
+        "loop0": Disk(10, 0, 1_000, 0, 10),
+        "sdc": Disk(0, 0, 0, 0, 0),
+    }
+    nics[0] = {
+        "eth0": Nic(1_000 + 50_000_000, 2_000 + 100_000_000, 1_010, 2_020),
+        "lo": Nic(19_000, 19_000, 190, 190),
+    }
+    io = sampler.rates()
+    
+    assert io.interval == 2.0
+    assert [disk.name for disk in io.disks] == ["sda", "sdb"]
+    sda, sdb = io.disks
+    assert sda.read_bytes_per_sec == 500_000 and sda.write_bytes_per_sec == 2_000_000
+    assert sda.read_ops_per_sec == 100 and sda.write_ops_per_sec == 200
+    assert sda.busy_percent == 90.0
+    assert sdb.read_bytes_per_sec == 0 and sdb.busy_percent == 0
+    assert io.disk.busy_percent == 90.0
+    
+    assert [nic.name for nic in io.interfaces] == ["eth0"]
+    assert (
+        io.network.read_bytes_per_sec == 50_000_000 and io.network.write_bytes_per_sec == 25_000_000
+    )
+    assert io.network.read_ops_per_sec == 1_000
+    # 50 MB/s received on a 1000 Mbit/s link
+    assert io.network.busy_percent == pytest.approx(40.0)
+
+
+def test_io_rate_sampler_waits_only_for_the_remainder():
+    """Test a reading sleeps only when less than min_interval has passed."""
+    import time
+    from mico.adapters.iorates import IORateSampler
+    
+    sampler = IORateSampler(min_interval=0.2)
+    time.sleep(0.15)
+    started = time.perf_counter()
+    sampler.rates()
+    assert time.perf_counter() - started < 0.15
+    
+    started = time.perf_counter()
+    assert sampler.rates().interval >= 0.2
+    assert time.perf_counter() - started >= 0.15
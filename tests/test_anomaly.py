@@ -0,0 +1,82 @@
+"""Tests for streaming anomaly detection."""
+
+import random
+import pytest
+from mico.domain.anomaly import AnomalyDetector, EwmaStatistic
+from mico.domain.entities import SystemMetrics
+from mico.domain.use_cases.calculate_health import CalculateSystemHealthUseCase
+
+
+def _metrics(cpu, memory=50.0, disk=30.0):
+    return SystemMetrics(
+        cpu_percent=cpu,
+        memory_percent=memory,
+        disk_percent=disk,
+        memory_total_gb=16.0,
+        memory_used_gb=8.0,
+        disk_total_gb=500.0,
+        disk_used_gb=150.0,
+    )
+
+
+def test_ewma_statistic_converges_on_mean_and_variance():
+    """Test the EWMA mean and variance settle on those of a stationary series."""
+    rng = random.Random(0)
+    statistic = EwmaStatistic(alpha=0.01)
+    for _ in range(20000):
+        statistic.update(rng.gauss(40.0, 5.0))
+    
+    assert statistic.mean == pytest.approx(40.0, abs=1.5)
+    assert statistic.stddev == pytest.approx(5.0, abs=1.0)
+    
+    with pytest.raises(ValueError):
+        EwmaStatistic(alpha=0.0)
+
+
+def test_detector_uses_each_hosts_own_baseline():
+    """Test 90% CPU is normal on a busy host, 50% is flagged on an idle one."""
+    rng = random.Random(1)
+    busy = AnomalyDetector()
+    idle = AnomalyDetector()
+    for second in range(100):
+        assert busy.update(_metrics(rng.uniform(86.0, 94.0)), timestamp=second) == []
+        assert idle.update(_metrics(rng.uniform(2.0, 6.0)), timestamp=second) == []
+    
+    assert busy.update(_metrics(91.0), timestamp=100) == []
+    
+    anomalies = idle.update(_metrics(50.0), timestamp=100)
+    assert [anomaly.metric for anomaly in anomalies] == ["cpu"]
+    anomaly = anomalies[0]
+    assert anomaly.value == 50.0 and anomaly.timestamp == 100
+    assert anomaly.deviation > 3
+    assert anomaly.message.startswith("Unusually high CPU usage: 50.0% (usually 4.")
+
+
+def test_detector_waits_for_warmup_and_adapts():
+    """Test nothing is flagged during warmup and a lasting level becomes normal."""
+    detector = AnomalyDetector(warmup=10)
+    for second in range(9):
+        detector.update(_metrics(10.0), timestamp=second)
+    assert detector.update(_metrics(80.0), timestamp=9) == []
+    
+    detector = AnomalyDetector(warmup=10)
+    for second in range(20):
+        detector.update(_metrics(10.0), timestamp=second)
+    flagged = [bool(detector.update(_metrics(80.0), timestamp=20 + tick)) for tick in range(200)]
+    assert flagged[0]
+    assert not any(flagged[-50:])
+    assert len(detector.statistics) == 3
+
+
+def test_health_reports_anomalies_alongside_warnings():
+    """Test health lists anomalies apart from its threshold warnings."""
+    detector = AnomalyDetector(warmup=5)
+    for second in range(5):
+        result = CalculateSystemHealthUseCase.execute(_metrics(5.0), detector)
+        assert result["anomalies"] == []
+    
+    result = CalculateSystemHealthUseCase.execute(_metrics(65.0), detector)
+    
+    assert result["warnings"] == ["CPU usage elevated: 65.0%"]
+    assert len(result["anomalies"]) == 1 and "CPU usage" in result["anomalies"][0]
+    assert CalculateSystemHealthUseCase.execute(_metrics(65.0))["anomalies"] == []
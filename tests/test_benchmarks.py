@@ -0,0 +1,212 @@
+"""Benchmarks driven by the synthetic large-host adapter.
+
+Each benchmark reports throughput (rows/s) and peak traced memory for a
+range of population sizes. The default sizes keep the regular test run
+fast; set MICO_BENCH_SIZES (e.g. "1000,10000,50000,200000") to cover
+large hosts, and run with ``-m benchmark -s`` to see the report.
+"""
+
+import gc
+import os
+import time
+import tracemalloc
+
+import pytest
+from click.testing import CliRunner
+from mico.adapters.synthetic import SyntheticSystemAdapter
+from mico.cli import cli
+from mico.domain.use_cases.calculate_health import CalculateSystemHealthUseCase
+from mico.domain.use_cases.filter_processes import FilterProcessesUseCase
+from mico.domain.use_cases.list_processes import ListProcessesUseCase
+
+
+SIZES = [int(size) for size in os.environ.get("MICO_BENCH_SIZES", "1000,10000").split(",")]
+
+_adapters = {}
+
+
+def _adapter(size):
+    if size not in _adapters:
+        _adapters[size] = SyntheticSystemAdapter(count=size, seed=size)
+    return _adapters[size]
+
+
+def _measure(name, rows, fn):
+    """Run fn once timed and once under tracemalloc, then report."""
+    gc.collect()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    
+    throughput = rows / elapsed if elapsed > 0 else float("inf")
+    print(
+        f"\n{name:<32} {rows:>8} rows {elapsed * 1000:>9.1f} ms {throughput:>12,.0f} rows/s "
+        f"{peak / 1024 ** 2:>8.1f} MiB peak"
+    )
+    return result
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("size", SIZES)
+def test_bench_adapter_conversion(size):
+    """Benchmark converting raw rows into snapshots and tables."""
+    adapter = _adapter(size)
+    
+    snapshot = _measure("adapter -> ProcessSnapshot", size, adapter.get_process_snapshot)
+    table = _measure("adapter -> ProcessTable", size, adapter.get_process_table)
+    
+    assert len(snapshot) == len(table) == size
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("size", SIZES)
+def test_bench_filter_processes(size):
+    """Benchmark FilterProcessesUseCase over objects and over the table."""
+    adapter = _adapter(size)
+    processes = adapter.get_all_processes()
+    table = adapter.get_process_table()
+    
+    filtered = _measure(
+        "filter (objects)", size, lambda: FilterProcessesUseCase.execute(processes, "chrome")
+    )
+    rows = _measure(
+        "filter (table)", size, lambda: FilterProcessesUseCase.execute_table(table, "chrome")
+    )
+    
+    assert len(filtered) == len(rows) > 0
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("size", SIZES)
+def test_bench_list_processes(size):
+    """Benchmark ListProcessesUseCase top-N selection."""
+    adapter = _adapter(size)
+    processes = adapter.get_all_processes()
+    table = adapter.get_process_table()
+    
+    for sort_by in ["mem", "name", "pid"]:
+        top = _measure(
+            f"list top 10 by {sort_by} (objects)", size,
+            lambda: ListProcessesUseCase.execute(processes, sort_by=sort_by, top_n=10)
+        )
+        top_table = _measure(
+            f"list top 10 by {sort_by} (table)", size,
+            lambda: ListProcessesUseCase.execute_table(table, sort_by=sort_by, top_n=10)
+        )
+        assert top == top_table
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("size", SIZES)
+def test_bench_calculate_health(size):
+    """Benchmark CalculateSystemHealthUseCase over many metric points."""
+    metrics = [
+        SyntheticSystemAdapter(count=1, seed=seed).get_system_metrics() for seed in range(size)
+    ]
+    
+    results = _measure(
+        "calculate health", size,
+        lambda: [CalculateSystemHealthUseCase.execute(point) for point in metrics]
+    )
+    
+    assert len(results) == size
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_bench_calculate_health_batch(size, use_numpy):
+    """Benchmark execute_batch over metric columns, with and without NumPy."""
+    if use_numpy:
+        pytest.importorskip("numpy")
+    metrics = [
+        SyntheticSystemAdapter(count=1, seed=seed).get_system_metrics() for seed in range(size)
+    ]
+    cpu = [point.cpu_percent for point in metrics]
+    memory = [point.memory_percent for point in metrics]
+    disk = [point.disk_percent for point in metrics]
+    
+    results = _measure(
+        f"calculate health batch{' (numpy)' if use_numpy else ''}", size,
+        lambda: CalculateSystemHealthUseCase.execute_batch(cpu, memory, disk, use_numpy=use_numpy)
+    )
+    
+    assert len(results["overall_score"]) == size
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("size", SIZES)
+def test_bench_cli_rendering(size):
+    """Benchmark the top and health commands end to end on a synthetic host."""
+    adapter = _adapter(size)
+    runner = CliRunner()
+    
+    result = _measure(
+        "cli top --top 50", size,
+        lambda: runner.invoke(cli, ["top", "--top", "50"], obj={"adapter": adapter})
+    )
+    assert result.exit_code == 0
+    assert "Top 50 Processes" in result.output
+    
+    result = _measure(
+        "cli health", 1, lambda: runner.invoke(cli, ["health"], obj={"adapter": adapter})
+    )
+    assert result.exit_code == 0
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("distinct_users", [1, 10, 100, 500])
+def test_bench_username_resolution(distinct_users, monkeypatch):
+    """Benchmark SystemAdapter collection with owners behind a slow directory service."""
+    from types import SimpleNamespace
+    from mico.adapters import system
+    from mico.adapters.users import UsernameCache
+    
+    if system.USER_ATTR != "uids":
+        pytest.skip("owners are only resolved from uids on POSIX")
+    
+    lookups = []
+    
+    def slow_lookup(uid):
+        lookups.append(uid)
+        time.sleep(0.0002)  # a fast LDAP/NIS round trip
+        return f"user{uid}"
+    
+    # The synthetic host's rows, as psutil would yield them with uids to resolve
+    size = 1000
+    procs = [
+        SimpleNamespace(pid=pid, info={
+            "pid": pid,
+            "ppid": ppid,
+            "name": name,
+            "memory_info": SimpleNamespace(rss=rss, vms=vms),
+            "uids": SimpleNamespace(real=index % distinct_users),
+        })
+        for index, (pid, name, _, rss, vms, ppid, _) in enumerate(_adapter(size).rows)
+    ]
+    monkeypatch.setattr(system.psutil, "process_iter", lambda attrs: iter(procs))
+    
+    def collect(ttl):
+        adapter = system.SystemAdapter(username_cache=UsernameCache(ttl=ttl, lookup=slow_lookup))
+        return [process.username for process in adapter.get_process_snapshot()]
+    
+    # A zero TTL resolves every process's owner, as an uncached adapter would
+    uncached = _measure(
+        f"collect, uncached ({distinct_users} users)", size, lambda: collect(ttl=0)
+    )
+    lookups.clear()
+    cached = _measure(
+        f"collect, cached ({distinct_users} users)", size, lambda: collect(ttl=300)
+    )
+    
+    assert cached == uncached
+    # One lookup per distinct uid in each of the timed and traced passes
+    assert len(lookups) == 2 * distinct_users
@@ -1,7 +1,12 @@
 """Tests for CLI module."""
 
+import csv
+import io
+import json
+
 import pytest
 from click.testing import CliRunner
+from mico.adapters.synthetic import SyntheticSystemAdapter
 from mico.cli import cli
 
 
@@ -21,6 +26,18 @@ def test_cli_help():
     assert "mico" in result.output.lower()
 
 
+def test_cli_lazy_commands_match_their_help():
+    """Test every lazily loaded command exists and --help lists it with its own help."""
+    import click
+    from mico.cli import LAZY_COMMANDS
+    
+    ctx = click.Context(cli)
+    for name, (_, help_text) in LAZY_COMMANDS.items():
+        command = cli.get_command(ctx, name)
+        assert command is not None and command.name == name
+        assert command.get_short_help_str(limit=200) == help_text
+
+
 def test_cli_memory_command():
     """Test memory command."""
     runner = CliRunner()
@@ -51,3 +68,279 @@ def test_cli_health_command():
     assert result.exit_code == 0
     assert "Health" in result.output or "health" in result.output.lower()
     assert "Score" in result.output or "score" in result.output.lower()
+
+
+def test_cli_health_command_cpu_window():
+    """Test health command with an explicit CPU sampling window."""
+    runner = CliRunner()
+    result = runner.invoke(cli, ["health", "--cpu-window", "0.05"])
+    assert result.exit_code == 0
+    assert "CPU" in result.output
+
+
+def test_cli_watch_command():
+    """Test watch command refreshes the requested number of times."""
+    runner = CliRunner()
+    result = runner.invoke(cli, ["watch", "--iterations", "2", "--interval", "0", "--top", "3"])
+    assert result.exit_code == 0
+    assert result.output.count("processes, refreshed in") == 2
+    assert "(2 samples)" in result.output
+
+
+def test_cli_top_command_invalid_filter():
+    """Test top command rejects an invalid filter expression."""
+    runner = CliRunner()
+    result = runner.invoke(cli, ["--no-daemon", "top", "--filter", "rss>lots"])
+    assert result.exit_code == 2
+    assert "Invalid" in result.output
+
+
+def test_cli_top_has_no_blank_lines_between_rows():
+    """Test top prints its rows back to back."""
+    runner = CliRunner()
+    result = runner.invoke(
+        cli, ["top", "--top", "5"], obj={"adapter": SyntheticSystemAdapter(count=50)}
+    )
+    assert result.exit_code == 0
+    table = result.output.split("-" * 85 + "\n", 1)[1]
+    assert table.rstrip("\n").count("\n") == 4
+
+
+@pytest.mark.parametrize("output_format", ["json", "ndjson", "csv"])
+def test_cli_top_machine_formats(output_format):
+    """Test top writes the same processes in every machine format."""
+    adapter = SyntheticSystemAdapter(count=200, seed=4)
+    runner = CliRunner()
+    result = runner.invoke(
+        cli, ["top", "--top", "0", "--format", output_format], obj={"adapter": adapter}
+    )
+    assert result.exit_code == 0
+    
+    if output_format == "json":
+        rows = json.loads(result.output)
+    elif output_format == "ndjson":
+        rows = [json.loads(line) for line in result.output.splitlines()]
+    else:
+        rows = list(csv.DictReader(io.StringIO(result.output)))
+    
+    expected = sorted(adapter.iter_processes(), key=lambda p: p.memory.rss_bytes, reverse=True)
+    assert [int(row["pid"]) for row in rows] == [p.pid for p in expected]
+    assert rows[0]["name"] == expected[0].name
+    assert int(rows[0]["rss_bytes"]) == expected[0].memory.rss_bytes
+
+
+def test_cli_top_json_without_matches():
+    """Test an empty result is still valid JSON."""
+    runner = CliRunner()
+    result = runner.invoke(
+        cli, ["top", "--filter", "no-such-process", "--format", "json"],
+        obj={"adapter": SyntheticSystemAdapter(count=20)}
+    )
+    assert result.exit_code == 0
+    assert json.loads(result.output) == []
+
+
+def test_cli_memory_and_health_json():
+    """Test memory and health write one JSON document each."""
+    adapter = SyntheticSystemAdapter(count=20)
+    runner = CliRunner()
+    
+    memory = json.loads(
+        runner.invoke(cli, ["memory", "--format", "json"], obj={"adapter": adapter}).output
+    )
+    assert memory["total_gb"] == pytest.approx(64.0)
+    
+    health = json.loads(
+        runner.invoke(cli, ["health", "--format", "json"], obj={"adapter": adapter}).output
+    )
+    assert set(health["scores"]) == {"cpu", "memory", "disk"}
+    assert health["metrics"]["cpu_percent"] == adapter.get_system_metrics().cpu_percent
+    
+    result = runner.invoke(cli, ["health", "--format", "csv"], obj={"adapter": adapter})
+    row = next(csv.DictReader(io.StringIO(result.output)))
+    assert float(row["overall_score"]) == health["overall_score"]
+    assert "scores_cpu" in row
+
+
+def test_cli_watch_csv_writes_header_once():
+    """Test watch streams CSV rows of every tick under a single header."""
+    runner = CliRunner()
+    result = runner.invoke(
+        cli, ["watch", "-n", "2", "--interval", "0", "--top", "3", "--format", "csv"],
+        obj={"adapter": SyntheticSystemAdapter(count=20)}
+    )
+    assert result.exit_code == 0
+    rows = list(csv.DictReader(io.StringIO(result.output)))
+    assert len(rows) == 6
+    assert result.output.count("timestamp,pid") == 1
+
+
+def test_cli_watch_accurate_requires_full_memory():
+    """Test watch --accurate is a usage error with an adapter that cannot read USS/PSS."""
+    class SnapshotOnlyAdapter:
+        def __init__(self):
+            self.adapter = SyntheticSystemAdapter(count=20)
+        
+        def get_process_snapshot(self):
+            return self.adapter.get_process_snapshot()
+        
+        def get_system_metrics(self):
+            return self.adapter.get_system_metrics()
+    
+    runner = CliRunner()
+    args = ["watch", "-n", "1", "--interval", "0", "--accurate"]
+    
+    result = runner.invoke(cli, args, obj={"adapter": SnapshotOnlyAdapter()})
+    assert result.exit_code == 2
+    assert "--accurate" in result.output and "AttributeError" not in result.output
+    
+    result = runner.invoke(cli, args, obj={"adapter": SyntheticSystemAdapter(count=20)})
+    assert result.exit_code == 0, result.output
+
+
+def test_cli_top_group_app_json():
+    """Test top --group app aggregates helpers and reports counts."""
+    adapter = SyntheticSystemAdapter(count=500, seed=2)
+    runner = CliRunner()
+    result = runner.invoke(
+        cli, ["top", "--group", "app", "--top", "0", "--format", "json"], obj={"adapter": adapter}
+    )
+    assert result.exit_code == 0
+    
+    groups = {group["name"]: group for group in json.loads(result.output)}
+    chrome = [p for p in adapter.iter_processes() if p.name.startswith("Google Chrome")]
+    assert groups["Google Chrome"]["count"] == len(chrome)
+    assert groups["Google Chrome"]["rss_bytes"] == sum(p.memory.rss_bytes for p in chrome)
+    
+    result = runner.invoke(cli, ["top", "--group", "tree", "--top", "3"], obj={"adapter": adapter})
+    assert result.exit_code == 0
+    assert "Top 3 Process Trees" in result.output
+    
+    result = runner.invoke(cli, ["top", "--group", "user", "--no-user"], obj={"adapter": adapter})
+    assert result.exit_code == 2
+    assert "--no-user" in result.output
+
+
+def test_cli_top_accurate_ranks_by_uss():
+    """Test top --accurate reports USS/PSS and ranks by USS."""
+    adapter = SyntheticSystemAdapter(count=500, seed=3)
+    runner = CliRunner()
+    result = runner.invoke(
+        cli, ["top", "--accurate", "--top", "5", "--format", "json"], obj={"adapter": adapter}
+    )
+    assert result.exit_code == 0
+    
+    rows = json.loads(result.output)
+    uss = [row["uss_bytes"] for row in rows]
+    assert len(rows) == 5 and uss == sorted(uss, reverse=True)
+    assert all(row["uss_bytes"] <= row["pss_bytes"] <= row["rss_bytes"] for row in rows)
+    
+    result = runner.invoke(cli, ["top", "--accurate", "--top", "5"], obj={"adapter": adapter})
+    assert result.exit_code == 0
+    assert "sorted by uss" in result.output and "USS (MB)" in result.output
+    
+    result = runner.invoke(cli, ["top", "--accurate", "--group", "app"], obj={"adapter": adapter})
+    assert result.exit_code != 0
+
+
+def test_cli_top_sort_cpu():
+    """Test top --sort cpu ranks by CPU and shows a CPU column."""
+    adapter = SyntheticSystemAdapter(count=500, seed=4)
+    runner = CliRunner()
+    result = runner.invoke(
+        cli, ["top", "--sort", "cpu", "--format", "json"], obj={"adapter": adapter}
+    )
+    assert result.exit_code == 0
+    
+    cpu = [row["cpu_percent"] for row in json.loads(result.output)]
+    assert cpu == sorted((p.cpu_percent for p in adapter.iter_processes()), reverse=True)[:10]
+    
+    result = runner.invoke(cli, ["top", "--sort", "cpu"], obj={"adapter": adapter})
+    assert result.exit_code == 0
+    assert "CPU (%)" in result.output
+
+
+def test_cli_top_pid_filter_uses_snapshot():
+    """Test top answers a filter pinning PIDs from a snapshot, not a stream."""
+    import json
+    
+    class SnapshotCountingAdapter(SyntheticSystemAdapter):
+        snapshots = 0
+        
+        def get_process_snapshot(self):
+            self.snapshots += 1
+            return super().get_process_snapshot()
+    
+    adapter = SnapshotCountingAdapter(count=50)
+    pids = [process.pid for process in adapter.iter_processes()][:2]
+    runner = CliRunner()
+    
+    result = runner.invoke(
+        cli,
+        ["top", "--filter", f"pid:{pids[0]}|{pids[1]}", "--format", "json"],
+        obj={"adapter": adapter},
+    )
+    
+    assert result.exit_code == 0, result.output
+    assert sorted(row["pid"] for row in json.loads(result.output)) == sorted(pids)
+    assert adapter.snapshots == 1
+
+
+def test_cli_leaks_ranks_growing_processes():
+    """Test leaks reports a process whose RSS keeps growing, and not a flat one."""
+    import json
+    
+    class GrowingAdapter:
+        def __init__(self):
+            self.readings = 0
+        
+        def iter_rss(self):
+            self.readings += 1
+            yield 10, 1.0, "leaky", (100 + self.readings) * 1024 ** 2
+            yield 11, 1.0, "steady", 100 * 1024 ** 2
+    
+    runner = CliRunner()
+    args = ["leaks", "--interval", "0", "--duration", "0.2", "--min-duration", "0"]
+    
+    result = runner.invoke(cli, args + ["--format", "json"], obj={"adapter": GrowingAdapter()})
+    
+    assert result.exit_code == 0, result.output
+    suspects = json.loads(result.output)
+    assert [suspect["name"] for suspect in suspects] == ["leaky"]
+    assert suspects[0]["growth_mb_per_hour"] > 0
+    assert suspects[0]["r_squared"] > 0.9
+    
+    result = runner.invoke(cli, args, obj={"adapter": GrowingAdapter()})
+    assert result.exit_code == 0
+    assert "leaky" in result.output and "steady" not in result.output
+
+
+def test_cli_dump_and_fleet(tmp_path):
+    """Test dumps written by 'mico dump' are ranked by 'mico fleet'."""
+    import json
+    
+    runner = CliRunner()
+    for index in range(3):
+        adapter = SyntheticSystemAdapter(count=100, seed=index)
+        path = str(tmp_path / f"web-{index}.json.gz")
+        result = runner.invoke(
+            cli, ["dump", path, "--host", f"web-{index}"], obj={"adapter": adapter}
+        )
+        assert result.exit_code == 0, result.output
+    
+    result = runner.invoke(
+        cli, ["fleet", str(tmp_path), "--top", "4", "--workers", "1", "--format", "json"]
+    )
+    
+    assert result.exit_code == 0, result.output
+    report = json.loads(result.output)
+    assert report["summary"]["hosts"] == 3
+    assert sorted(host["host"] for host in report["hosts"]) == ["web-0", "web-1", "web-2"]
+    assert len(report["processes"]) == 4
+    
+    result = runner.invoke(cli, ["fleet", str(tmp_path), "--workers", "1"])
+    assert result.exit_code == 0
+    assert "Least healthy hosts" in result.output and "web-1" in result.output
+    
+    result = runner.invoke(cli, ["dump"], obj={"adapter": SyntheticSystemAdapter(count=5)})
+    assert json.loads(result.output)["mico_dump"] == 1
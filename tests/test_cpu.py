@@ -0,0 +1,127 @@
+"""Tests for the CPU sampler."""
+
+import time
+
+import psutil
+import pytest
+from mico.adapters.cpu import CpuSampler, ProcessCpuTracker, utilisation
+from mico.adapters.system import SystemAdapter
+
+
+def test_utilisation_from_deltas():
+    """Test utilisation is the busy share of elapsed CPU time."""
+    assert utilisation((0.0, 10.0, 100.0), (1.0, 15.0, 120.0)) == 25.0
+    assert utilisation((0.0, 10.0, 100.0), (1.0, 10.0, 100.0)) == 0.0
+
+
+def test_cpu_sampler_background_answers_without_blocking():
+    """Test a running sampler answers from its rolling window."""
+    with CpuSampler(window=0.2, resolution=0.02) as sampler:
+        time.sleep(0.1)
+        
+        start = time.perf_counter()
+        value = sampler.percent()
+        elapsed = time.perf_counter() - start
+    
+    assert 0.0 <= value <= 100.0
+    assert elapsed < 0.01
+    assert not sampler.running
+
+
+def test_cpu_sampler_interval_less_reading_is_bounded():
+    """Test a reading without samples waits at most min_interval."""
+    sampler = CpuSampler(min_interval=0.05)
+    
+    start = time.perf_counter()
+    value = sampler.percent()
+    elapsed = time.perf_counter() - start
+    
+    assert 0.0 <= value <= 100.0
+    assert elapsed < 0.5
+
+
+def test_cpu_sampler_accurate_mode_blocks_for_window(monkeypatch):
+    """Test accurate mode keeps the blocking psutil interval."""
+    calls = []
+    monkeypatch.setattr(psutil, "cpu_percent", lambda interval=None: calls.append(interval) or 42.0)
+    
+    sampler = CpuSampler(window=1.0, accurate=True)
+    
+    assert sampler.percent() == 42.0
+    assert calls == [1.0]
+
+
+def test_cpu_sampler_rejects_invalid_window():
+    """Test the sampling window must be positive."""
+    with pytest.raises(ValueError):
+        CpuSampler(window=0)
+
+
+def test_system_adapter_uses_cpu_sampler():
+    """Test SystemAdapter reads CPU usage from its sampler."""
+    class FixedSampler:
+        def percent(self):
+            return 12.5
+    
+    metrics = SystemAdapter(cpu_sampler=FixedSampler()).get_system_metrics()
+    
+    assert metrics.cpu_percent == 12.5
+
+
+def test_system_adapter_creates_cpu_sampler_on_first_use(monkeypatch):
+    """Test CPU times are not read until system metrics are collected."""
+    import psutil
+    
+    reads = []
+    cpu_times = psutil.cpu_times
+    monkeypatch.setattr(psutil, "cpu_times", lambda *args: reads.append(1) or cpu_times(*args))
+    adapter = SystemAdapter()
+    adapter.get_system_info()
+    adapter.get_all_processes()
+    
+    assert reads == []
+    assert isinstance(adapter.cpu_sampler, CpuSampler)
+    assert reads
+
+
+def test_process_cpu_tracker_from_deltas():
+    """Test per-process CPU comes from deltas and forgets exited or reused PIDs."""
+    from collections import namedtuple
+    
+    Times = namedtuple("Times", "user system")
+    now = [0.0]
+    tracker = ProcessCpuTracker(clock=lambda: now[0])
+    
+    tracker.begin()
+    assert tracker.update(10, 1.0, Times(1.0, 1.0)) is None
+    assert tracker.update(11, 1.0, Times(0.0, 0.0)) is None
+    tracker.end()
+    
+    now[0] = 2.0
+    tracker.begin()
+    assert tracker.update(10, 1.0, Times(3.0, 2.0)) == 150.0
+    # PID 11 was reused by another process
+    assert tracker.update(11, 5.0, Times(0.0, 0.0)) is None
+    tracker.end()
+    
+    now[0] = 3.0
+    tracker.begin()
+    tracker.update(11, 5.0, Times(0.5, 0.0))
+    tracker.end()
+    assert len(tracker) == 1
+
+
+def test_system_adapter_process_cpu_over_one_interval():
+    """Test a busy process reports CPU usage measured around one shared interval."""
+    import os
+    
+    adapter = SystemAdapter(process_cpu=True)
+    adapter.prime_process_cpu()
+    deadline = time.perf_counter() + 0.2
+    while time.perf_counter() < deadline:
+        pass
+    
+    processes = {p.pid: p for p in adapter.get_process_snapshot()}
+    
+    assert processes[os.getpid()].cpu_percent > 20.0
+    assert SystemAdapter().get_process_snapshot().processes[0].cpu_percent is None
@@ -0,0 +1,246 @@
+"""Tests for the resident collector daemon."""
+
+import pytest
+from click.testing import CliRunner
+from mico.adapters.daemon import DaemonClient, DaemonServer, connect_daemon
+from mico.cli import cli
+from mico.domain.entities import MemoryInfo, Process, ProcessSnapshot, SystemInfo, SystemMetrics
+
+
+class StaticAdapter:
+    """Adapter returning fixed data and counting collections."""
+    
+    def __init__(self):
+        self.collections = 0
+    
+    def get_system_info(self):
+        return SystemInfo(
+            memory=MemoryInfo(
+                total_gb=16.0, available_gb=4.0, used_gb=12.0, free_gb=2.0, percent=75.0
+            )
+        )
+    
+    def get_process_snapshot(self):
+        self.collections += 1
+        return ProcessSnapshot(
+            timestamp=1700000000.0,
+            processes=(
+                Process(
+                    pid=1,
+                    name="launchd",
+                    memory=MemoryInfo(rss_bytes=10 * 1024 ** 2, vms_bytes=1, percent=0.1),
+                    username="root",
+                ),
+                Process(
+                    pid=42,
+                    name="daemonized",
+                    memory=MemoryInfo(rss_bytes=99 * 1024 ** 2, vms_bytes=2, percent=0.6),
+                ),
+            ),
+            memory_total_bytes=16 * 1024 ** 3,
+        )
+    
+    def get_system_metrics(self):
+        return SystemMetrics(
+            cpu_percent=12.0,
+            memory_percent=75.0,
+            disk_percent=40.0,
+            memory_total_gb=16.0,
+            memory_used_gb=12.0,
+            disk_total_gb=500.0,
+            disk_used_gb=200.0,
+        )
+
+
+@pytest.fixture
+def running_daemon(tmp_path):
+    adapter = StaticAdapter()
+    server = DaemonServer(adapter, socket_path=str(tmp_path / "mico.sock"), interval=60).start()
+    yield server
+    server.stop()
+
+
+def test_daemon_client_round_trips_entities(running_daemon):
+    """Test DaemonClient returns the daemon's snapshot as domain entities."""
+    client = DaemonClient(running_daemon.socket_path)
+    adapter = running_daemon.adapter
+    
+    assert client.ping()
+    assert client.get_process_snapshot() == adapter.get_process_snapshot()
+    assert client.get_system_info() == adapter.get_system_info()
+    assert client.get_system_metrics() == adapter.get_system_metrics()
+    assert [p.pid for p in client.iter_processes()] == [1, 42]
+
+
+def test_daemon_serves_warm_snapshot_without_recollecting(running_daemon):
+    """Test requests are answered from the cached snapshot."""
+    client = DaemonClient(running_daemon.socket_path)
+    collections = running_daemon.adapter.collections
+    
+    for _ in range(5):
+        client.get_all_processes()
+    
+    assert running_daemon.adapter.collections == collections
+
+
+def test_connect_daemon_without_daemon(tmp_path):
+    """Test connect_daemon returns None when nothing is listening."""
+    assert connect_daemon(str(tmp_path / "missing.sock")) is None
+
+
+def test_daemon_stop_removes_socket(tmp_path):
+    """Test stopping the daemon removes its socket file."""
+    path = tmp_path / "mico.sock"
+    server = DaemonServer(StaticAdapter(), socket_path=str(path), interval=60).start()
+    assert path.exists()
+    
+    server.stop()
+    
+    assert not path.exists()
+
+
+def test_daemon_socket_is_private(tmp_path, monkeypatch):
+    """Test the fallback socket lives in a 0700 directory and is created 0600."""
+    import os
+    import stat
+    import tempfile
+    from mico.adapters.daemon import default_socket_path
+    
+    monkeypatch.delenv("MICO_SOCKET", raising=False)
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    monkeypatch.setattr(tempfile, "gettempdir", lambda: str(tmp_path))
+    path = default_socket_path()
+    assert os.path.dirname(path) == str(tmp_path / f"mico-{os.getuid()}")
+    
+    server = DaemonServer(StaticAdapter(), interval=60).start()
+    try:
+        assert server.socket_path == path
+        assert stat.S_IMODE(os.stat(os.path.dirname(path)).st_mode) == 0o700
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+        assert connect_daemon() is not None
+    finally:
+        server.stop()
+
+
+def test_daemon_refuses_a_directory_open_to_others(tmp_path, monkeypatch):
+    """Test a pre-created, world-writable socket directory is not used."""
+    import os
+    import tempfile
+    
+    monkeypatch.delenv("MICO_SOCKET", raising=False)
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    monkeypatch.setattr(tempfile, "gettempdir", lambda: str(tmp_path))
+    directory = tmp_path / f"mico-{os.getuid()}"
+    directory.mkdir()
+    directory.chmod(0o777)
+    
+    with pytest.raises(RuntimeError, match="not a private directory"):
+        DaemonServer(StaticAdapter(), interval=60).start()
+
+
+def test_client_ignores_socket_owned_by_another_user(running_daemon, monkeypatch):
+    """Test a socket owned by someone else is neither trusted nor asked."""
+    import os
+    
+    uid = os.getuid()
+    monkeypatch.setattr(os, "getuid", lambda: uid + 1)
+    
+    assert connect_daemon(running_daemon.socket_path) is None
+    with pytest.raises(PermissionError):
+        DaemonClient(running_daemon.socket_path).get_system_info()
+
+
+def test_cli_answers_from_daemon(running_daemon):
+    """Test top, memory and health answer from a running daemon."""
+    runner = CliRunner()
+    base = ["--socket", running_daemon.socket_path]
+    
+    result = runner.invoke(cli, base + ["top"])
+    assert result.exit_code == 0
+    assert "daemonized" in result.output
+    
+    result = runner.invoke(cli, base + ["memory"])
+    assert result.exit_code == 0
+    assert "16.00 GB" in result.output
+    
+    result = runner.invoke(cli, base + ["health"])
+    assert result.exit_code == 0
+    assert "CPU" in result.output
+
+
+def test_daemon_records_metrics_history(running_daemon):
+    """Test every refresh is recorded and summarised on request."""
+    running_daemon.refresh()
+    client = DaemonClient(running_daemon.socket_path)
+    
+    summary = client.get_history(window=60, percentiles=[90])
+    
+    assert summary["samples"] == 2
+    assert summary["metrics"]["cpu"] == {"min": 12.0, "max": 12.0, "mean": 12.0, "p90": 12.0}
+
+
+def test_cli_history_command(running_daemon):
+    """Test history prints the daemon's metrics summary."""
+    runner = CliRunner()
+    result = runner.invoke(
+        cli, ["--socket", running_daemon.socket_path, "history", "-w", "60", "-p", "95"]
+    )
+    
+    assert result.exit_code == 0
+    assert "p95" in result.output
+    assert "MEMORY" in result.output
+
+
+def test_cli_history_without_daemon(tmp_path):
+    """Test history explains that it needs a running daemon."""
+    runner = CliRunner()
+    result = runner.invoke(cli, ["--socket", str(tmp_path / "missing.sock"), "history"])
+    
+    assert result.exit_code == 1
+    assert "mico daemon" in result.output
+
+
+def test_cli_no_daemon_collects_directly(running_daemon):
+    """Test --no-daemon bypasses a running daemon."""
+    runner = CliRunner()
+    result = runner.invoke(
+        cli,
+        ["--socket", running_daemon.socket_path, "--no-daemon", "top", "--filter", "daemonized"],
+    )
+    
+    assert "No processes found matching filter" in result.output
+
+
+def test_daemon_flags_anomalies(tmp_path):
+    """Test the daemon reports readings far from their baseline, live and in its history."""
+    import dataclasses
+    from mico.domain.anomaly import AnomalyDetector
+    
+    adapter = StaticAdapter()
+    server = DaemonServer(
+        adapter,
+        socket_path=str(tmp_path / "mico.sock"),
+        interval=60,
+        detector=AnomalyDetector(warmup=3)
+    ).start()
+    try:
+        for _ in range(3):
+            server.refresh()
+        client = DaemonClient(server.socket_path)
+        assert client.get_anomalies() == []
+        
+        spike = dataclasses.replace(adapter.get_system_metrics(), cpu_percent=97.0)
+        adapter.get_system_metrics = lambda: spike
+        server.refresh()
+        
+        anomalies = client.get_anomalies()
+        assert [anomaly.metric for anomaly in anomalies] == ["cpu"]
+        assert client.get_history(window=60)["anomalies"][0]["value"] == 97.0
+        
+        runner = CliRunner()
+        result = runner.invoke(cli, ["--socket", server.socket_path, "health"])
+        assert "Unusually high CPU usage: 97.0%" in result.output
+        result = runner.invoke(cli, ["--socket", server.socket_path, "history"])
+        assert "Unusually high CPU usage" in result.output
+    finally:
+        server.stop()
@@ -1,7 +1,7 @@
 """Tests for domain entities."""
 
-import pytest
 from mico.domain.entities import MemoryInfo, SystemInfo, Process
+from mico.domain.process_table import ProcessTable
 
 
 def test_memory_info_system_properties():
@@ -92,3 +92,32 @@ def test_system_info_creation():
     
     assert system_info.memory == memory
 
+
+def test_process_table_round_trip():
+    """Test ProcessTable stores rows in columns and rebuilds Process views."""
+    processes = [
+        Process(
+            pid=1,
+            name="launchd",
+            memory=MemoryInfo(rss_bytes=10, vms_bytes=20, percent=1.0),
+            username="root",
+        ),
+        Process(
+            pid=2,
+            name="Chrome",
+            memory=MemoryInfo(rss_bytes=30, vms_bytes=40, percent=3.0),
+            username="alice",
+        ),
+        Process(pid=3, name="Chrome", memory=MemoryInfo(rss_bytes=50, vms_bytes=60, percent=None)),
+    ]
+    
+    table = ProcessTable.from_processes(processes, timestamp=1700000000.0)
+    
+    assert len(table) == 3
+    assert table.timestamp == 1700000000.0
+    assert table.names == ["launchd", "Chrome"]
+    assert list(table.name_ids) == [0, 1, 1]
+    assert list(table.user_ids) == [0, 1, -1]
+    assert list(table) == processes
+    assert table[2].memory.percent is None
+    assert table.username(2) is None
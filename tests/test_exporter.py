@@ -0,0 +1,94 @@
+"""Tests for the OpenMetrics exporter."""
+
+import threading
+import time
+import urllib.request
+from mico.adapters.exporter import CONTENT_TYPE, ExporterServer, MetricsExporter, render_openmetrics
+from mico.adapters.synthetic import SyntheticSystemAdapter
+from mico.domain.entities import MemoryInfo, Process
+from mico.domain.use_cases.calculate_health import CalculateSystemHealthUseCase
+
+
+class SlowAdapter(SyntheticSystemAdapter):
+    """Synthetic adapter whose metrics take a while and are counted."""
+    
+    def __init__(self):
+        super().__init__(count=50)
+        self.metric_reads = 0
+    
+    def get_system_metrics(self):
+        self.metric_reads += 1
+        time.sleep(0.05)
+        return super().get_system_metrics()
+
+
+def test_render_openmetrics():
+    """Test the exposition has typed families, escaped labels and # EOF."""
+    adapter = SyntheticSystemAdapter(count=10)
+    metrics = adapter.get_system_metrics()
+    health = CalculateSystemHealthUseCase.execute(metrics)
+    process = Process(pid=7, name='odd "name"\\x', memory=MemoryInfo(rss_bytes=4096), username=None)
+    
+    text = render_openmetrics(metrics, health, [process], 0.01)
+    
+    assert text.endswith("# EOF\n")
+    assert "# TYPE mico_cpu_usage_percent gauge" in text
+    assert f"mico_cpu_usage_percent {float(metrics.cpu_percent)!r}" in text
+    assert 'mico_health_score{component="overall"}' in text
+    assert f'mico_health_status{{mico_health_status="{health["status"]}"}} 1.0' in text
+    assert (
+        'mico_process_resident_memory_bytes{pid="7",name="odd \\"name\\"\\\\x",user=""} 4096.0'
+        in text
+    )
+
+
+def test_exporter_coalesces_concurrent_scrapes():
+    """Test scrapes arriving together share a single collection."""
+    adapter = SlowAdapter()
+    exporter = MetricsExporter(adapter, max_age=60)
+    bodies = []
+    
+    threads = [
+        threading.Thread(target=lambda: bodies.append(exporter.exposition())) for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert adapter.metric_reads == 1
+    assert exporter.collections == 1
+    assert len(bodies) == 8
+    assert all(body is bodies[0] for body in bodies)
+
+
+def test_exporter_collects_again_after_max_age():
+    """Test a collection older than max_age is replaced."""
+    now = [100.0]
+    exporter = MetricsExporter(SyntheticSystemAdapter(count=5), max_age=5, clock=lambda: now[0])
+    
+    exporter.exposition()
+    now[0] += 4.9
+    exporter.exposition()
+    assert exporter.collections == 1
+    
+    now[0] += 0.1
+    exporter.exposition()
+    assert exporter.collections == 2
+
+
+def test_exporter_server_serves_metrics():
+    """Test /metrics answers with the OpenMetrics content type."""
+    server = ExporterServer(
+        MetricsExporter(SyntheticSystemAdapter(count=20), top_n=3), port=0
+    ).start()
+    try:
+        host, port = server.address
+        with urllib.request.urlopen(f"http://{host}:{port}/metrics", timeout=5) as response:
+            body = response.read().decode("utf-8")
+            assert response.headers["Content-Type"] == CONTENT_TYPE
+        
+        assert body.count("mico_process_resident_memory_bytes{") == 3
+        assert body.endswith("# EOF\n")
+    finally:
+        server.stop()
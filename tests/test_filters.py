@@ -0,0 +1,159 @@
+"""Tests for compiled process filters."""
+
+import pytest
+from mico.domain.entities import MemoryInfo, Process, ProcessSnapshot
+from mico.domain.filters import compile_filter, parse_size
+from mico.domain.process_table import ProcessTable
+from mico.domain.use_cases.filter_processes import FilterProcessesUseCase
+
+
+MB = 1024 * 1024
+
+PROCESSES = [
+    Process(
+        pid=1,
+        name="launchd",
+        memory=MemoryInfo(rss_bytes=20 * MB, vms_bytes=400 * MB),
+        username="root",
+    ),
+    Process(
+        pid=120,
+        name="nginx",
+        memory=MemoryInfo(rss_bytes=600 * MB, vms_bytes=900 * MB),
+        username="www",
+    ),
+    Process(
+        pid=121,
+        name="nginx: worker",
+        memory=MemoryInfo(rss_bytes=300 * MB, vms_bytes=900 * MB),
+        username="www",
+    ),
+    Process(
+        pid=250,
+        name="Google Chrome",
+        memory=MemoryInfo(rss_bytes=800 * MB, vms_bytes=5000 * MB),
+        username="alice",
+    ),
+    Process(
+        pid=251,
+        name="Google Chrome Helper",
+        memory=MemoryInfo(rss_bytes=90 * MB, vms_bytes=3000 * MB),
+        username="alice",
+    ),
+    Process(pid=4242, name="python3", memory=MemoryInfo(rss_bytes=50 * MB, vms_bytes=100 * MB)),
+]
+
+
+def _pids(filter_text, processes=PROCESSES):
+    return [p.pid for p in compile_filter(filter_text).apply(processes)]
+
+
+def test_parse_size():
+    """Test byte sizes with binary unit suffixes."""
+    assert parse_size("4096") == 4096
+    assert parse_size("512K") == 512 * 1024
+    assert parse_size("500M") == 500 * MB
+    assert parse_size("1.5G") == int(1.5 * 1024 ** 3)
+    assert parse_size("2GiB") == 2 * 1024 ** 3
+    
+    with pytest.raises(ValueError):
+        parse_size("lots")
+
+
+@pytest.mark.parametrize("filter_text, expected", [
+    ("", [1, 120, 121, 250, 251, 4242]),
+    ("chrome", [250, 251]),
+    ("CHROME", [250, 251]),
+    ("chrome helper", [251]),
+    ("4242", [4242]),
+    ("name:nginx", [120, 121]),
+    ("name=nginx", [120]),
+    ("name:google*helper", [251]),
+    ("name~^nginx", [120, 121]),
+    ("name~worker$", [121]),
+    ("user:www", [120, 121]),
+    ("user:www|alice", [120, 121, 250, 251]),
+    ("user:a*", [250, 251]),
+    ("pid:120-250", [120, 121, 250]),
+    ("pid=1|4242", [1, 4242]),
+    ("pid>=251", [251, 4242]),
+    ("rss>500M", [120, 250]),
+    ("rss<=50M", [1, 4242]),
+    ("rss:100M-700M", [120, 121]),
+    ("vms>1G", [250, 251]),
+    ("user:www rss>500M name~^nginx", [120]),
+    ("chrome|python pid<1000", [250, 251]),
+    ("chrome|nginx", [120, 121, 250, 251]),
+    ("1|4242", [1, 4242]),
+])
+def test_filter_expressions(filter_text, expected):
+    """Test filter expressions select the expected processes."""
+    assert _pids(filter_text) == expected
+
+
+def test_bare_text_is_a_substring_even_with_glob_characters():
+    """Test plain text keeps substring matching; globs need a name: term."""
+    processes = [
+        Process(pid=7, name="kworker/0:1H-events", memory=MemoryInfo(0, 0)),
+        Process(pid=8, name="foo[1]", memory=MemoryInfo(0, 0)),
+        Process(pid=9, name="foo1", memory=MemoryInfo(0, 0)),
+    ]
+    
+    assert _pids("kworker/0:1H-*", processes) == []
+    assert _pids("kworker/0:1H-", processes) == [7]
+    assert _pids("foo[1]", processes) == [8]
+    assert _pids("name:foo[1]", processes) == [9]
+    assert _pids("name:kworker*", processes) == [7]
+
+
+@pytest.mark.parametrize("filter_text", [
+    "name~[", "rss>lots", "pid:a-b", "user>root", "pid~1", "user:|", "name>foo", "name<=foo",
+])
+def test_invalid_filter_expressions(filter_text):
+    """Test invalid expressions raise ValueError when compiled."""
+    with pytest.raises(ValueError):
+        compile_filter(filter_text)
+
+
+def test_compiled_filters_are_cached():
+    """Test the same expression is compiled once, so per-process checks do not reparse it."""
+    assert compile_filter("user:www rss>500M") is compile_filter("user:www rss>500M")
+    assert PROCESSES[0].matches_filter("pid:1") == (PROCESSES[0].pid == 1)
+
+
+def test_exact_pid_filter_uses_snapshot_index():
+    """Test exact-PID filters look processes up instead of scanning."""
+    class CountingSnapshot(ProcessSnapshot):
+        iterations = 0
+        
+        def __iter__(self):
+            CountingSnapshot.iterations += 1
+            return super().__iter__()
+    
+    snapshot = CountingSnapshot(timestamp=0.0, processes=tuple(PROCESSES))
+    process_filter = compile_filter("pid:4242|1 user:root")
+    
+    assert process_filter.pids == frozenset({1, 4242})
+    assert [p.pid for p in process_filter.apply(snapshot)] == [1]
+    assert CountingSnapshot.iterations == 0
+
+
+def test_snapshot_precomputes_folded_names():
+    """Test snapshots casefold each name once and index PIDs."""
+    snapshot = ProcessSnapshot(timestamp=0.0, processes=tuple(PROCESSES))
+    
+    assert snapshot.folded_names[3] == "google chrome"
+    assert snapshot.pid_index[4242] == 5
+    assert _pids("user:alice chrome", snapshot) == [250, 251]
+
+
+@pytest.mark.parametrize("filter_text", [
+    "", "chrome", "4242", "user:www rss>500M name~^nginx", "pid:120-250", "user:a*|root", "vms<1G",
+])
+def test_table_filter_matches_object_filter(filter_text):
+    """Test the column-wise table path agrees with the object path."""
+    table = ProcessTable.from_processes(PROCESSES)
+    
+    rows = FilterProcessesUseCase.execute_table(table, filter_text)
+    
+    assert table.processes(rows) == FilterProcessesUseCase.execute(PROCESSES, filter_text)
@@ -0,0 +1,165 @@
+"""Tests for fleet-wide aggregation of host dumps."""
+
+import gzip
+import json
+import random
+import pytest
+from mico.adapters.fleet import (
+    DumpError, dump_document, iter_dump_paths, read_dump, summarize_dump, summarize_fleet,
+    write_dump
+)
+from mico.adapters.synthetic import SyntheticSystemAdapter
+from mico.domain.fleet import FleetReport, HostHealth, rank_processes
+
+
+def _host(name, score, status="healthy"):
+    return HostHealth(name, 0.0, score, status, 10.0, 20.0, 30.0, 100)
+
+
+def _write_fleet(directory, hosts=12, count=200):
+    for index in range(hosts):
+        adapter = SyntheticSystemAdapter(count=count, seed=index)
+        suffix = ".json.gz" if index % 2 else ".json"
+        write_dump(
+            str(directory / f"host-{index:02d}{suffix}"),
+            dump_document(
+                adapter.get_process_snapshot(), adapter.get_system_metrics(), f"host-{index:02d}"
+            ),
+        )
+
+
+def test_fleet_report_merges_to_the_same_ranking_as_a_full_sort():
+    """Test the batched k-way merges keep exactly the top hosts and processes."""
+    rng = random.Random(1)
+    report = FleetReport(top_hosts=5, top_processes=7, batch_size=3)
+    all_hosts, all_processes = [], []
+    for index in range(40):
+        host = _host(
+            f"h{index:02d}", round(rng.uniform(0, 100), 1), rng.choice(["healthy", "critical"])
+        )
+        adapter = SyntheticSystemAdapter(count=30, seed=index)
+        processes = rank_processes(host.host, adapter.get_all_processes(), "mem", 7)
+        report.add(host, processes)
+        all_hosts.append(host)
+        all_processes.extend(rank_processes(host.host, adapter.get_all_processes(), "mem", 30))
+        # Never more than a batch beyond the kept rankings
+        assert len(report._hosts) <= 5 and len(report._processes) <= 7
+    
+    assert report.hosts == sorted(all_hosts, key=lambda host: (host.overall_score, host.host))[:5]
+    expected = sorted(
+        all_processes, key=lambda process: (-process.rss_bytes, process.host, process.pid)
+    )[:7]
+    assert report.processes == expected
+    assert report.summary()["hosts"] == 40
+    assert report.counts["critical"] + report.counts["healthy"] == 40
+
+
+def test_fleet_report_filters_hosts_by_status():
+    """Test --status keeps only matching hosts but still counts every host."""
+    report = FleetReport(statuses=["critical"])
+    report.add(_host("a", 95.0))
+    report.add(_host("b", 40.0, "critical"))
+    report.add(_host("c", 70.0, "warning"))
+    
+    assert [host.host for host in report.hosts] == ["b"]
+    assert report.summary() == {
+        "hosts": 3,
+        "critical": 1,
+        "warning": 1,
+        "healthy": 1,
+        "unreadable": 0,
+    }
+
+
+def test_rank_processes_rejects_unknown_sort():
+    """Test an unknown sort raises ValueError."""
+    with pytest.raises(ValueError):
+        rank_processes("h", [], sort="name")
+
+
+def test_dump_round_trip(tmp_path):
+    """Test a dump reads back to the same snapshot and metrics, compressed or not."""
+    adapter = SyntheticSystemAdapter(count=50, seed=3)
+    snapshot, metrics = adapter.get_process_snapshot(), adapter.get_system_metrics()
+    for name in ("host.json", "host.json.gz"):
+        path = str(tmp_path / name)
+        write_dump(path, dump_document(snapshot, metrics, "web-01"))
+        
+        assert read_dump(path) == ("web-01", snapshot, metrics)
+    
+    with gzip.open(str(tmp_path / "host.json.gz"), "rb") as f:
+        assert f.read(1) == b"{"
+
+
+def test_read_dump_rejects_other_files(tmp_path):
+    """Test files that are not dumps raise DumpError."""
+    for name, content in (
+        ("garbage.json", "not json"),
+        ("other.json", '{"hello": 1}'),
+        ("newer.json", '{"mico_dump": 99}'),
+        ("partial.json", '{"mico_dump": 1, "host": "x"}'),
+    ):
+        path = tmp_path / name
+        path.write_text(content)
+        with pytest.raises(DumpError):
+            read_dump(str(path))
+
+
+def test_summarize_dump_scores_the_host(tmp_path):
+    """Test a worker summary carries the host's health and its top processes only."""
+    _write_fleet(tmp_path, hosts=1)
+    path = str(tmp_path / "host-00.json")
+    
+    source, health, processes = summarize_dump(path, "mem", 5)
+    
+    assert source == path
+    assert health.host == "host-00"
+    assert health.process_count == 200
+    assert health.status in ("healthy", "warning", "critical")
+    assert len(processes) == 5
+    assert [p.rss_bytes for p in processes] == sorted(
+        (p.rss_bytes for p in processes), reverse=True
+    )
+
+
+def test_summarize_fleet_in_a_process_pool_matches_serial(tmp_path):
+    """Test parallel parsing gives the same report as parsing in-process, skipping bad dumps."""
+    _write_fleet(tmp_path)
+    (tmp_path / "broken.json").write_text("{")
+    (tmp_path / "notes.txt").write_text("ignored")
+    paths = list(iter_dump_paths(str(tmp_path)))
+    
+    serial = summarize_fleet(paths, top_processes=8, top_hosts=4, workers=1)
+    parallel = summarize_fleet(paths, top_processes=8, top_hosts=4, workers=2)
+    
+    assert len(paths) == 13
+    assert parallel.hosts == serial.hosts
+    assert parallel.processes == serial.processes
+    assert parallel.errors == serial.errors
+    assert [source for source, _ in serial.errors] == [str(tmp_path / "broken.json")]
+    assert serial.summary()["hosts"] == 12
+    assert len(serial.hosts) == 4 and len(serial.processes) == 8
+
+
+def test_summarize_fleet_records_malformed_dumps(tmp_path):
+    """Test valid JSON with null fields is ranked as 0 or recorded as unreadable, not raised."""
+    _write_fleet(tmp_path, hosts=2, count=20)
+    null_rss = json.loads((tmp_path / "host-00.json").read_text())
+    for process in null_rss["snapshot"]["processes"]:
+        process["memory"]["rss_bytes"] = None
+        process["memory"]["percent"] = None
+        process["cpu_percent"] = None
+    (tmp_path / "host-00.json").write_text(json.dumps(null_rss))
+    null_cpu = json.loads((tmp_path / "host-00.json").read_text())
+    null_cpu["metrics"]["cpu_percent"] = None
+    (tmp_path / "null-cpu.json").write_text(json.dumps(null_cpu))
+    paths = list(iter_dump_paths(str(tmp_path)))
+    
+    for workers in (1, 2):
+        for sort in ("mem", "cpu"):
+            report = summarize_fleet(paths, sort=sort, top_processes=40, workers=workers)
+            
+            assert report.summary()["hosts"] == 2
+            assert [source for source, _ in report.errors] == [str(tmp_path / "null-cpu.json")]
+            assert "cpu_percent" in report.errors[0][1]
+            assert {p.rss_bytes for p in report.processes if p.host == "host-00"} == {0}
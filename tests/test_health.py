@@ -110,3 +110,111 @@ def test_system_metrics_is_healthy():
     
     assert unhealthy_metrics.is_healthy is False
 
+
+def _metric_grid():
+    """Values covering every ladder branch, the boundaries and awkward floats."""
+    import random
+    
+    rng = random.Random(14)
+    values = [step / 100 for step in range(0, 10001, 7)]
+    values += [50.0, 60.0, 70.0, 75.0, 80.0, 85.0, 90.0, 49.99999999, 100.0, 0.0, 120.0]
+    values += [rng.uniform(0.0, 100.0) for _ in range(3000)]
+    rng.shuffle(values)
+    cpu = values
+    memory = values[1:] + values[:1]
+    disk = values[2:] + values[:2]
+    return cpu, memory, disk
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_execute_batch_matches_scalar_path(use_numpy):
+    """Test execute_batch returns exactly what execute returns per point."""
+    if use_numpy:
+        pytest.importorskip("numpy")
+    cpu, memory, disk = _metric_grid()
+    
+    batch = CalculateSystemHealthUseCase.execute_batch(cpu, memory, disk, use_numpy=use_numpy)
+    
+    for index, (c, m, d) in enumerate(zip(cpu, memory, disk)):
+        expected = CalculateSystemHealthUseCase.execute(
+            SystemMetrics(c, m, d, 16.0, 8.0, 500.0, 250.0)
+        )
+        assert float(batch["overall_score"][index]) == expected["overall_score"]
+        assert CalculateSystemHealthUseCase.STATUSES[batch["status"][index]] == expected["status"]
+        for component, score in expected["scores"].items():
+            assert float(batch["scores"][component][index]) == score
+
+
+def test_execute_batch_rejects_ragged_columns():
+    """Test columns of different lengths are rejected."""
+    with pytest.raises(ValueError):
+        CalculateSystemHealthUseCase.execute_batch([1.0, 2.0], [1.0], [1.0, 2.0])
+
+
+def test_health_warns_per_volume():
+    """Test volume warnings name the mount, and hung volumes are reported."""
+    from mico.domain.entities import DiskUsage
+    
+    metrics = SystemMetrics(
+        cpu_percent=10.0,
+        memory_percent=20.0,
+        disk_percent=92.0,
+        memory_total_gb=16.0,
+        memory_used_gb=3.2,
+        disk_total_gb=100.0,
+        disk_used_gb=92.0,
+        disks=(
+            DiskUsage("/", "apfs", 500.0, 100.0, 20.0),
+            DiskUsage("/data", "ext4", 100.0, 92.0, 92.0),
+            DiskUsage("/mnt/nfs", "nfs", responding=False),
+        )
+    )
+    
+    result = CalculateSystemHealthUseCase.execute(metrics)
+    
+    assert result["scores"]["disk"] == CalculateSystemHealthUseCase._calculate_disk_score(92.0)
+    assert result["warnings"] == [
+        "Disk space critical on /data: 92.0% used",
+        "Volume not responding: /mnt/nfs",
+    ]
+
+
+def test_health_scores_io_pressure():
+    """Test disk and network pressure join the score and name the busiest devices."""
+    from mico.domain.entities import IOMetrics, IORate
+    
+    def metrics(io):
+        return SystemMetrics(30.0, 50.0, 60.0, 16.0, 8.0, 500.0, 300.0, io=io)
+    
+    idle = CalculateSystemHealthUseCase.execute(metrics(None))
+    assert set(idle["scores"]) == {"cpu", "memory", "disk"}
+    
+    io = IOMetrics(
+        interval=1.0,
+        disk=IORate("total", busy_percent=97.0),
+        network=IORate("total", busy_percent=75.0),
+        disks=(IORate("nvme0n1", busy_percent=97.0), IORate("sda", busy_percent=10.0)),
+        interfaces=(IORate("eth0", busy_percent=75.0),)
+    )
+    result = CalculateSystemHealthUseCase.execute(metrics(io))
+    
+    assert result["scores"]["disk_io"] == CalculateSystemHealthUseCase._calculate_disk_io_score(
+        97.0
+    )
+    assert result["scores"]["network"] == CalculateSystemHealthUseCase._calculate_network_score(
+        75.0
+    )
+    expected = (100.0 * 0.3 + 100.0 * 0.3 + 100.0 * 0.15 + 24.0 * 0.15 + 62.5 * 0.1) / 1.0
+    assert result["overall_score"] == round(expected, 1)
+    assert result["warnings"] == [
+        "Disk I/O saturated on nvme0n1: 97% busy",
+        "Network link busy on eth0: 75% utilised",
+    ]
+    assert result["is_healthy"] is False
+    
+    # Unknown link speed: only the disk component joins, weights renormalised
+    io = IOMetrics(1.0, IORate("total", busy_percent=0.0), IORate("total"))
+    result = CalculateSystemHealthUseCase.execute(metrics(io))
+    assert set(result["scores"]) == {"cpu", "memory", "disk", "disk_io"}
+    assert result["overall_score"] == 100.0
+    assert result["is_healthy"] is True
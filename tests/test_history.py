@@ -0,0 +1,81 @@
+"""Tests for the ring-buffer metrics history."""
+
+import pytest
+from mico.domain.entities import SystemMetrics
+from mico.domain.history import MetricsHistory, percentile
+
+
+def _metrics(cpu, memory=50.0, disk=30.0):
+    return SystemMetrics(
+        cpu_percent=cpu,
+        memory_percent=memory,
+        disk_percent=disk,
+        memory_total_gb=16.0,
+        memory_used_gb=8.0,
+        disk_total_gb=500.0,
+        disk_used_gb=150.0,
+    )
+
+
+def test_history_keeps_only_the_newest_samples():
+    """Test appending past capacity overwrites the oldest samples."""
+    history = MetricsHistory(capacity=3)
+    for second in range(5):
+        history.append(_metrics(cpu=float(second)), timestamp=float(second))
+    
+    assert len(history) == 3
+    assert history.values("cpu") == [2.0, 3.0, 4.0]
+
+
+def test_history_window_queries():
+    """Test min/max/mean/percentile only see samples inside the window."""
+    history = MetricsHistory(capacity=100)
+    for second in range(10):
+        history.append(_metrics(cpu=second * 10.0), timestamp=1000.0 + second)
+    
+    # The last 4 seconds cover timestamps 1005..1009
+    assert history.values("cpu", window=4) == [50.0, 60.0, 70.0, 80.0, 90.0]
+    assert history.min("cpu", window=4) == 50.0
+    assert history.max("cpu", window=4) == 90.0
+    assert history.mean("cpu", window=4) == 70.0
+    assert history.percentile("cpu", 50, window=4) == 70.0
+    assert history.mean("memory") == 50.0
+
+
+def test_history_summary():
+    """Test summary reports every metric and the requested percentiles."""
+    history = MetricsHistory(capacity=10)
+    for second in range(5):
+        history.append(_metrics(cpu=float(second), disk=80.0), timestamp=float(second))
+    
+    summary = history.summary(percentiles=(50, 99.5))
+    
+    assert summary["samples"] == 5
+    assert summary["span"] == 4.0
+    assert set(summary["metrics"]) == {"cpu", "memory", "disk"}
+    assert summary["metrics"]["cpu"] == {
+        "min": 0.0,
+        "max": 4.0,
+        "mean": 2.0,
+        "p50": 2.0,
+        "p99.5": pytest.approx(3.98),
+    }
+    assert summary["metrics"]["disk"]["max"] == 80.0
+
+
+def test_empty_history():
+    """Test queries on an empty history return None."""
+    history = MetricsHistory(capacity=5)
+    
+    assert history.mean("cpu") is None
+    assert history.summary()["samples"] == 0
+    assert history.summary()["metrics"]["cpu"]["p95"] is None
+
+
+def test_percentile_interpolates():
+    """Test percentile interpolates linearly between ranks."""
+    assert percentile([1.0, 2.0, 3.0, 4.0], 0) == 1.0
+    assert percentile([1.0, 2.0, 3.0, 4.0], 100) == 4.0
+    assert percentile([1.0, 2.0, 3.0, 4.0], 50) == 2.5
+    with pytest.raises(ValueError):
+        percentile([1.0], 101)
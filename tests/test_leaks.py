@@ -0,0 +1,54 @@
+"""Tests for per-process RSS leak tracking."""
+
+import random
+import pytest
+from mico.domain.leaks import MB, LeakTracker
+
+
+def test_leak_tracker_fits_growth_incrementally():
+    """Test the running regression matches the slope and fit of the readings."""
+    rng = random.Random(0)
+    tracker = LeakTracker()
+    for minute in range(120):
+        timestamp = 1_700_000_000.0 + minute * 60
+        tracker.update(timestamp, [
+            # 12 MB/hour, with a little noise
+            (100, 1.0, "leaky", int((500 + minute * 0.2 + rng.uniform(-0.05, 0.05)) * MB)),
+            # Flat
+            (200, 1.0, "steady", 300 * MB),
+            # Large swings, no trend
+            (300, 1.0, "bursty", (200 + (400 if minute % 2 else 0)) * MB),
+        ])
+    
+    suspects = tracker.suspects(min_duration=3600, min_r_squared=0.9)
+    
+    assert [suspect.name for suspect in suspects] == ["leaky"]
+    leaky = suspects[0]
+    assert leaky.growth_mb_per_hour == pytest.approx(12.0, rel=0.01)
+    assert leaky.r_squared > 0.99
+    assert leaky.samples == 120
+    assert leaky.duration == 119 * 60
+    assert leaky.rss_mb == pytest.approx(500 + 119 * 0.2, abs=0.1)
+    
+    assert tracker.suspects(min_duration=3600, min_r_squared=0.9, min_growth=20.0) == []
+    assert tracker.suspects(min_duration=4 * 3600) == []
+
+
+def test_leak_tracker_forgets_exited_processes_and_reused_pids():
+    """Test exited processes free their slot and a reused PID starts a new trend."""
+    tracker = LeakTracker()
+    for second in range(10):
+        tracker.update(
+            float(second * 600), [(1, 1.0, "old", (100 + second) * MB), (2, 1.0, "other", MB)]
+        )
+    assert len(tracker) == 2
+    
+    # PID 1 now belongs to a new process; PID 2 exited
+    tracker.update(6000.0, [(1, 2.0, "new", 50 * MB)])
+    
+    assert len(tracker) == 1
+    assert tracker.suspects(min_duration=0) == []
+    
+    tracker.update(6600.0, [(1, 2.0, "new", 50 * MB), (3, 1.0, "third", MB)])
+    assert len(tracker) == 2
+    assert len(tracker.names) == 3  # "third" reused a freed slot
@@ -0,0 +1,148 @@
+"""Tests for the /proc adapter."""
+
+import os
+import sys
+import pytest
+import psutil
+from mico.adapters.procfs import ProcfsSystemAdapter
+from mico.adapters.system import SystemAdapter
+
+
+pytestmark = pytest.mark.skipif(not sys.platform.startswith("linux"), reason="/proc is Linux only")
+
+PAGE = os.sysconf("SC_PAGE_SIZE")
+
+# pid -> (comm, ppid, rss pages, vms pages, uid, cmdline)
+FIXTURE = {
+    1: ("systemd", 0, 3000, 40000, 0, b"/sbin/init\0splash\0"),
+    2: ("kthreadd", 0, 0, 0, 0, b""),
+    42: ("gnome-keyring-d", 1, 1200, 90000, 1000, b"/usr/bin/gnome-keyring-daemon\0--start\0"),
+    77: ("(sd-pam) x", 1, 40, 2000, 1000, b"(sd-pam)\0"),
+    100: ("postgres: check", 1, 5000, 70000, 54321, b"postgres: checkpointer   "),
+    101: ("python3", 42, 9000, 300000, 1000, b"python3\0-m\0http.server\0"),
+    # A command line much longer than the read buffer, like a JVM classpath
+    102: (
+        "java-service-ru",
+        1,
+        60000,
+        900000,
+        1000,
+        b"/opt/java-service-runner\0-cp\0" + b"lib/a.jar:" * 2000 + b"\0",
+    ),
+}
+
+
+def _stat(pid, comm, ppid):
+    # state ppid pgrp session tty tpgid flags minflt cminflt majflt cmajflt utime stime
+    # ... starttime
+    fields = (
+        ["S", str(ppid)] + ["0"] * 9 + [str(pid * 10), str(pid * 3)] + ["0"] * 6 + [str(1000 + pid)]
+    )
+    fields += ["0"] * 30
+    return f"{pid} ({comm}) {' '.join(fields)}\n"
+
+
+@pytest.fixture
+def proc_tree(tmp_path, monkeypatch):
+    """A /proc tree with a few processes, used by both adapters."""
+    (tmp_path / "stat").write_text("cpu  1 2 3 4 5 6 7 8 9 10\nbtime 1700000000\n")
+    (tmp_path / "meminfo").write_text(
+        "MemTotal:       16384000 kB\nMemFree:         8192000 kB\nMemAvailable:   12000000 kB\n"
+        "Buffers:          10000 kB\nCached:          500000 kB\nShmem:             1000 kB\n"
+        "SReclaimable:     10000 kB\nActive:          100000 kB\nInactive:        100000 kB\n"
+    )
+    for pid, (comm, ppid, rss, vms, uid, cmdline) in FIXTURE.items():
+        directory = tmp_path / str(pid)
+        directory.mkdir()
+        (directory / "stat").write_text(_stat(pid, comm, ppid))
+        (directory / "statm").write_text(f"{vms} {rss} 0 0 0 0 0\n")
+        (directory / "status").write_text(
+            f"Name:\t{comm}\nUmask:\t0022\nState:\tS (sleeping)\nTgid:\t{pid}\nPid:\t{pid}\n"
+            f"PPid:\t{ppid}\nUid:\t{uid}\t{uid + 1}\t{uid}\t{uid}\nGid:\t0\t0\t0\t0\n"
+        )
+        (directory / "cmdline").write_bytes(cmdline)
+    (tmp_path / "self").mkdir()
+    (tmp_path / "self" / "statm").write_text("1 1 0 0 0 0 0\n")
+    (tmp_path / "not-a-pid").mkdir()
+    
+    monkeypatch.setattr(psutil, "PROCFS_PATH", str(tmp_path))
+    # process_iter caches Process objects between calls; keep the real
+    # host's and the fixture's apart
+    clear_cache = getattr(psutil.process_iter, "cache_clear", lambda: None)
+    clear_cache()
+    yield str(tmp_path)
+    clear_cache()
+
+
+def test_procfs_adapter_parses_fixture_tree(proc_tree):
+    """Test fields are parsed from stat, statm, status and cmdline."""
+    # Exited between the listing and the reads
+    os.mkdir(os.path.join(proc_tree, "555"))
+    with open(os.path.join(proc_tree, "555", "stat"), "w") as f:
+        f.write(_stat(555, "gone", 1))
+    adapter = ProcfsSystemAdapter(procfs_path=proc_tree)
+    assert ProcfsSystemAdapter.available(proc_tree)
+    
+    processes = {process.pid: process for process in adapter.get_all_processes()}
+    
+    assert sorted(processes) == [1, 2, 42, 77, 100, 101, 102]
+    assert processes[42].name == "gnome-keyring-daemon"
+    assert processes[102].name == "java-service-runner"
+    assert processes[77].name == "(sd-pam) x"
+    assert processes[100].name == "postgres: check"
+    assert processes[101].ppid == 42
+    assert processes[1].memory.rss_bytes == 3000 * PAGE
+    assert processes[1].memory.vms_bytes == 40000 * PAGE
+    assert processes[2].memory.rss_bytes == 0
+    assert processes[1].username == "root"
+    
+    rss = {pid: rss for pid, create_time, name, rss in adapter.iter_rss()}
+    assert rss[101] == 9000 * PAGE
+
+
+def test_procfs_adapter_matches_system_adapter(proc_tree):
+    """Test every row matches what SystemAdapter reads through psutil."""
+    if not hasattr(psutil.process_iter, "cache_clear"):
+        pytest.skip("psutil < 6 cannot reset its process cache")
+    procfs = ProcfsSystemAdapter(procfs_path=proc_tree, process_cpu=True)
+    system = SystemAdapter(process_cpu=True)
+    
+    assert procfs.get_all_processes() == system.get_all_processes()
+    assert list(procfs.get_process_table()) == list(system.get_process_table())
+    
+    create_times = {pid: create_time for pid, create_time, _, _ in procfs.iter_rss()}
+    assert create_times[101] == psutil.Process(101).create_time()
+
+
+def test_procfs_adapter_matches_live_system():
+    """Test the live /proc agrees with psutil on the fields that do not change."""
+    if not ProcfsSystemAdapter.available():
+        pytest.skip("no /proc")
+    
+    def stable(processes):
+        return {p.pid: (p.name, p.ppid, p.username, p.memory.vms_bytes) for p in processes}
+    
+    system = stable(SystemAdapter().get_all_processes())
+    procfs = stable(ProcfsSystemAdapter().get_all_processes())
+    common = system.keys() & procfs.keys()
+    
+    assert common
+    assert len(common) >= 0.9 * len(system)
+    changed = [pid for pid in common if system[pid] != procfs[pid]]
+    assert len(changed) <= 2  # the test process itself may allocate in between
+
+
+def test_default_adapter_prefers_procfs(monkeypatch):
+    """Test default_adapter picks /proc when it is there and psutil otherwise."""
+    from mico.adapters.system import default_adapter
+    
+    monkeypatch.setattr(
+        ProcfsSystemAdapter, "available", staticmethod(lambda procfs_path=None: True)
+    )
+    assert isinstance(default_adapter(usernames=False), ProcfsSystemAdapter)
+    
+    monkeypatch.setattr(
+        ProcfsSystemAdapter, "available", staticmethod(lambda procfs_path=None: False)
+    )
+    adapter = default_adapter()
+    assert type(adapter) is SystemAdapter
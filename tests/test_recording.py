@@ -0,0 +1,140 @@
+"""Tests for binary recordings and the replay adapter."""
+
+import dataclasses
+import pytest
+from click.testing import CliRunner
+from mico.adapters.recording import Recorder, Recording, RecordingError, ReplayAdapter
+from mico.adapters.synthetic import SyntheticSystemAdapter
+from mico.cli import cli
+
+
+def _record(path, adapter, ticks=3):
+    snapshot = adapter.get_process_snapshot()
+    with Recorder(str(path)) as recorder:
+        for tick in range(ticks):
+            recorder.record(
+                dataclasses.replace(snapshot, timestamp=1700000000.0 + tick * 10),
+                adapter.get_system_info(),
+                adapter.get_system_metrics()
+            )
+    return snapshot
+
+
+def test_recording_round_trips_ticks(tmp_path):
+    """Test every recorded tick replays as the same domain objects."""
+    adapter = SyntheticSystemAdapter(count=200, seed=3)
+    snapshot = _record(tmp_path / "host.mrec", adapter)
+    
+    with Recording(str(tmp_path / "host.mrec")) as recording:
+        assert len(recording) == 3
+        assert recording.timestamps == [1700000000.0, 1700000010.0, 1700000020.0]
+        
+        replay = ReplayAdapter(recording, 1)
+        assert replay.get_process_snapshot().processes == snapshot.processes
+        assert replay.get_process_snapshot().memory_total_bytes == snapshot.memory_total_bytes
+        assert replay.get_system_info() == adapter.get_system_info()
+        assert replay.get_system_metrics() == adapter.get_system_metrics()
+        assert list(replay.get_process_table()) == list(snapshot.processes)
+        # Each name and user is stored once for the whole file
+        assert len(recording.strings) == len(
+            {p.name for p in snapshot} | {p.username for p in snapshot if p.username}
+        )
+
+
+def test_recording_index_at(tmp_path):
+    """Test index_at picks the last tick at or before a timestamp."""
+    _record(tmp_path / "host.mrec", SyntheticSystemAdapter(count=5))
+    
+    with Recording(str(tmp_path / "host.mrec")) as recording:
+        assert recording.index_at(1700000015.0) == 1
+        assert recording.index_at(1700000020.0) == 2
+        with pytest.raises(IndexError):
+            recording.index_at(1600000000.0)
+
+
+def test_recording_ignores_truncated_tick(tmp_path):
+    """Test a tick cut short by an interrupted recorder is skipped."""
+    path = tmp_path / "host.mrec"
+    _record(path, SyntheticSystemAdapter(count=50))
+    path.write_bytes(path.read_bytes()[:-100])
+    
+    with Recording(str(path)) as recording:
+        assert len(recording) == 2
+
+
+def test_recording_rejects_other_files(tmp_path):
+    """Test opening a file that is not a recording fails clearly."""
+    path = tmp_path / "notes.txt"
+    path.write_text("hello, world")
+    
+    with pytest.raises(RecordingError):
+        Recording(str(path))
+
+
+def test_cli_record_and_replay(tmp_path):
+    """Test mico record writes a file that top and health can replay."""
+    path = str(tmp_path / "host.mrec")
+    runner = CliRunner()
+    adapter = SyntheticSystemAdapter(count=100, seed=1)
+    
+    result = runner.invoke(
+        cli, ["record", path, "--interval", "0", "--count", "2"], obj={"adapter": adapter}
+    )
+    assert result.exit_code == 0
+    assert "Recorded 2 ticks" in result.output
+    
+    result = runner.invoke(cli, ["replay", path])
+    assert result.exit_code == 0
+    assert "Ticks:      2" in result.output
+    
+    result = runner.invoke(cli, ["replay", "--tick", "0", path, "top", "--top", "3"])
+    assert result.exit_code == 0
+    heaviest = max(adapter.iter_processes(), key=lambda p: p.memory.rss_bytes)
+    assert str(heaviest.pid) in result.output
+    
+    result = runner.invoke(cli, ["replay", "--at", "0", path, "health"])
+    assert result.exit_code == 0
+    assert "Overall Health" in result.output
+    
+    result = runner.invoke(cli, ["replay", "--tick", "5", path, "memory"])
+    assert result.exit_code == 2
+    
+    # Live sampling options would report the current host, not the recording
+    for options in (
+        ["--accurate"],
+        ["--cpu-window", "0.1"],
+        ["--mount", "/"],
+        ["--disk-timeout", "1"],
+    ):
+        result = runner.invoke(cli, ["replay", path, "health"] + options)
+        assert result.exit_code == 2
+        assert "replayed recording" in result.output
+    
+    result = runner.invoke(cli, ["replay", path, "top", "--accurate"])
+    assert result.exit_code == 2
+    assert "--accurate" in result.output
+
+
+def test_recording_reads_version_2_files(tmp_path):
+    """Test recordings written before CPU was stored still replay."""
+    from mico.adapters import recording as fmt
+    
+    path = tmp_path / "old.mrec"
+    _record(path, SyntheticSystemAdapter(count=3, seed=1), ticks=1)
+    with Recording(str(path)) as current:
+        rows = list(current.iter_rows(0))
+        processes = list(current.iter_processes(0))
+        start, count = current._ticks[0]
+        head = current._map[fmt.HEADER.size:start - fmt.CHUNK.size]
+        tick = current._map[start:start + fmt.TICK.size]
+    
+    old = fmt.ROWS[2]
+    body = tick + b"".join(old.pack(*row[:7]) for row in rows)
+    path.write_bytes(
+        fmt.HEADER.pack(fmt.MAGIC, 2, 0) + head + fmt.CHUNK.pack(fmt.TICK_KIND, len(body)) + body
+    )
+    
+    with Recording(str(path)) as recording:
+        replayed = list(recording.iter_processes(0))
+    assert [p.cpu_percent for p in replayed] == [None] * 3
+    assert replayed == [dataclasses.replace(p, cpu_percent=None) for p in processes]
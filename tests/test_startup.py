@@ -0,0 +1,101 @@
+"""Startup benchmarks for the CLI.
+
+Each scenario runs the CLI in a fresh interpreter under ``python -X importtime``.
+It checks that commands only import what they need, and that mico's own
+import cost stays within a budget. Budgets are expressed relative to the
+import time of click, which every invocation pays, so they hold across
+machines of different speed. Set MICO_STARTUP_BUDGET_SCALE to loosen or
+tighten them.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import mico
+
+
+SCENARIOS = {
+    # args: (budget relative to click, modules that must not be imported)
+    "--version": (
+        0.5,
+        [
+            "psutil",
+            "mico.adapters.system",
+            "mico.adapters.daemon",
+            "mico.domain.use_cases.list_processes",
+            "mico.domain.use_cases.filter_processes",
+            "mico.domain.use_cases.calculate_health",
+        ],
+    ),
+    "--help": (
+        0.5,
+        ["psutil", "mico.adapters.system", "mico.domain.use_cases.list_processes", "mico.commands"],
+    ),
+    "--no-daemon memory": (
+        1.5,
+        [
+            "mico.adapters.daemon",
+            "mico.domain.use_cases.list_processes",
+            "mico.domain.use_cases.filter_processes",
+            "mico.domain.use_cases.calculate_health",
+            "mico.adapters.procfs",
+        ],
+    ),
+    "--no-daemon top": (
+        1.5,
+        [
+            "mico.adapters.daemon",
+            "mico.domain.use_cases.calculate_health",
+            "mico.domain.filters",
+            "mico.domain.process_table",
+            "mico.commands",
+        ],
+    ),
+}
+
+
+def _import_times(args):
+    """Run the CLI under -X importtime and return {module: (cumulative_us, top_level)}."""
+    env = dict(os.environ)
+    src = os.path.dirname(os.path.dirname(mico.__file__))
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src, env.get("PYTHONPATH")]))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c",
+         "import sys; from mico.cli import cli; cli(sys.argv[1:])"] + args.split(),
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    assert result.returncode == 0, result.stderr
+    
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = (int(cumulative), not name[1:].startswith(" "))
+    return modules
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("args", list(SCENARIOS))
+def test_cli_startup_import_cost(args):
+    """Test a command imports only what it needs, within its time budget."""
+    budget, forbidden = SCENARIOS[args]
+    modules = _import_times(args)
+    
+    loaded = sorted(name for name in forbidden if name in modules)
+    assert loaded == [], f"mico {args} imported {loaded}"
+    
+    click_us = modules["click"][0]
+    own_us = modules["mico.cli"][0] - click_us + sum(
+        cumulative for name, (cumulative, top_level) in modules.items()
+        if top_level and name.startswith("mico.") and name != "mico.cli"
+    )
+    scale = float(os.environ.get("MICO_STARTUP_BUDGET_SCALE", "1.0"))
+    
+    print(f"\nmico {args}: {own_us / 1000:.1f} ms own imports, click {click_us / 1000:.1f} ms")
+    assert own_us <= budget * scale * click_us
@@ -1,9 +1,15 @@
 """Tests for use cases."""
 
+import random
+
 import pytest
-from mico.domain.entities import Process, MemoryInfo
+from mico.domain.entities import Process, MemoryInfo, ProcessSnapshot
+from mico.domain.process_table import ProcessTable
 from mico.domain.use_cases.list_processes import ListProcessesUseCase
 from mico.domain.use_cases.filter_processes import FilterProcessesUseCase
+from mico.domain.use_cases.group_processes import (
+    GroupProcessesUseCase, application_name, subtree_heads
+)
 
 
 def test_list_processes_use_case_sort_by_memory():
@@ -102,3 +108,219 @@ def test_filter_processes_use_case_empty_filter():
     
     assert len(result) == 2
 
+
+def test_use_cases_accept_process_snapshot():
+    """Test filter and list use cases accept a ProcessSnapshot directly."""
+    snapshot = ProcessSnapshot(
+        timestamp=1700000000.0,
+        processes=(
+            Process(pid=1, name="Chrome", memory=MemoryInfo(rss_bytes=100)),
+            Process(pid=2, name="Firefox", memory=MemoryInfo(rss_bytes=300)),
+            Process(pid=3, name="Chrome Helper", memory=MemoryInfo(rss_bytes=200)),
+        ),
+    )
+    
+    assert len(FilterProcessesUseCase.execute(snapshot, "")) == 3
+    assert [p.pid for p in FilterProcessesUseCase.execute(snapshot, "chrome")] == [1, 3]
+    assert [p.pid for p in ListProcessesUseCase.execute(snapshot, top_n=2)] == [2, 3]
+
+
+def test_table_fast_paths_match_list_paths():
+    """Test column-wise table filtering and listing match the Process list paths."""
+    names = ["Chrome", "chrome Helper", "Firefox", "python3", "Python"]
+    processes = [
+        Process(
+            pid=pid,
+            name=names[pid % len(names)],
+            memory=MemoryInfo(rss_bytes=(pid * 7919) % 1000, vms_bytes=pid, percent=0.1),
+            username="user",
+        )
+        for pid in range(1, 200)
+    ]
+    table = ProcessTable.from_processes(processes)
+    
+    for filter_text in ["", "chrome", "PYTHON", "42", "042", "fox"]:
+        expected = FilterProcessesUseCase.execute(processes, filter_text)
+        rows = FilterProcessesUseCase.execute_table(table, filter_text)
+        assert table.processes(rows) == expected
+        
+        for sort_by in ["mem", "name", "pid"]:
+            for reverse in [True, False]:
+                assert ListProcessesUseCase.execute_table(
+                    table, sort_by=sort_by, reverse=reverse, top_n=15, rows=rows
+                ) == ListProcessesUseCase.execute(
+                    expected, sort_by=sort_by, reverse=reverse, top_n=15
+                )
+
+
+def _random_processes(rng, count):
+    """Build processes with many duplicate keys to exercise tie ordering."""
+    names = ["chrome", "Chrome", "CHROME", "python", "Python", "zsh", "a", "B"]
+    return [
+        Process(
+            pid=rng.randint(1, count // 2 + 1),
+            name=rng.choice(names),
+            memory=MemoryInfo(rss_bytes=rng.choice([None, 0, 1, 2, 3, rng.randint(0, 10 ** 6)])),
+        )
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.parametrize("seed", range(25))
+def test_list_processes_selection_matches_full_sort(seed):
+    """Property: bounded-heap selection equals a full sort and slice, ties included."""
+    rng = random.Random(seed)
+    processes = _random_processes(rng, rng.randint(0, 300))
+    keys = {
+        "mem": lambda p: p.memory.rss_bytes or 0,
+        "name": lambda p: p.name.lower(),
+        "pid": lambda p: p.pid,
+    }
+    
+    for sort_by, key in keys.items():
+        for reverse in [True, False]:
+            for top_n in [0, 1, 2, 10, len(processes), len(processes) + 3, -1]:
+                expected = sorted(processes, key=key, reverse=reverse)[:top_n]
+                result = ListProcessesUseCase.execute(
+                    iter(processes), sort_by=sort_by, reverse=reverse, top_n=top_n
+                )
+                # Identity check: equal-key processes must come back in the same order
+                assert [id(p) for p in result] == [id(p) for p in expected]
+
+
+def test_streaming_pipeline_never_builds_a_list():
+    """Test a generator flows through the filter stream into the selection."""
+    consumed = []
+    
+    def generate():
+        for pid in range(1, 1001):
+            consumed.append(pid)
+            name = "worker" if pid % 3 else "chrome"
+            yield Process(pid=pid, name=name, memory=MemoryInfo(rss_bytes=pid))
+    
+    matching = FilterProcessesUseCase.stream(generate(), "chrome")
+    assert consumed == []
+    
+    result = ListProcessesUseCase.execute(matching, sort_by="mem", top_n=3)
+    
+    assert [p.pid for p in result] == [999, 996, 993]
+    assert len(consumed) == 1000
+
+
+def _proc(pid, name, rss, ppid, username="root"):
+    return Process(
+        pid=pid,
+        name=name,
+        memory=MemoryInfo(rss_bytes=rss, vms_bytes=rss * 2, percent=1.0),
+        username=username,
+        ppid=ppid,
+    )
+
+
+def test_group_processes_by_tree():
+    """Test subtrees under init aggregate RSS and process counts."""
+    processes = [
+        _proc(1, "launchd", 10, 0),
+        _proc(100, "Google Chrome", 500, 1, "alice"),
+        _proc(101, "Google Chrome Helper (Renderer)", 300, 100, "alice"),
+        _proc(102, "Google Chrome Helper (GPU)", 200, 100, "alice"),
+        _proc(103, "Google Chrome Helper (Renderer)", 300, 101, "alice"),
+        _proc(200, "postgres", 700, 1, "postgres"),
+        _proc(201, "postgres", 100, 200, "postgres"),
+        _proc(300, "orphan", 50, 999),
+    ]
+    
+    groups = GroupProcessesUseCase.execute(processes, group_by="tree", top_n=10)
+    
+    assert [(g.pid, g.name, g.count, g.rss_bytes) for g in groups] == [
+        (100, "Google Chrome", 4, 1300),
+        (200, "postgres", 2, 800),
+        (300, "orphan", 1, 50),
+        (1, "launchd", 1, 10),
+    ]
+    assert groups[0].username == "alice"
+    assert groups[0].vms_bytes == 2600
+    assert groups[0].percent == 4.0
+
+
+def test_group_processes_by_app_and_user():
+    """Test helpers fold into their application, and users aggregate."""
+    processes = [
+        _proc(100, "Google Chrome", 500, 1, "alice"),
+        _proc(101, "Google Chrome Helper (Renderer)", 300, 100, "alice"),
+        _proc(200, "postgres", 700, 1, "postgres"),
+        _proc(300, "ghost", 5, 1, None),
+    ]
+    
+    apps = GroupProcessesUseCase.execute(processes, group_by="app", top_n=1)
+    assert [(g.name, g.count, g.rss_bytes) for g in apps] == [("Google Chrome", 2, 800)]
+    
+    users = GroupProcessesUseCase.execute(processes, group_by="user", sort_by="name", reverse=False)
+    assert [(g.name, g.count) for g in users] == [("alice", 2), ("N/A", 1), ("postgres", 1)]
+    
+    assert application_name("Slack Helper (Renderer)") == "Slack"
+    assert application_name("Code (Plugin)") == "Code"
+    
+    with pytest.raises(ValueError):
+        GroupProcessesUseCase.execute(processes, group_by="host")
+
+
+def test_subtree_heads_survive_ppid_cycles():
+    """Test stale parent links forming a cycle still terminate."""
+    processes = [_proc(10, "a", 1, 12), _proc(11, "b", 1, 10), _proc(12, "c", 1, 11)]
+    
+    heads = subtree_heads(processes)
+    
+    assert len(set(heads)) == 1
+
+
+def test_group_tree_totals_match_population():
+    """Test every process of a synthetic host lands in exactly one subtree."""
+    from mico.adapters.synthetic import SyntheticSystemAdapter
+    
+    snapshot = SyntheticSystemAdapter(count=5000, seed=16).get_process_snapshot()
+    groups = GroupProcessesUseCase.execute(snapshot, group_by="tree", top_n=10 ** 9)
+    
+    assert sum(g.count for g in groups) == len(snapshot)
+    assert sum(g.rss_bytes for g in groups) == sum(p.memory.rss_bytes for p in snapshot)
+
+
+def test_list_processes_accurate_reads_only_candidates():
+    """Test USS ranking matches a full sort while reading a bounded set of processes."""
+    from mico.adapters.synthetic import SyntheticSystemAdapter
+    
+    adapter = SyntheticSystemAdapter(count=2000, seed=17)
+    processes = adapter.get_all_processes()
+    everything = adapter.read_full_memory(processes)
+    adapter.full_memory_reads = 0
+    
+    result = ListProcessesUseCase.execute_accurate(processes, adapter.read_full_memory, top_n=10)
+    
+    expected = sorted(everything, key=lambda p: p.memory.uss_bytes, reverse=True)[:10]
+    assert [p.memory.uss_bytes for p in result] == [p.memory.uss_bytes for p in expected]
+    assert all(p.memory.pss_bytes is not None for p in result)
+    assert adapter.full_memory_reads < len(processes) // 10
+
+
+def test_list_processes_accurate_ranks_unreadable_by_rss():
+    """Test processes whose USS cannot be read rank by their RSS."""
+    processes = [
+        Process(pid=1, name="a", memory=MemoryInfo(rss_bytes=100, vms_bytes=0)),
+        Process(pid=2, name="b", memory=MemoryInfo(rss_bytes=90, vms_bytes=0)),
+        Process(pid=3, name="c", memory=MemoryInfo(rss_bytes=80, vms_bytes=0)),
+    ]
+    
+    def read(batch):
+        return [
+            (
+                p
+                if p.pid == 3
+                else Process(p.pid, p.name, MemoryInfo(rss_bytes=p.memory.rss_bytes, uss_bytes=10))
+            )
+            for p in batch
+        ]
+    
+    result = ListProcessesUseCase.execute_accurate(processes, read, top_n=2)
+    
+    assert [p.pid for p in result] == [3, 1]
+    assert ListProcessesUseCase.execute_accurate(processes, read, top_n=0) == []